@@ -2,6 +2,8 @@
 Databricks Browser Provider for QGIS Browser Panel
 """
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from qgis.PyQt.QtCore import QThread, pyqtSignal, QSettings, QDate, QTime, QDateTime, QVariant
 from qgis.PyQt.QtGui import QIcon
@@ -22,6 +24,29 @@ except ImportError:
 
 from .databricks_dialog import DatabricksQueryDialog
 
+# Rows fetched per batch when streaming table data
+_PAGE_SIZE = 500
+
+# Matches a leading "SRID=4326;" prefix for the stripper's cold path
+_SRID_PREFIX_RE = re.compile(r'^\s*SRID=\d+;\s*', re.IGNORECASE)
+
+# Classifies WKT by prefix without parsing the geometry. Group 1 is the
+# type token, group 2 the optional Z/M dimension suffix.
+_WKT_CLASSIFY_RE = re.compile(
+    r'^\s*(?:SRID=\d+;)?\s*'
+    r'(MULTIPOINT|MULTILINESTRING|MULTIPOLYGON|POINT|LINESTRING|POLYGON)'
+    r'\s*(Z?M?)\s*\(',
+    re.IGNORECASE
+)
+
+# Single and multi variants share a base family because the browser
+# creates Multi* layers and promotes single-part geometries
+_WKT_BASE_TYPES = {
+    'POINT': 'Point', 'MULTIPOINT': 'Point',
+    'LINESTRING': 'LineString', 'MULTILINESTRING': 'LineString',
+    'POLYGON': 'Polygon', 'MULTIPOLYGON': 'Polygon',
+}
+
 
 class DatabricksConnectionItem(QgsDataCollectionItem):
     """Root item for a Databricks connection"""
@@ -51,10 +76,18 @@ class DatabricksConnectionItem(QgsDataCollectionItem):
         try:
             catalogs = self._get_catalogs()
             children = []
-            
+
+            # Prefetch schemas for all catalogs in parallel - the metadata queries
+            # are I/O-bound, so a small worker pool overlaps the round-trips
+            schemas_by_catalog = {}
+            if catalogs:
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    schemas_by_catalog = dict(zip(catalogs, executor.map(self._get_schemas_for, catalogs)))
+
             # Add all catalogs first (these come sorted alphabetically from the query)
             for catalog in catalogs:
-                catalog_item = DatabricksCatalogItem(self, catalog, self.connection_config)
+                catalog_item = DatabricksCatalogItem(self, catalog, self.connection_config,
+                                                     schemas=schemas_by_catalog.get(catalog))
                 children.append(catalog_item)
             
             # Add custom query option at the end (after all catalogs)
@@ -117,7 +150,44 @@ class DatabricksConnectionItem(QgsDataCollectionItem):
                 Qgis.Warning
             )
             return []
-    
+
+    def _get_schemas_for(self, catalog_name):
+        """Get list of schemas for a catalog using information_schema.
+
+        Safe to call from worker threads - each call opens its own connection.
+        """
+        try:
+            connection = sql.connect(
+                server_hostname=self.connection_config['hostname'],
+                http_path=self.connection_config['http_path'],
+                access_token=self.connection_config['access_token']
+            )
+
+            with connection.cursor() as cursor:
+                # Using parameterized query to prevent SQL injection
+                info_query = """
+                    SELECT DISTINCT schema_name
+                    FROM system.information_schema.schemata
+                    WHERE catalog_name = :catalog
+                        AND schema_name IS NOT NULL
+                    ORDER BY schema_name
+                """
+
+                cursor.execute(info_query, {"catalog": catalog_name})
+                results = cursor.fetchall()
+                schemas = [row[0] for row in results if row[0]]
+
+            connection.close()
+            return schemas
+
+        except Exception as e:
+            QgsMessageLog.logMessage(
+                f"Error getting schemas for catalog '{catalog_name}': {str(e)}",
+                "Databricks Browser",
+                Qgis.Warning
+            )
+            return []
+
     def actions(self, parent):
         """Return context menu actions"""
         actions = []
@@ -153,10 +223,12 @@ class DatabricksConnectionItem(QgsDataCollectionItem):
 class DatabricksCatalogItem(QgsDataCollectionItem):
     """Item representing a Databricks catalog"""
     
-    def __init__(self, parent, catalog_name, connection_config):
+    def __init__(self, parent, catalog_name, connection_config, schemas=None):
         super().__init__(parent, catalog_name, parent.path() + "/" + catalog_name)
         self.catalog_name = catalog_name
         self.connection_config = connection_config
+        # Schemas prefetched by the parent connection item (None = not prefetched)
+        self._preloaded_schemas = schemas
         self.setIcon(QgsApplication.getThemeIcon('/mIconDbSchema.svg'))
     
     def capabilities(self):
@@ -186,6 +258,10 @@ class DatabricksCatalogItem(QgsDataCollectionItem):
     
     def _get_schemas(self):
         """Get list of schemas in this catalog using information_schema"""
+        # Serve from the parent's parallel prefetch when available
+        if self._preloaded_schemas is not None:
+            return self._preloaded_schemas
+
         try:
             connection = sql.connect(
                 server_hostname=self.connection_config['hostname'],
@@ -313,7 +389,8 @@ class DatabricksSchemaItem(QgsDataCollectionItem):
                         'table_name': table_name,
                         'geometry_column': None,
                         'geometry_type': None,
-                        'has_geometry': False
+                        'has_geometry': False,
+                        'columns': []
                     }
                 
                 QgsMessageLog.logMessage(
@@ -322,38 +399,47 @@ class DatabricksSchemaItem(QgsDataCollectionItem):
                     Qgis.Info
                 )
                 
-                # Now check for geometry columns using system.information_schema.columns
+                # Now fetch all columns for the schema in one batched query using
+                # system.information_schema.columns. This replaces one DESCRIBE
+                # round-trip per table with a single grid covering the whole schema,
+                # and gives us geometry detection for free.
                 # Using parameterized query to prevent SQL injection
                 if tables:
                     columns_query = """
-                        SELECT table_name, column_name, data_type
-                        FROM system.information_schema.columns 
+                        SELECT table_name, column_name, data_type, comment
+                        FROM system.information_schema.columns
                         WHERE table_catalog = :catalog
                             AND table_schema = :schema
-                            AND table_name IS NOT NULL 
-                            AND data_type IN ('GEOMETRY', 'GEOGRAPHY')
-                        ORDER BY table_name, column_name
+                            AND table_name IS NOT NULL
+                        ORDER BY table_name, ordinal_position
                     """
-                    
+
                     QgsMessageLog.logMessage(
-                        f"Browser: Querying geometry columns for {self.catalog_name}.{self.schema_name}",
+                        f"Browser: Querying columns for {self.catalog_name}.{self.schema_name}",
                         "Databricks Browser",
                         Qgis.Info
                     )
-                    
+
                     cursor.execute(columns_query, {"catalog": self.catalog_name, "schema": self.schema_name})
                     column_results = cursor.fetchall()
-                    
-                    # Update tables with geometry information
+
+                    # Update tables with column and geometry information
                     for row in column_results:
                         table_name = row[0]
                         column_name = row[1]
                         data_type = row[2]
-                        
+                        comment = row[3] if len(row) > 3 else ""
+
                         if table_name in tables:
-                            tables[table_name]['geometry_column'] = column_name
-                            tables[table_name]['geometry_type'] = data_type
-                            tables[table_name]['has_geometry'] = True
+                            tables[table_name]['columns'].append({
+                                'name': column_name,
+                                'type': data_type,
+                                'comment': comment or ""
+                            })
+                            if data_type in ('GEOMETRY', 'GEOGRAPHY') and not tables[table_name]['has_geometry']:
+                                tables[table_name]['geometry_column'] = column_name
+                                tables[table_name]['geometry_type'] = data_type
+                                tables[table_name]['has_geometry'] = True
                     
                     geom_tables = sum(1 for t in tables.values() if t['has_geometry'])
                     QgsMessageLog.logMessage(
@@ -417,41 +503,39 @@ class DatabricksTableItem(QgsDataCollectionItem):
     def createChildren(self):
         """Create children items showing table schema (columns)"""
         children = []
-        
+
         try:
+            # Columns are normally prefetched by the parent schema item in one
+            # batched information_schema query - serve them from memory and only
+            # fall back to DESCRIBE when the prefetch is missing
+            cached_columns = self.table_info.get('columns')
+            if cached_columns:
+                for col in cached_columns:
+                    children.append(self._create_column_item(
+                        col['name'], col['type'], col.get('comment', '')
+                    ))
+                return children
+
             # Get table schema from Databricks
             connection = sql.connect(
                 server_hostname=self.connection_config['hostname'],
                 http_path=self.connection_config['http_path'],
                 access_token=self.connection_config['access_token']
             )
-            
+
             with connection.cursor() as cursor:
                 table_ref = self._get_table_reference()
                 cursor.execute(f"DESCRIBE {table_ref}")
                 schema_info = cursor.fetchall()
-                
+
                 for row in schema_info:
                     col_name = row[0]
                     col_type = row[1]
                     col_comment = row[2] if len(row) > 2 else ""
-                    
-                    # Create column item
-                    display_name = f"{col_name} ({col_type})"
-                    if col_comment:
-                        display_name += f" - {col_comment}"
-                    
-                    # Determine if this is the geometry column
-                    is_geometry = (col_name == self.table_info.get('geometry_column') or 
-                                 col_type.upper() in ['GEOMETRY', 'GEOGRAPHY'])
-                    
-                    column_item = DatabricksColumnItem(
-                        self, display_name, col_name, col_type, is_geometry
-                    )
-                    children.append(column_item)
-            
+                    children.append(self._create_column_item(col_name, col_type, col_comment))
+
             connection.close()
-            
+
         except Exception as e:
             QgsMessageLog.logMessage(
                 f"Error getting table schema: {str(e)}",
@@ -461,9 +545,21 @@ class DatabricksTableItem(QgsDataCollectionItem):
             # Add error item
             error_item = QgsErrorItem(self, f"Error loading schema: {str(e)}", self.path() + "/error")
             children.append(error_item)
-        
+
         return children
-    
+
+    def _create_column_item(self, col_name, col_type, col_comment):
+        """Build a DatabricksColumnItem for a column description"""
+        display_name = f"{col_name} ({col_type})"
+        if col_comment:
+            display_name += f" - {col_comment}"
+
+        # Determine if this is the geometry column
+        is_geometry = (col_name == self.table_info.get('geometry_column') or
+                       col_type.upper() in ['GEOMETRY', 'GEOGRAPHY'])
+
+        return DatabricksColumnItem(self, display_name, col_name, col_type, is_geometry)
+
     def actions(self, parent):
         """Return context menu actions"""
         actions = []
@@ -586,20 +682,32 @@ class DatabricksTableItem(QgsDataCollectionItem):
                     SELECT {attr_sql}, {geometry_sql} as geometry_wkt
                     FROM {table_ref}
                 """
-                
-                # Add LIMIT clause only if max_features > 0
-                if max_features > 0:
-                    data_query += f"\n                    LIMIT {max_features}"
-                
+
                 QgsMessageLog.logMessage(
                     f"Executing query: {data_query}",
                     "Databricks Browser",
                     Qgis.Info
                 )
-                
-                cursor.execute(data_query)
-                rows = cursor.fetchall()
-                
+
+                # Execute once (with the row cap bound as a parameter) and
+                # stream the single result set in batches, preferring the
+                # connector's columnar Arrow path. OFFSET paging would make
+                # the server re-run the query for every page.
+                if max_features > 0:
+                    cursor.execute(
+                        data_query + "\n                    LIMIT :limit",
+                        {"limit": max_features}
+                    )
+                else:
+                    cursor.execute(data_query)
+
+                rows = []
+                while True:
+                    batch = self._fetch_rows_batch(cursor)
+                    if not batch:
+                        break
+                    rows.extend(batch)
+
             connection.close()
             
             # Process rows and detect geometry types
@@ -607,42 +715,24 @@ class DatabricksTableItem(QgsDataCollectionItem):
             has_z = False
 
             for row in rows:
-                try:
-                    # Get WKT geometry (last column)
-                    wkt_geom = row[-1] if row else None
-                    if wkt_geom and wkt_geom != 'NULL':
-                        # Strip SRID prefix if present
-                        clean_wkt = self._strip_srid_from_wkt(str(wkt_geom))
+                # Get WKT geometry (last column); classify by prefix instead
+                # of parsing the whole geometry just to read its type
+                wkt_geom = row[-1] if row else None
+                if wkt_geom and wkt_geom != 'NULL':
+                    wkt_str = str(wkt_geom)
+                    match = _WKT_CLASSIFY_RE.match(wkt_str)
+                    if match:
+                        base_type = _WKT_BASE_TYPES[match.group(1).upper()]
+                        if not has_z and 'Z' in match.group(2).upper():
+                            has_z = True
 
-                        # Detect geometry type from WKT
-                        geom = QgsGeometry.fromWkt(clean_wkt)
-                        if not geom.isEmpty():
-                            geom_type_name = QgsWkbTypes.displayString(geom.wkbType()).upper()
-
-                            # Detect Z dimension
-                            if not has_z and QgsWkbTypes.hasZ(geom.wkbType()):
-                                has_z = True
-
-                            # Group by base geometry type (POINT, LINESTRING, POLYGON)
-                            if 'POINT' in geom_type_name:
-                                base_type = 'Point'
-                            elif 'LINESTRING' in geom_type_name:
-                                base_type = 'LineString'
-                            elif 'POLYGON' in geom_type_name:
-                                base_type = 'Polygon'
-                            else:
-                                base_type = 'Unknown'
-
-                            if base_type not in geometry_types:
-                                geometry_types[base_type] = []
-                            geometry_types[base_type].append(row)
-
-                except Exception as e:
-                    QgsMessageLog.logMessage(
-                        f"Error processing geometry in row: {str(e)}",
-                        "Databricks Browser",
-                        Qgis.Warning
-                    )
+                        # Strip the SRID once here; the layer-creation loop
+                        # reuses the cleaned WKT instead of re-scanning it
+                        if base_type not in geometry_types:
+                            geometry_types[base_type] = []
+                        geometry_types[base_type].append(
+                            (row, self._strip_srid_from_wkt(wkt_str))
+                        )
 
             # Create separate layers for each geometry type
             layers_created = 0
@@ -664,29 +754,57 @@ class DatabricksTableItem(QgsDataCollectionItem):
                 Qgis.Critical
             )
     
+    def _fetch_rows_batch(self, cursor):
+        """Fetch the next batch of rows as a list of tuples.
+
+        Uses fetchmany_arrow when the connector provides it - rows arrive
+        columnar with far less per-value Python object overhead - and falls
+        back to plain fetchmany otherwise.
+        """
+        fetchmany_arrow = getattr(cursor, 'fetchmany_arrow', None)
+        if fetchmany_arrow is not None:
+            try:
+                batch = fetchmany_arrow(_PAGE_SIZE)
+                if batch.num_rows == 0:
+                    return []
+                return list(zip(*[col.to_pylist() for col in batch.columns]))
+            except Exception as arrow_e:
+                QgsMessageLog.logMessage(
+                    f"Arrow fetch failed, falling back to row fetch: {str(arrow_e)}",
+                    "Databricks Browser",
+                    Qgis.Warning
+                )
+        return cursor.fetchmany(_PAGE_SIZE)
+
     def _strip_srid_from_wkt(self, wkt_str):
-        """Strip SRID prefix from WKT string"""
+        """Strip SRID prefix from WKT string.
+
+        Fast paths avoid upper-casing or splitting the whole string - for
+        large polygons that is several redundant full-size allocations.
+        """
         if not isinstance(wkt_str, str):
             return wkt_str
-        
-        wkt_str = wkt_str.strip()
-        
-        if wkt_str.upper().startswith('SRID='):
-            srid_parts = wkt_str.split(';', 1)
-            if len(srid_parts) > 1:
-                return srid_parts[1].strip()
-        
-        return wkt_str
+        if wkt_str[:5] == 'SRID=':
+            semi = wkt_str.find(';')
+            if semi >= 0:
+                return wkt_str[semi + 1:].lstrip()
+            return wkt_str
+        if 'SRID' not in wkt_str[:12].upper():
+            return wkt_str
+        # Cold path: leading whitespace or unusual casing
+        return _SRID_PREFIX_RE.sub('', wkt_str, count=1).strip()
     
     def _create_geometry_layer(self, base_layer_name, geom_type, rows, fields, max_features=1000, has_z=False):
         """Create a memory layer for a specific geometry type.
 
+        ``rows`` is a list of ``(row, clean_wkt)`` pairs from the
+        classification pass, so each WKT string is stripped and parsed once.
         Uses direct provider access (no edit mode) to avoid strict type validation
         issues with NULL/empty datetime values.
         Uses Multi* geometry types to handle both single and multi-part geometries.
         """
         try:
-            from qgis.core import QgsVectorLayer, QgsFeature, QgsGeometry, QgsWkbTypes, QgsProject
+            from qgis.core import QgsVectorLayer, QgsFeature, QgsFeatureSink, QgsGeometry, QgsWkbTypes, QgsProject
 
             # Use Multi* geometry types to accept both single and multi-part geometries
             multi_geom_map = {
@@ -710,22 +828,25 @@ class DatabricksTableItem(QgsDataCollectionItem):
             provider.addAttributes(fields.toList())
             memory_layer.updateFields()
             
-            # Build features list
+            # Build features list. The field container and the per-column
+            # target types are constant for the layer, so hoist them out of
+            # the feature loop instead of re-reading them per attribute.
             features_to_add = []
             layer_fields = memory_layer.fields()
-            
-            for row in rows:
+            field_types = [layer_fields[j].type() for j in range(layer_fields.count())]
+            n_fields = len(field_types)
+
+            for row, clean_wkt in rows:
                 try:
                     feature = QgsFeature(layer_fields)
-                    raw_attrs = list(row[:-1]) if len(row) > 1 else []
-                    
+                    raw_attrs = row[:-1] if len(row) > 1 else ()
+
                     # Process attributes with proper type conversion (consistent with dialog)
                     processed_attrs = []
                     for j, attr_value in enumerate(raw_attrs):
-                        if j < len(layer_fields):
-                            field = layer_fields[j]
-                            field_type = field.type()
-                            
+                        if j < n_fields:
+                            field_type = field_types[j]
+
                             if attr_value is None:
                                 processed_attrs.append(None)
                             elif field_type == QVariant.LongLong:
@@ -753,11 +874,11 @@ class DatabricksTableItem(QgsDataCollectionItem):
                     
                     feature.setAttributes(processed_attrs)
                     
-                    wkt_geom = row[-1] if row else None
-                    if wkt_geom and wkt_geom != 'NULL':
-                        clean_wkt = self._strip_srid_from_wkt(str(wkt_geom))
+                    if clean_wkt:
+                        # Reuse the SRID-stripped WKT from the classification
+                        # pass - the only full parse of the string
                         geom = QgsGeometry.fromWkt(clean_wkt)
-                        
+
                         if not geom.isEmpty():
                             # Convert to multi-part for compatibility with Multi* layer
                             if not geom.isMultipart():
@@ -772,11 +893,12 @@ class DatabricksTableItem(QgsDataCollectionItem):
                         Qgis.Warning
                     )
             
-            # Add features directly to provider (bypasses edit buffer type validation)
+            # Add features directly to provider (bypasses edit buffer type
+            # validation); FastInsert skips per-feature id round-tripping
             if features_to_add:
-                success, added_features = provider.addFeatures(features_to_add)
+                success, _ = provider.addFeatures(features_to_add, QgsFeatureSink.FastInsert)
                 QgsMessageLog.logMessage(
-                    f"addFeatures returned: success={success}, added count={len(added_features) if added_features else 0}",
+                    f"addFeatures returned: success={success} for {len(features_to_add)} features",
                     "Databricks Browser",
                     Qgis.Info
                 )
@@ -1084,29 +1206,38 @@ class DatabricksTableItem(QgsDataCollectionItem):
             )
 
 
+# Single compiled scan over the column type replaces the per-column
+# .upper() + substring cascade when picking a field icon
+_COL_ICON_RE = re.compile(r'INT|BIGINT|DOUBLE|FLOAT|DECIMAL|DATE|TIMESTAMP|BOOL', re.IGNORECASE)
+_ICON_BY_KW = {
+    'INT': '/mIconFieldInteger.svg',
+    'BIGINT': '/mIconFieldInteger.svg',
+    'DOUBLE': '/mIconFieldFloat.svg',
+    'FLOAT': '/mIconFieldFloat.svg',
+    'DECIMAL': '/mIconFieldFloat.svg',
+    'DATE': '/mIconFieldDate.svg',
+    'TIMESTAMP': '/mIconFieldDate.svg',
+    'BOOL': '/mIconFieldBool.svg',
+}
+_DEFAULT_COL_ICON = '/mIconFieldText.svg'  # String and other types
+
+
 class DatabricksColumnItem(QgsDataItem):
     """Item representing a table column"""
-    
+
     def __init__(self, parent, display_name, column_name, column_type, is_geometry):
         super().__init__(QgsDataItem.Field, parent, display_name, parent.path() + "/" + column_name)
         self.column_name = column_name
         self.column_type = column_type
         self.is_geometry = is_geometry
-        
+
         # Set appropriate icon based on column type
         if is_geometry:
             self.setIcon(QgsApplication.getThemeIcon('/mIconGeometryEditVertexTool.svg'))
-        elif 'INT' in column_type.upper() or 'BIGINT' in column_type.upper():
-            self.setIcon(QgsApplication.getThemeIcon('/mIconFieldInteger.svg'))
-        elif 'DOUBLE' in column_type.upper() or 'FLOAT' in column_type.upper() or 'DECIMAL' in column_type.upper():
-            self.setIcon(QgsApplication.getThemeIcon('/mIconFieldFloat.svg'))
-        elif 'DATE' in column_type.upper() or 'TIMESTAMP' in column_type.upper():
-            self.setIcon(QgsApplication.getThemeIcon('/mIconFieldDate.svg'))
-        elif 'BOOL' in column_type.upper():
-            self.setIcon(QgsApplication.getThemeIcon('/mIconFieldBool.svg'))
         else:
-            # String and other types
-            self.setIcon(QgsApplication.getThemeIcon('/mIconFieldText.svg'))
+            m = _COL_ICON_RE.search(column_type)
+            icon_name = _ICON_BY_KW.get(m.group(0).upper() if m else None, _DEFAULT_COL_ICON)
+            self.setIcon(QgsApplication.getThemeIcon(icon_name))
 
 class DatabricksQueryItem(QgsDataItem):
     """Item for executing custom queries"""
@@ -3,39 +3,312 @@ Fixed dialog with proper geometry handling and connection settings persistence
 """
 import os
 import json
-from qgis.PyQt.QtCore import Qt, QThread, pyqtSignal, QSettings
+import re
+from qgis.PyQt.QtCore import (
+    Qt, QThread, pyqtSignal, QSettings, QStandardPaths,
+    QAbstractTableModel, QModelIndex, QTimer
+)
 from qgis.PyQt.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QLabel, QLineEdit, QPushButton, QComboBox, 
-    QTableWidget, QTableWidgetItem, QMessageBox,
+    QLabel, QLineEdit, QPushButton, QComboBox,
+    QTableWidget, QTableWidgetItem, QTableView, QMessageBox,
     QProgressDialog, QHeaderView, QCheckBox,
     QGroupBox, QTextEdit, QPlainTextEdit, QSplitter,
     QTreeWidget, QTreeWidgetItem, QWidget
 )
 from qgis.core import (
     QgsVectorLayer, QgsProject, QgsDataSourceUri,
-    QgsMessageLog, Qgis, QgsFeature, QgsFields,
+    QgsMessageLog, Qgis, QgsFeature, QgsFeatureSink, QgsFields,
     QgsField, QgsGeometry, QgsWkbTypes, QgsMemoryProviderUtils,
-    QgsCoordinateReferenceSystem
+    QgsCoordinateReferenceSystem, QgsPointXY
 )
 from qgis.PyQt.QtCore import QVariant, QDateTime, QDate, QTime
 
-# Check if databricks is available
-try:
-    from databricks import sql
-    DATABRICKS_AVAILABLE = True
-except ImportError:
-    DATABRICKS_AVAILABLE = False
+# databricks-sql-connector drags in pyarrow and thrift (tens of MB of
+# imports); shapely loads GEOS. Neither is needed until the user actually
+# opens the dialog, so both are imported lazily on first use instead of at
+# plugin load - QGIS startup stays fast and the memory cost is only paid
+# when a Databricks operation runs.
+_SQL = None
+_SQL_RESOLVED = False
+_SHAPELY = None
+_SHAPELY_RESOLVED = False
+
+
+def _get_sql():
+    """Import and cache databricks.sql on first use; None if unavailable"""
+    global _SQL, _SQL_RESOLVED
+    if not _SQL_RESOLVED:
+        _SQL_RESOLVED = True
+        try:
+            from databricks import sql as _sql_module
+            _SQL = _sql_module
+        except ImportError:
+            _SQL = None
+    return _SQL
+
+
+def _databricks_available():
+    return _get_sql() is not None
+
+
+def _get_shapely():
+    """Import and cache shapely on first use; None if unavailable"""
+    global _SHAPELY, _SHAPELY_RESOLVED
+    if not _SHAPELY_RESOLVED:
+        _SHAPELY_RESOLVED = True
+        try:
+            import shapely
+            from shapely import wkt  # noqa: F401 - ensure submodule is loaded
+            _SHAPELY = shapely
+        except ImportError:
+            _SHAPELY = None
+    return _SHAPELY
+
 
-try:
-    from shapely import wkt
-    SHAPELY_AVAILABLE = True
-except ImportError:
-    SHAPELY_AVAILABLE = False
+def _shapely_available():
+    return _get_shapely() is not None
 
 import decimal as _decimal
 import datetime as _datetime
+import functools as _functools
+import hashlib as _hashlib
 import json as _json
+import operator as _operator
+import tempfile as _tempfile
+import threading as _threading
+import time as _time
+import urllib.parse as _urllib_parse
+
+# Rows pulled per Arrow batch when streaming query results
+_ARROW_BATCH_SIZE = 10_000
+
+# Upper bound on layer loads running at once; each slot gets its own pooled
+# connection
+_MAX_PARALLEL_LAYER_LOADS = 4
+
+# How long an on-disk database-structure snapshot stays valid
+_STRUCTURE_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+def _structure_cache_path(*key_parts):
+    """Path of the on-disk database-structure cache for one connection.
+
+    The filename embeds a hash of the connection details (and any filters)
+    so different warehouses never share a snapshot; the token itself is
+    never written out.
+    """
+    key = _hashlib.sha256('|'.join(str(p) for p in key_parts).encode()).hexdigest()[:16]
+    cache_dir = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+    return os.path.join(cache_dir, f"databricks_schema_{key}.json")
+
+# Column schemas keyed by table full_name, populated during table discovery
+# so layer loads skip the extra DESCRIBE round-trip. Each entry is a list of
+# (column_name, data_type) tuples in ordinal order.
+_SCHEMA_CACHE = {}
+
+# Mixed-geometry detection results keyed by table full_name - the DISTINCT
+# ST_GEOMETRYTYPE pre-query is deterministic per table, so run it once
+_GEOM_DETECTION_CACHE = {}
+
+# Backtick-quoted SELECT clauses keyed by table full_name (attribute columns
+# plus the ST_ASBINARY geometry expression), built once per table
+_SELECT_CLAUSE_CACHE = {}
+
+# ST_ASWKT-rewritten custom queries keyed by (hostname, http_path, query).
+# The rewrite costs an information_schema round-trip, so re-running the same
+# query reuses the previous result
+_GEOM_CONV_CACHE = {}
+
+
+def _conv_longlong(value):
+    return int(value)
+
+
+def _conv_string(value):
+    return str(value)
+
+
+def _conv_datetime(value):
+    # Convert Python datetime to QDateTime for QGIS compatibility
+    if hasattr(value, 'year'):
+        return QDateTime(
+            QDate(value.year, value.month, value.day),
+            QTime(value.hour, value.minute, value.second,
+                  value.microsecond // 1000)
+        )
+    return value
+
+
+def _timestamp_column_to_qdatetime(col):
+    """Convert an Arrow timestamp column directly to QDateTime objects.
+
+    Casting to int64 epoch values and calling QDateTime.fromMSecsSinceEpoch
+    is one C call per row and skips the intermediate Python datetime objects
+    (plus the QDate/QTime construction chain) that the per-value converter
+    pays. Returns None if the column is not a timestamp type - the caller
+    then falls back to the generic converter.
+
+    Epochs are interpreted as UTC so this path shows the same wall-clock
+    time as _conv_datetime, which builds QDateTimes from the UTC datetime
+    components the driver returns; the default (local) spec would render
+    the same column shifted by the session's UTC offset.
+    """
+    try:
+        import pyarrow as pa
+        if not pa.types.is_timestamp(col.type):
+            return None
+        unit = col.type.unit
+        raw = col.cast(pa.int64()).to_pylist()
+    except Exception:
+        return None
+    if unit == 's':
+        return [QDateTime.fromMSecsSinceEpoch(v * 1000, Qt.UTC) if v is not None else None for v in raw]
+    if unit == 'ms':
+        return [QDateTime.fromMSecsSinceEpoch(v, Qt.UTC) if v is not None else None for v in raw]
+    divisor = 1_000 if unit == 'us' else 1_000_000
+    return [QDateTime.fromMSecsSinceEpoch(v // divisor, Qt.UTC) if v is not None else None for v in raw]
+
+
+# Per-QVariant-type converters applied column-wise to fetched batches.
+# Types without an entry pass through unchanged.
+_TYPE_CONVERTERS = {
+    QVariant.LongLong: _conv_longlong,
+    QVariant.String: _conv_string,
+    QVariant.DateTime: _conv_datetime,
+}
+
+# Column data types that never become layer attributes
+_NON_ATTRIBUTE_TYPES = frozenset({'GEOGRAPHY', 'GEOMETRY', 'BINARY'})
+
+# Databricks base type (parameters stripped, upper-cased) -> QVariant type.
+# Built once at module scope; unknown types fall back to String.
+_DATABRICKS_TO_QVARIANT = {
+    'STRING': QVariant.String,
+    'INT': QVariant.Int,
+    'BIGINT': QVariant.LongLong,
+    'FLOAT': QVariant.Double,
+    'DOUBLE': QVariant.Double,
+    'DECIMAL': QVariant.Double,
+    'BOOLEAN': QVariant.Bool,
+    'DATE': QVariant.Date,
+    'TIMESTAMP': QVariant.DateTime,
+    'TIMESTAMP_NTZ': QVariant.DateTime,
+}
+
+# Multi* WKB types are compatible with their single counterparts and vice
+# versa (Point=1, LineString=2, Polygon=3, MultiPoint=4, MultiLineString=5,
+# MultiPolygon=6)
+_COMPATIBLE_GEOM_PAIRS = frozenset({
+    (4, 1), (5, 2), (6, 3),
+    (1, 4), (2, 5), (3, 6),
+})
+
+
+def _is_compatible_geom_type(feature_type, layer_type):
+    """Check whether a feature's WKB type can live in a layer of the given type"""
+    return feature_type == layer_type or (feature_type, layer_type) in _COMPATIBLE_GEOM_PAIRS
+
+
+# Normalized Databricks geometry-type name (ST_ prefix stripped) to the QGIS
+# memory-layer string and flat WKB type. Single lookup instead of chained
+# substring tests; unknown types fall back to Point.
+_GEOM_TYPE_MAP = {
+    'POINT': ('Point', 1),
+    'MULTIPOINT': ('Point', 1),
+    'LINESTRING': ('LineString', 2),
+    'MULTILINESTRING': ('LineString', 2),
+    'LINE': ('LineString', 2),
+    'POLYGON': ('Polygon', 3),
+    'MULTIPOLYGON': ('Polygon', 3),
+}
+
+# Compiled once: classifying WKT with startswith chains requires an
+# uppercased copy of the whole string per row; a single anchored match
+# reads only the type token
+_SRID_RE = re.compile(r'^\s*SRID=\d+;\s*', re.IGNORECASE)
+_WKT_TYPE_RE = re.compile(
+    r'^\s*(?:SRID=\d+;)?\s*'
+    r'(MULTIPOINT|MULTILINESTRING|MULTIPOLYGON|POINT|LINESTRING|POLYGON)'
+    r'\s*(Z?M?)\s*\(',
+    re.IGNORECASE,
+)
+_WKT_TYPE_NAMES = {
+    'POINT': 'Point',
+    'LINESTRING': 'LineString',
+    'POLYGON': 'Polygon',
+    'MULTIPOINT': 'MultiPoint',
+    'MULTILINESTRING': 'MultiLineString',
+    'MULTIPOLYGON': 'MultiPolygon',
+}
+
+# SELECT-clause rewriting patterns, compiled once instead of per item
+_SELECT_FROM_RE = re.compile(r'SELECT\s+(.*?)\s+FROM', re.IGNORECASE | re.DOTALL)
+_AS_ALIAS_RE = re.compile(r'^(.+?)\s+AS\s+(\S+)\s*$', re.IGNORECASE)
+_SPACE_ALIAS_RE = re.compile(r'^(.+?)\s+(\S+)$')
+# Structural characters for splitting a SELECT list on top-level commas
+_SELECT_SPLIT_RE = re.compile(r'[(),]')
+# Items containing these are expressions, not "column alias" pairs
+_EXPR_CHARS = frozenset('()+-*/')
+
+# Detecting unbounded SELECTs before execution - a LIMIT anywhere in the
+# statement (including subqueries) is taken as a bound; the check only needs
+# to catch the common "SELECT * FROM huge_table" case, not be a SQL parser
+_LIMIT_RE = re.compile(r'\bLIMIT\s+\d+', re.IGNORECASE)
+_UNBOUNDED_QUERY_LIMIT = 10000
+
+# Column names that suggest a geometry column when auto-detecting by name
+_GEOM_CANDIDATES = frozenset({
+    'geometry', 'geom', 'location', 'point', 'polygon',
+    'linestring', 'shape', 'spatial',
+})
+
+
+# Memory-provider field type tokens per QVariant type (URI "field=name:type")
+_QVARIANT_TO_MEMORY_TYPE = {
+    QVariant.Int: 'integer',
+    QVariant.LongLong: 'long',
+    QVariant.Double: 'double',
+    QVariant.Bool: 'boolean',
+    QVariant.Date: 'date',
+    QVariant.DateTime: 'datetime',
+    QVariant.String: 'string',
+}
+
+
+def _memory_layer_def(geom_type, fields):
+    """Build a memory-provider URI declaring CRS and all fields inline.
+
+    One-shot construction skips the addAttributes/updateFields round-trip
+    (and its signal emissions) after the layer is created.
+    """
+    parts = [f"{geom_type}?crs=EPSG:4326"]
+    for field in fields:
+        mem_type = _QVARIANT_TO_MEMORY_TYPE.get(field.type(), 'string')
+        parts.append(f"field={_urllib_parse.quote(field.name())}:{mem_type}")
+    return '&'.join(parts)
+
+
+def _classify_wkt(wkt_str):
+    """Classify a WKT string in one pass.
+
+    Returns (geometry type name, has_z) - e.g. ('MultiPolygon', True) for
+    'SRID=4326;MULTIPOLYGON Z (((...' - or (None, False) when the string is
+    not recognizable WKT.
+    """
+    m = _WKT_TYPE_RE.match(wkt_str)
+    if not m:
+        return None, False
+    return _WKT_TYPE_NAMES[m.group(1).upper()], 'Z' in m.group(2).upper()
+
+
+# Flat WKB type -> shapely get_type_id() values accepted for that layer type
+# (single and Multi* counterparts). Used by the vectorized batch prefilter.
+_SHAPELY_TYPE_IDS_BY_WKB = {
+    1: frozenset({0, 4}),  # Point / MultiPoint
+    2: frozenset({1, 5}),  # LineString / MultiLineString
+    3: frozenset({3, 6}),  # Polygon / MultiPolygon
+}
 
 
 def _coerce_attr(value):
@@ -68,11 +341,136 @@ def _coerce_attr(value):
     return value
 
 
+def _make_attr_getter(attr_indices):
+    """Build a callable gathering the attribute columns of a row as a tuple.
+
+    operator.itemgetter does the multi-index gather in C. The one-index and
+    empty cases are special-cased because itemgetter returns a bare value
+    rather than a tuple for a single index.
+    """
+    if not attr_indices:
+        return lambda _row: ()
+    if len(attr_indices) == 1:
+        idx = attr_indices[0]
+        return lambda row: (row[idx],)
+    return _operator.itemgetter(*attr_indices)
+
+
+def _stream_result_rows(cursor, progress_emit=None):
+    """Drain *cursor* in _ARROW_BATCH_SIZE batches, returning row tuples.
+
+    Prefers fetchmany_arrow - results arrive columnar (Cloud Fetch for
+    large sets) with far less per-value Python overhead than row tuples -
+    and falls back to plain fetchmany on older connectors or Arrow errors.
+    """
+    rows = []
+    fetchmany_arrow = getattr(cursor, 'fetchmany_arrow', None)
+    while True:
+        if fetchmany_arrow is not None:
+            try:
+                batch = fetchmany_arrow(_ARROW_BATCH_SIZE)
+            except Exception as arrow_e:
+                QgsMessageLog.logMessage(
+                    f"Arrow fetch failed, falling back to row fetch: {str(arrow_e)}",
+                    "Query Dialog",
+                    Qgis.Warning
+                )
+                fetchmany_arrow = None
+                continue
+            if batch.num_rows == 0:
+                break
+            rows.extend(zip(*[col.to_pylist() for col in batch.columns]))
+        else:
+            chunk = cursor.fetchmany(_ARROW_BATCH_SIZE)
+            if not chunk:
+                break
+            rows.extend(chunk)
+        if progress_emit is not None:
+            progress_emit(f"Fetched {len(rows)} rows...")
+    return rows
+
+
 # Query dialog classes will be defined in this file to avoid import issues
 QUERY_DIALOG_AVAILABLE = True
 QUERY_DIALOG_IMPORT_ERROR = None
 
 
+# Long-lived connections keyed by (hostname, http_path, access_token).
+# Each sql.connect() pays TCP+TLS handshake plus token auth, which dominates
+# latency for quick operations - reuse one connection per credential set.
+_CONNECTION_POOL = {}
+_CONNECTION_POOL_LOCK = _threading.Lock()
+
+
+def _get_pooled_connection(hostname, http_path, access_token, slot=0):
+    """Return a cached Databricks connection for the credentials.
+
+    Creates and caches the connection on first use; subsequent operations
+    against the same warehouse skip the handshake round-trips entirely.
+    Connections that were closed (e.g. by the server) are rebuilt. ``slot``
+    separates concurrent workers so they never share cursors on one
+    connection.
+    """
+    key = (hostname, http_path, access_token, slot)
+    with _CONNECTION_POOL_LOCK:
+        connection = _CONNECTION_POOL.get(key)
+        if connection is not None and getattr(connection, 'open', True):
+            return connection
+        sql = _get_sql()
+        try:
+            # CloudFetch streams result fragments from object storage in
+            # parallel instead of through the warehouse - a large win for
+            # bulk reads; the user-agent entry identifies the plugin in
+            # warehouse query history
+            connection = sql.connect(
+                server_hostname=hostname,
+                http_path=http_path,
+                access_token=access_token,
+                use_cloud_fetch=True,
+                _user_agent_entry="qgis-databricks-connector"
+            )
+        except TypeError:
+            # Older connector versions without these keyword arguments
+            connection = sql.connect(
+                server_hostname=hostname,
+                http_path=http_path,
+                access_token=access_token
+            )
+        _CONNECTION_POOL[key] = connection
+        return connection
+
+
+def _discard_pooled_connection(connection):
+    """Drop a broken connection from the pool so the next call reconnects"""
+    with _CONNECTION_POOL_LOCK:
+        for key, pooled in list(_CONNECTION_POOL.items()):
+            if pooled is connection:
+                del _CONNECTION_POOL[key]
+                break
+    try:
+        connection.close()
+    except Exception:
+        pass
+
+
+@_functools.lru_cache(maxsize=256)
+def _build_provider_uri(hostname, http_path, access_token, full_name, geom_column):
+    """Build (and cache) a Databricks provider URI.
+
+    The encoded URI is deterministic per connection/table pair, so repeat
+    layer creations skip the urlencode. Arguments include the access token -
+    never log the cache key.
+    """
+    params = {
+        'access_token': access_token,
+        'table': full_name,
+    }
+    if geom_column:
+        params['geom_column'] = geom_column
+    query_string = _urllib_parse.urlencode(params)
+    return f"databricks://{hostname}:443{http_path}?{query_string}"
+
+
 class ConnectionTestThread(QThread):
     """Thread for testing Databricks connection"""
     
@@ -85,26 +483,27 @@ class ConnectionTestThread(QThread):
         self.access_token = access_token
     
     def run(self):
-        if not DATABRICKS_AVAILABLE:
+        if not _databricks_available():
             self.finished.emit(False, "databricks-sql-connector not installed")
             return
             
+        connection = None
         try:
-            connection = sql.connect(
-                server_hostname=self.hostname,
-                http_path=self.http_path,
-                access_token=self.access_token
+            connection = _get_pooled_connection(
+                self.hostname, self.http_path, self.access_token
             )
-            
-            # Test with a simple query
+
+            # Test with a simple query; the connection stays pooled for the
+            # discovery/load operations that usually follow
             with connection.cursor() as cursor:
                 cursor.execute("SELECT 1")
                 cursor.fetchone()
-            
-            connection.close()
+
             self.finished.emit(True, "Connection successful!")
-            
+
         except Exception as e:
+            if connection is not None:
+                _discard_pooled_connection(connection)
             self.finished.emit(False, f"Connection failed: {str(e)}")
 
 
@@ -121,53 +520,73 @@ class TableDiscoveryThread(QThread):
     
     def run(self):
         tables = []
-        if not DATABRICKS_AVAILABLE:
+        if not _databricks_available():
             self.finished.emit(tables)
             return
             
+        connection = None
         try:
-            connection = sql.connect(
-                server_hostname=self.hostname,
-                http_path=self.http_path,
-                access_token=self.access_token
+            connection = _get_pooled_connection(
+                self.hostname, self.http_path, self.access_token
             )
-            
+
             with connection.cursor() as cursor:
-                # Query to find tables with spatial columns
+                # Query all columns of tables that have a spatial column.
+                # Fetching the full schemas here (one round-trip) lets
+                # LayerLoadingThread skip its DESCRIBE query on every load.
                 query = """
-                SELECT 
+                SELECT
                     table_catalog,
                     table_schema,
                     table_name,
                     column_name,
-                    data_type
-                FROM system.information_schema.columns 
-                WHERE data_type IN ('GEOGRAPHY', 'GEOMETRY')
-                ORDER BY table_catalog, table_schema, table_name
+                    data_type,
+                    full_data_type
+                FROM system.information_schema.columns
+                WHERE (table_catalog, table_schema, table_name) IN (
+                    SELECT table_catalog, table_schema, table_name
+                    FROM system.information_schema.columns
+                    WHERE data_type IN ('GEOGRAPHY', 'GEOMETRY')
+                )
+                ORDER BY table_catalog, table_schema, table_name, ordinal_position
                 """
-                
+
                 cursor.execute(query)
                 results = cursor.fetchall()
-                
+
+                schemas = {}
                 for row in results:
+                    full_name = f"{row[0]}.{row[1]}.{row[2]}" if row[0] and row[1] else (f"{row[1]}.{row[2]}" if row[1] else row[2])
+                    # Prefer full_data_type: it carries type parameters,
+                    # including a geometry column's declared subtype
+                    schemas.setdefault(full_name, []).append((row[3], row[5] or row[4]))
+                    if row[4] not in ('GEOGRAPHY', 'GEOMETRY'):
+                        continue
                     tables.append({
                         'catalog': row[0] or '',
                         'schema': row[1] or '',
                         'table': row[2],
                         'geometry_column': row[3],
                         'geometry_type': row[4],
-                        'full_name': f"{row[0]}.{row[1]}.{row[2]}" if row[0] and row[1] else (f"{row[1]}.{row[2]}" if row[1] else row[2])
+                        'full_name': full_name
                     })
-            
-            connection.close()
-            
+
+                # Replace (not merge) cached schemas so re-discovery picks up
+                # dropped or altered columns; the discovery query is
+                # workspace-wide, so entries absent from this run are stale.
+                # Anything evicted mid-load is refetched lazily.
+                _SCHEMA_CACHE.clear()
+                _SCHEMA_CACHE.update(schemas)
+
         except Exception as e:
+            if connection is not None:
+                _discard_pooled_connection(connection)
             QgsMessageLog.logMessage(
                 f"Error discovering tables: {str(e)}",
                 "Databricks Connector",
                 Qgis.Critical
             )
-        
+
         self.finished.emit(tables)
 
 
@@ -177,7 +596,8 @@ class LayerLoadingThread(QThread):
     progress = pyqtSignal(str)  # progress message
     finished = pyqtSignal(bool, str, object)  # success, message, layer_object
     
-    def __init__(self, hostname, http_path, access_token, table_info, layer_name, max_features=1000):
+    def __init__(self, hostname, http_path, access_token, table_info, layer_name, max_features=1000,
+                 debug=False):
         super().__init__()
         self.hostname = hostname
         self.http_path = http_path
@@ -185,6 +605,15 @@ class LayerLoadingThread(QThread):
         self.table_info = table_info
         self.layer_name = layer_name
         self.max_features = max_features
+        # When False (default), per-feature and per-column diagnostics are
+        # skipped entirely - thousands of f-string builds and log emissions
+        # otherwise dominate the load loop. Settable per-thread or globally
+        # via the DATABRICKS_CONNECTOR_DEBUG environment variable.
+        self.debug = debug or os.environ.get("DATABRICKS_CONNECTOR_DEBUG") == "1"
+        # Worker slot for pooled-connection separation under parallel loads
+        self.pool_slot = 0
+        # Resolved from the first geometry value fetched (see _resolve_wkb_decoder)
+        self._wkb_decoder = None
     
     def _escape_identifier(self, identifier):
         """Escape identifier with backticks for Databricks SQL.
@@ -208,120 +637,154 @@ class LayerLoadingThread(QThread):
         return '.'.join(escaped_parts)
     
     def run(self):
-        if not DATABRICKS_AVAILABLE:
+        if not _databricks_available():
             self.finished.emit(False, "databricks-sql-connector not installed", None)
             return
         
+        connection = None
         try:
             self.progress.emit("Connecting to Databricks...")
-            
-            connection = sql.connect(
-                server_hostname=self.hostname,
-                http_path=self.http_path,
-                access_token=self.access_token
+
+            connection = _get_pooled_connection(
+                self.hostname, self.http_path, self.access_token,
+                slot=self.pool_slot
             )
-            
-            # If geometry type is generic, detect actual type from sample data
-            if self.table_info['geometry_type'].upper().startswith('GEOMETRY'):
-                self._detect_mixed_geometry_types(connection)
-            
+
+
             with connection.cursor() as cursor:
+                # If geometry type is generic, detect the actual type on the
+                # same cursor as the schema/data queries below - no separate
+                # cursor open/close round-trip for the pre-query
+                if self.table_info['geometry_type'].upper().startswith('GEOMETRY'):
+                    self._detect_mixed_geometry_types(cursor)
+
                 self.progress.emit("Querying table schema...")
                 
                 # Get table schema - EXCLUDE geometry column from attributes
                 # Use escaped table reference to handle special characters (hyphens, spaces, etc.)
                 table_ref = self._get_escaped_table_ref()
-                cursor.execute(f"DESCRIBE {table_ref}")
-                schema_info = cursor.fetchall()
+                full_name = self.table_info.get('full_name', '')
+
+                # The column list is deterministic per table - reuse the schema
+                # cached during discovery instead of a DESCRIBE round-trip
+                schema_info = _SCHEMA_CACHE.get(full_name)
+                if schema_info is None:
+                    schema_info = self._fetch_schema(cursor, table_ref)
+                    _SCHEMA_CACHE[full_name] = schema_info
                 
                 # Build QGIS fields - EXCLUDE geometry column
                 fields = QgsFields()
                 geometry_column = self.table_info['geometry_column']
                 
-                QgsMessageLog.logMessage(
-                    f"Processing schema for table {table_ref}, geometry column: {geometry_column}",
-                    "Databricks Connector",
-                    Qgis.Info
-                )
-                
-                for row in schema_info:
-                    col_name = row[0]
-                    col_type = row[1].upper()
-
+                if self.debug:
                     QgsMessageLog.logMessage(
-                        f"Column: {col_name}, Type: {col_type}",
+                        f"Processing schema for table {table_ref}, geometry column: {geometry_column}",
                         "Databricks Connector",
                         Qgis.Info
                     )
 
-                    # CRITICAL FIX: Skip geometry column from attributes
-                    # Check both by name and by type (for robustness)
-                    if col_name.lower() != geometry_column.lower() and not col_type.startswith(('GEOGRAPHY', 'GEOMETRY')):
-                        # ADDITIONAL CHECK: Skip columns that contain WKT geometry data
-                        # This is a heuristic - if column name suggests it contains geometry, skip it
-                        if col_name.lower() in ['location', 'geom', 'wkt', 'geometry_text', 'point', 'polygon', 'linestring']:
-                            QgsMessageLog.logMessage(
-                                f"Skipping potential geometry text column: {col_name} ({col_type})",
-                                "Databricks Connector",
-                                Qgis.Info
-                            )
-                        else:
-                            qgs_type = self._map_databricks_type_to_qgs(col_type)
-                            field = QgsField(col_name, qgs_type)
-                            fields.append(field)
+                for col_name, col_type in schema_info:
+                    col_type = col_type.upper()
+                    # Base type without parameters, e.g. DECIMAL(10,2) -> DECIMAL
+                    base_type = col_type.split('(', 1)[0].strip()
+
+                    # Skip the geometry column and any spatial/binary column.
+                    # The data_type from information_schema is authoritative -
+                    # no name-based heuristics needed.
+                    if col_name.lower() == geometry_column.lower() or base_type in _NON_ATTRIBUTE_TYPES:
+                        if self.debug:
                             QgsMessageLog.logMessage(
-                                f"Added attribute field: {col_name} ({qgs_type})",
+                                f"Skipping non-attribute column: {col_name} ({col_type})",
                                 "Databricks Connector",
                                 Qgis.Info
                             )
-                    else:
-                        # This is the geometry column - skip it from attributes
+                        continue
+
+                    qgs_type = _DATABRICKS_TO_QVARIANT.get(base_type, QVariant.String)
+                    fields.append(QgsField(col_name, qgs_type))
+                    if self.debug:
                         QgsMessageLog.logMessage(
-                            f"Skipping geometry column: {col_name} ({col_type})",
+                            f"Added attribute field: {col_name} ({qgs_type})",
                             "Databricks Connector",
                             Qgis.Info
                         )
                 
                 self.progress.emit("Fetching data...")
-                
+
+                # Resolve one converter per attribute column up front so type
+                # dispatch happens column-wise per batch, not per cell
+                converters = [_TYPE_CONVERTERS.get(f.type()) for f in fields]
+
                 # Query data - Get attributes AND geometry separately
                 # CRITICAL: Build query to match exactly the fields we added to the layer
-                # Escape all column names with backticks to handle spaces and special characters
-                attribute_fields = [self._escape_identifier(f.name()) for f in fields]
-
-                # Build query with geometry as WKT - only select fields that are in the layer
+                # Escape all column names with backticks to handle spaces and special characters.
+                # The joined, quoted clause is deterministic per table, so
+                # cache it instead of rebuilding the list on every load.
                 # Note: Table/column identifiers cannot be parameterized in SQL.
                 # Security is ensured via _escape_identifier() which wraps identifiers in backticks.
-                select_clause = attribute_fields.copy()
                 escaped_geom_col = self._escape_identifier(geometry_column)
-                select_clause.append(f"ST_ASWKT({escaped_geom_col}) as geom_wkt")
+                select_sql = _SELECT_CLAUSE_CACHE.get(full_name)
+                if select_sql is None:
+                    select_clause = [self._escape_identifier(f.name()) for f in fields]
+                    # Request WKB rather than WKT - binary is roughly half the bytes
+                    # on the wire and QgsGeometry.fromWkb skips the float re-parse
+                    # that makes fromWkt the bottleneck on large tables
+                    select_clause.append(f"ST_ASBINARY({escaped_geom_col}) as geom_wkb")
+                    select_sql = ', '.join(select_clause)
+                    _SELECT_CLAUSE_CACHE[full_name] = select_sql
 
-                query = f"SELECT {', '.join(select_clause)} FROM {table_ref}"
+                query = f"SELECT {select_sql} FROM {table_ref}"
 
+                # Filter geometry types server-side so discarded rows never
+                # cross the wire; the client-side compatibility check stays
+                # as a safety net only
+                type_filter_sql = self._geometry_type_filter_sql(escaped_geom_col)
+                if type_filter_sql:
+                    query += f" WHERE {type_filter_sql}"
+
+                # Bind LIMIT as a named parameter so the query text stays
+                # identical across loads with different feature caps, letting
+                # the server reuse its cached plan. Identifiers (table/column
+                # names) cannot be parameterized and stay backtick-escaped.
+                query_params = None
                 if self.max_features > 0:
-                    query += f" LIMIT {self.max_features}"
-                
-                QgsMessageLog.logMessage(
-                    f"Query fields: {select_clause}",
-                    "Databricks Connector",
-                    Qgis.Info
-                )
-                
-                QgsMessageLog.logMessage(
-                    f"Executing query: {query}",
-                    "Databricks Connector",
-                    Qgis.Info
-                )
-                
-                cursor.execute(query)
-                rows = cursor.fetchall()
-                
-                QgsMessageLog.logMessage(
-                    f"Retrieved {len(rows)} rows",
-                    "Databricks Connector",
-                    Qgis.Info
+                    query += " LIMIT :max_features"
+                    query_params = {"max_features": self.max_features}
+
+                if self.debug:
+                    QgsMessageLog.logMessage(
+                        f"Query fields: {select_sql}",
+                        "Databricks Connector",
+                        Qgis.Info
+                    )
+                    QgsMessageLog.logMessage(
+                        f"Executing query: {query}",
+                        "Databricks Connector",
+                        Qgis.Info
+                    )
+
+                cursor.execute(query, query_params)
+
+                # Size the driver's internal fetch buffer to match our batch
+                # size (capped at the feature limit) so it never materializes
+                # more rows than one batch consumes
+                cursor.arraysize = (
+                    min(self.max_features, _ARROW_BATCH_SIZE)
+                    if self.max_features > 0 else _ARROW_BATCH_SIZE
                 )
-                
+
+                # Stream Arrow batches so feature construction overlaps the
+                # network fetch and peak memory is bounded by one batch.
+                # The first batch also drives Z-dimension detection below.
+                rows = self._fetch_arrow_batch(cursor, converters)
+
+                if self.debug:
+                    QgsMessageLog.logMessage(
+                        f"Retrieved first batch of {len(rows)} rows",
+                        "Databricks Connector",
+                        Qgis.Info
+                    )
+
                 self.progress.emit("Creating QGIS layer...")
                 
                 # Determine geometry type for layer creation
@@ -332,10 +795,9 @@ class LayerLoadingThread(QThread):
                 # accepts Z geometries (required on QGIS 3.x / older providers)
                 if rows:
                     for sample_row in rows:
-                        sample_wkt = sample_row[-1] if sample_row else None
-                        if sample_wkt and str(sample_wkt).strip():
-                            sample_geom = QgsGeometry.fromWkt(str(sample_wkt))
-                            if not sample_geom.isNull() and QgsWkbTypes.hasZ(sample_geom.wkbType()):
+                        sample_geom = self._parse_wkb(sample_row[-1] if sample_row else None)
+                        if sample_geom is not None:
+                            if QgsWkbTypes.hasZ(sample_geom.wkbType()):
                                 geom_type += 'Z'
                             break
 
@@ -348,18 +810,13 @@ class LayerLoadingThread(QThread):
                     return
 
                 # Log memory layer details for debugging
-                QgsMessageLog.logMessage(
-                    f"Memory layer created: {layer_def}, WKB type: {memory_layer.wkbType()}, "
-                    f"detected WKB: {wkb_geom_type}, provider valid: {memory_layer.dataProvider().isValid()}",
-                    "Databricks Connector",
-                    Qgis.Info
-                )
-                
-                QgsMessageLog.logMessage(
-                    f"Created memory layer: {layer_def}",
-                    "Databricks Connector",
-                    Qgis.Info
-                )
+                if self.debug:
+                    QgsMessageLog.logMessage(
+                        f"Memory layer created: {layer_def}, WKB type: {memory_layer.wkbType()}, "
+                        f"detected WKB: {wkb_geom_type}, provider valid: {memory_layer.dataProvider().isValid()}",
+                        "Databricks Connector",
+                        Qgis.Info
+                    )
                 
                 # Add fields directly to provider (no edit mode - avoids strict type validation)
                 provider = memory_layer.dataProvider()
@@ -372,259 +829,100 @@ class LayerLoadingThread(QThread):
                     )
                 
                 memory_layer.updateFields()
+
+                if self.debug:
+                    QgsMessageLog.logMessage(
+                        f"Added {len(fields)} attribute fields to layer. Add result: {add_result}, "
+                        f"layer field count: {memory_layer.fields().count()}",
+                        "Databricks Connector",
+                        Qgis.Info
+                    )
                 
-                QgsMessageLog.logMessage(
-                    f"Added {len(fields)} attribute fields to layer. Add result: {add_result}, "
-                    f"layer field count: {memory_layer.fields().count()}",
-                    "Databricks Connector",
-                    Qgis.Info
-                )
-                
-                self.progress.emit(f"Loading {len(rows)} features...")
-                
-                # Add features
-                features_to_add = []
-                valid_features = 0
-                
+                self.progress.emit("Loading features...")
+
+                # Aggregate diagnostics across batches - logged once at the end
+                stats = {
+                    'rows': 0,
+                    'valid': 0,
+                    'invalid_geometries': 0,
+                    'skipped_types': 0,
+                    'empty_geometries': 0,
+                    'errors': [],
+                }
+
                 # CRITICAL FIX: Use the layer's fields after they've been added and updated
                 layer_fields = memory_layer.fields()
-                
-                for i, row in enumerate(rows):
-                    try:
-                        # Create feature with incremental ID
-                        feature = QgsFeature(layer_fields, i + 1)
-                        
-                        # Set attributes - should now match fields list exactly (no geometry column)
-                        attrs = list(row[:-1])  # All except last (geometry WKT)
 
-                        # Debug: Log the raw attribute data
-                        QgsMessageLog.logMessage(
-                            f"Feature {i} raw attributes: {attrs}",
-                            "Databricks Connector",
-                            Qgis.Info
-                        )
-                        
-                        # Debug: Log attribute types
-                        attr_types = [type(attr).__name__ for attr in attrs]
-                        QgsMessageLog.logMessage(
-                            f"Feature {i} attribute types: {attr_types}",
-                            "Databricks Connector",
-                            Qgis.Info
-                        )
-
-                        # Since query now matches layer fields exactly, attributes should align
-                        layer_field_names = [f.name() for f in layer_fields]
-                        
-                        # Process attributes with proper type conversion
-                        processed_attrs = []
-                        for j, attr_value in enumerate(attrs):
-                            if j < len(layer_fields):
-                                field = layer_fields[j]
-                                field_type = field.type()
-                                
-                                # Convert attribute to proper type
-                                if attr_value is None:
-                                    processed_attrs.append(None)
-                                elif field_type == QVariant.LongLong:
-                                    processed_attrs.append(int(attr_value) if attr_value is not None else None)
-                                elif field_type == QVariant.String:
-                                    processed_attrs.append(str(attr_value) if attr_value is not None else None)
-                                elif field_type == QVariant.DateTime:
-                                    # CRITICAL FIX: Convert datetime to QDateTime for QGIS compatibility
-                                    if attr_value is not None:
-                                        if hasattr(attr_value, 'year'):  # It's a datetime object
-                                            # Convert Python datetime to QDateTime
-                                            qdate = QDate(attr_value.year, attr_value.month, attr_value.day)
-                                            qtime = QTime(attr_value.hour, attr_value.minute, attr_value.second, attr_value.microsecond // 1000)
-                                            qdt = QDateTime(qdate, qtime)
-                                            processed_attrs.append(qdt)
-                                        else:
-                                            processed_attrs.append(attr_value)  # Already in correct format
-                                    else:
-                                        processed_attrs.append(None)
-                                else:
-                                    processed_attrs.append(attr_value)
-                            else:
-                                break
+                # Track what actually landed in the provider locally -
+                # featureCount() walks the provider on every call
+                added_count = 0
 
-                        # Verify attribute count matches field count
-                        if len(processed_attrs) != len(layer_fields):
-                            QgsMessageLog.logMessage(
-                                f"Attribute count mismatch - expected {len(layer_fields)}, got {len(processed_attrs)}. "
-                                f"Layer fields: {layer_field_names}",
-                                "Databricks Connector",
-                                Qgis.Warning
-                            )
+                while rows:
+                    features_to_add = self._build_features(
+                        rows, stats['rows'], layer_fields, memory_layer, stats
+                    )
+                    stats['rows'] += len(rows)
 
-                        # Debug: Log processed attributes
-                        processed_attr_types = [type(attr).__name__ for attr in processed_attrs]
-                        QgsMessageLog.logMessage(
-                            f"Feature {i} processed attributes: {processed_attrs}",
-                            "Databricks Connector",
-                            Qgis.Info
-                        )
-                        QgsMessageLog.logMessage(
-                            f"Feature {i} processed attribute types: {processed_attr_types}",
-                            "Databricks Connector",
-                            Qgis.Info
+                    # Add each batch directly to provider (bypasses edit buffer
+                    # type validation) while the next batch is in flight
+                    if features_to_add:
+                        success, _ = provider.addFeatures(
+                            features_to_add, QgsFeatureSink.FastInsert
                         )
-                        
-                        feature.setAttributes(processed_attrs)
-                        
-                        # CRITICAL FIX: Set geometry separately from WKT
-                        geom_wkt = row[-1]  # Last column is geometry WKT
-                        if geom_wkt and geom_wkt.strip():
-                            try:
-                                # Parse geometry using QGIS built-in WKT parser
-                                geometry = QgsGeometry.fromWkt(geom_wkt)
-                                
-                                if geometry.isNull() or not geometry.isGeosValid():
-                                    QgsMessageLog.logMessage(
-                                        f"Invalid geometry for feature {i}: {geom_wkt[:100]}...",
-                                        "Databricks Connector",
-                                        Qgis.Warning
-                                    )
-                                    continue
-                                
-                                # Check geometry compatibility with layer
-                                feature_wkb = geometry.wkbType()
-                                layer_wkb = memory_layer.wkbType()
-                                
-                                # Helper to check if geometry types are compatible
-                                # WKB types: Point=1, LineString=2, Polygon=3, MultiPoint=4, MultiLineString=5, MultiPolygon=6
-                                def is_compatible_geom_type(feature_type, layer_type):
-                                    # Same type is always compatible
-                                    if feature_type == layer_type:
-                                        return True
-                                    # Multi* types are compatible with their single counterparts
-                                    compatible_pairs = {
-                                        (4, 1): True,  # MultiPoint -> Point layer
-                                        (5, 2): True,  # MultiLineString -> LineString layer
-                                        (6, 3): True,  # MultiPolygon -> Polygon layer
-                                        (1, 4): True,  # Point -> MultiPoint layer
-                                        (2, 5): True,  # LineString -> MultiLineString layer
-                                        (3, 6): True,  # Polygon -> MultiPolygon layer
-                                    }
-                                    return compatible_pairs.get((feature_type, layer_type), False)
-                                
-                                # Handle geometry filtering based on layer type
-                                target_geom_type = self.table_info.get('target_geometry_type')
-                                
-                                if target_geom_type:
-                                    # This is a specific geometry type layer (LineString or Polygon)
-                                    expected_wkb = 2 if target_geom_type == 'ST_LINESTRING' else 3  # LineString or Polygon
-                                    if not is_compatible_geom_type(feature_wkb, expected_wkb):
-                                        QgsMessageLog.logMessage(
-                                            f"Skipping geometry type {feature_wkb} (expected {expected_wkb}) for feature {i}",
-                                            "Databricks Connector",
-                                            Qgis.Info
-                                        )
-                                        continue
-                                elif self.table_info.get('mixed_geometries', False):
-                                    # For mixed geometries, only add Points/MultiPoints to Point layer
-                                    if not is_compatible_geom_type(feature_wkb, 1):
-                                        QgsMessageLog.logMessage(
-                                            f"Skipping non-Point geometry (type {feature_wkb}) in Point layer for feature {i}",
-                                            "Databricks Connector",
-                                            Qgis.Info
-                                        )
-                                        continue
-                                elif not is_compatible_geom_type(feature_wkb, layer_wkb):
-                                    QgsMessageLog.logMessage(
-                                        f"Geometry type mismatch - Feature: {feature_wkb}, Layer: {layer_wkb}. "
-                                        f"Skipping feature {i}.",
-                                        "Databricks Connector",
-                                        Qgis.Warning
-                                    )
-                                    continue  # Skip incompatible features
-                                
-                                feature.setGeometry(geometry)
-                                
-                                # Validate the complete feature before adding
-                                if feature.isValid() and not feature.geometry().isNull():
-                                    features_to_add.append(feature)
-                                    valid_features += 1
-                                    
-                                    QgsMessageLog.logMessage(
-                                        f"Feature {i} created successfully - ID: {feature.id()}, "
-                                        f"Attrs: {len(feature.attributes())}, Geom: {not feature.geometry().isNull()}",
-                                        "Databricks Connector",
-                                        Qgis.Info
-                                    )
-                                else:
-                                    QgsMessageLog.logMessage(
-                                        f"Feature {i} validation failed",
-                                        "Databricks Connector",
-                                        Qgis.Warning
-                                    )
-                                
-                            except Exception as geom_e:
-                                QgsMessageLog.logMessage(
-                                    f"Error parsing geometry for feature {i}: {str(geom_e)}, WKT: {geom_wkt[:100]}",
-                                    "Databricks Connector",
-                                    Qgis.Warning
-                                )
-                                continue
+                        if success:
+                            added_count += len(features_to_add)
                         else:
                             QgsMessageLog.logMessage(
-                                f"Empty geometry for feature {i}",
+                                "Provider addFeatures reported failure for batch",
                                 "Databricks Connector",
                                 Qgis.Warning
                             )
-                            
-                    except Exception as feat_e:
-                        QgsMessageLog.logMessage(
-                            f"Error processing feature {i}: {str(feat_e)}",
-                            "Databricks Connector",
-                            Qgis.Critical
-                        )
-                        continue
-                
-                # Add features directly to provider (bypasses edit buffer type validation)
-                if features_to_add:
-                    QgsMessageLog.logMessage(
-                        f"Adding {len(features_to_add)} features directly to provider",
-                        "Databricks Connector",
-                        Qgis.Info
-                    )
 
-                    # Add all features at once via provider
-                    success, added_features = provider.addFeatures(features_to_add)
-                    
-                    QgsMessageLog.logMessage(
-                        f"Provider addFeatures result: success={success}, added={len(added_features) if added_features else 0}",
-                        "Databricks Connector",
-                        Qgis.Info
-                    )
-                else:
-                    QgsMessageLog.logMessage(
-                        "No valid features to add to layer",
-                        "Databricks Connector",
-                        Qgis.Warning
-                    )
-                
+                    self.progress.emit(f"Loaded {stats['valid']} features...")
+                    rows = self._fetch_arrow_batch(cursor, converters)
+
+                valid_features = stats['valid']
+
+                # Exactly one extent recomputation, after all batches are in
                 memory_layer.updateExtents()
-                
+
+                # One aggregate summary instead of N per-feature log entries
                 QgsMessageLog.logMessage(
-                    f"Layer extent: {memory_layer.extent().toString()}, "
-                    f"final feature count: {memory_layer.featureCount()}",
+                    f"Processed {stats['rows']} rows: {valid_features} valid features, "
+                    f"{stats['invalid_geometries']} invalid geometries, "
+                    f"{stats['skipped_types']} type mismatches, "
+                    f"{stats['empty_geometries']} empty geometries, "
+                    f"extent: {memory_layer.extent().toString()}",
                     "Databricks Connector",
                     Qgis.Info
                 )
-                
-                if memory_layer.featureCount() == 0:
+                errors = stats['errors']
+                if errors:
+                    summary = "\n".join(errors[:20])
+                    if len(errors) > 20:
+                        summary += f"\n... {len(errors) - 20} more"
+                    QgsMessageLog.logMessage(summary, "Databricks Connector", Qgis.Warning)
+
+                if valid_features == 0:
+                    QgsMessageLog.logMessage(
+                        "No valid features to add to layer",
+                        "Databricks Connector",
+                        Qgis.Warning
+                    )
+
+                if added_count == 0:
                     self.finished.emit(False, "No features were successfully added to the layer", None)
                     return
-                
-            connection.close()
-            
+
             # If we have mixed geometries, we need to create additional layers for LineStrings and Polygons
             if self.table_info.get('mixed_geometries', False):
-                self.finished.emit(True, f"Loaded {memory_layer.featureCount()} Point features. Creating additional layers for LineStrings and Polygons...", memory_layer)
+                self.finished.emit(True, f"Loaded {added_count} Point features. Creating additional layers for LineStrings and Polygons...", memory_layer)
             else:
-                self.finished.emit(True, f"Loaded {memory_layer.featureCount()} features with geometries", memory_layer)
-            
+                self.finished.emit(True, f"Loaded {added_count} features with geometries", memory_layer)
+
         except Exception as e:
+            if connection is not None:
+                _discard_pooled_connection(connection)
             QgsMessageLog.logMessage(
                 f"Error in LayerLoadingThread: {str(e)}",
                 "Databricks Connector",
@@ -634,109 +932,510 @@ class LayerLoadingThread(QThread):
     
     def _map_databricks_type_to_qgs(self, databricks_type: str) -> QVariant.Type:
         """Map Databricks data types to QVariant types"""
-        type_mapping = {
-            'STRING': QVariant.String,
-            'INT': QVariant.Int,
-            'BIGINT': QVariant.LongLong,
-            'FLOAT': QVariant.Double,
-            'DOUBLE': QVariant.Double,
-            'DECIMAL': QVariant.Double,
-            'BOOLEAN': QVariant.Bool,
-            'DATE': QVariant.Date,
-            'TIMESTAMP': QVariant.DateTime,
-            'TIMESTAMP_NTZ': QVariant.DateTime,
-        }
-        return type_mapping.get(databricks_type.upper(), QVariant.String)
-    
-    def _detect_mixed_geometry_types(self, connection):
-        """Detect if table contains mixed geometry types and handle accordingly"""
+        base_type = databricks_type.split('(', 1)[0].strip().upper()
+        return _DATABRICKS_TO_QVARIANT.get(base_type, QVariant.String)
+
+    def _resolve_wkb_decoder(self, sample):
+        """Pick and cache the WKB decoder from the first value seen.
+
+        Databricks emits standard little-endian WKB, but depending on the
+        driver version ST_ASBINARY arrives as raw bytes, a buffer view or a
+        hex-encoded string. The representation is constant within one result
+        set, so resolve it once instead of running an isinstance chain per
+        row. Raw bytes pass through with no copy at all.
+        """
+        if isinstance(sample, bytes):
+            self._wkb_decoder = lambda value: value
+        elif isinstance(sample, (bytearray, memoryview)):
+            self._wkb_decoder = bytes
+        elif isinstance(sample, str):
+            self._wkb_decoder = bytes.fromhex
+        else:
+            self._wkb_decoder = None
+        return self._wkb_decoder
+
+    def _parse_wkb(self, wkb_value):
+        """Parse WKB returned by ST_ASBINARY into a QgsGeometry.
+
+        Returns None for NULL/empty/unparseable values.
+        """
+        if wkb_value is None:
+            return None
+
+        decoder = self._wkb_decoder
+        if decoder is None:
+            decoder = self._resolve_wkb_decoder(wkb_value)
+            if decoder is None:
+                return None
+
         try:
-            with connection.cursor() as cursor:
-                # Use escaped table reference and column name
-                table_ref = self._get_escaped_table_ref()
-                geometry_column = self.table_info['geometry_column']
-                escaped_geom_col = self._escape_identifier(geometry_column)
-                
-                # Query to detect all geometry types in the table
-                # No LIMIT needed since DISTINCT already returns only unique types
-                # Note: Table/column identifiers cannot be parameterized in SQL.
-                # Security is ensured via _escape_identifier() which wraps identifiers in backticks.
-                query = f"""
-                SELECT DISTINCT ST_GEOMETRYTYPE({escaped_geom_col}) as geom_type 
-                FROM {table_ref} 
+            geom = QgsGeometry()
+            geom.fromWkb(decoder(wkb_value))
+            return None if geom.isNull() else geom
+
+        except Exception:
+            return None
+
+    def _fetch_schema(self, cursor, table_ref):
+        """Fetch (column_name, data_type) tuples for a table via DESCRIBE.
+
+        Fallback for tables not seen by TableDiscoveryThread (e.g. layers
+        loaded from saved settings before any discovery ran).
+        """
+        cursor.execute(f"DESCRIBE {table_ref}")
+        return [
+            (row[0], row[1]) for row in cursor.fetchall()
+            if row[0] and not row[0].startswith('#')
+        ]
+
+    def _fetch_arrow_batch(self, cursor, converters=None):
+        """Fetch the next batch of rows as a list of tuples.
+
+        Uses the connector's Arrow path (fetchmany_arrow) when available so
+        rows are transferred columnar and decompressed lazily; falls back to
+        plain fetchmany on older connector versions.
+
+        ``converters`` is an optional per-column list of callables (None =
+        pass-through) applied column-wise here, so the per-feature loop never
+        does type dispatch. Columns beyond the list (the geometry column) are
+        left raw.
+        """
+        fetchmany_arrow = getattr(cursor, 'fetchmany_arrow', None)
+        if fetchmany_arrow is not None:
+            try:
+                batch = fetchmany_arrow(_ARROW_BATCH_SIZE)
+                if batch.num_rows == 0:
+                    return []
+                columns = []
+                for j, col in enumerate(batch.columns):
+                    conv = converters[j] if converters and j < len(converters) else None
+                    if conv is _conv_datetime:
+                        # Timestamp columns go straight from epoch integers
+                        # to QDateTime, never materializing Python datetimes
+                        values = _timestamp_column_to_qdatetime(col)
+                        if values is not None:
+                            columns.append(values)
+                            continue
+                    values = col.to_pylist()
+                    if conv is not None:
+                        values = [
+                            conv(value) if value is not None else None
+                            for value in values
+                        ]
+                    columns.append(values)
+                return list(zip(*columns))
+            except Exception as arrow_e:
+                QgsMessageLog.logMessage(
+                    f"Arrow fetch failed, falling back to row fetch: {str(arrow_e)}",
+                    "Databricks Connector",
+                    Qgis.Warning
+                )
+
+        fallback_rows = cursor.fetchmany(_ARROW_BATCH_SIZE)
+        if not fallback_rows or not converters:
+            return fallback_rows
+        columns = [list(col) for col in zip(*fallback_rows)]
+        for j, conv in enumerate(converters):
+            if conv is None or j >= len(columns):
+                continue
+            columns[j] = [
+                conv(value) if value is not None else None
+                for value in columns[j]
+            ]
+        return list(zip(*columns))
+
+    def _geometry_type_filter_sql(self, escaped_geom_col):
+        """Build a WHERE fragment restricting rows to the layer's geometry type.
+
+        Returns '' when the table has a single geometry type (no filter
+        needed). Type names are fixed literals, not user input.
+        """
+        if self.table_info.get('target_geometry_type') == 'ST_LINESTRING':
+            wanted = ('ST_LINESTRING', 'ST_MULTILINESTRING')
+        elif self.table_info.get('target_geometry_type'):
+            wanted = ('ST_POLYGON', 'ST_MULTIPOLYGON')
+        elif self.table_info.get('mixed_geometries', False):
+            # The base layer of a mixed-geometry table holds the points
+            wanted = ('ST_POINT', 'ST_MULTIPOINT')
+        else:
+            return ''
+        type_list = ', '.join(f"'{t}'" for t in wanted)
+        return f"ST_GEOMETRYTYPE({escaped_geom_col}) IN ({type_list})"
+
+    def _vectorized_point_xy(self, rows):
+        """Decode a batch of fixed-layout 2D point WKB blobs in one pass.
+
+        A little-endian 2D point is always 21 bytes (endian byte, uint32
+        type, two float64 coordinates), so the whole batch can be read with
+        a single numpy.frombuffer instead of N QgsGeometry.fromWkb calls.
+        Returns (xs, ys) lists aligned with rows, or None when numpy is
+        missing or any blob deviates from that layout (NULLs, Z values,
+        multipoints) - callers then fall back to the general parser.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            return None
+        try:
+            wkbs = []
+            for row in rows:
+                value = row[-1]
+                if isinstance(value, str):
+                    value = bytes.fromhex(value.strip()) if value.strip() else None
+                elif isinstance(value, (bytearray, memoryview)):
+                    value = bytes(value)
+                if not isinstance(value, bytes) or len(value) != 21:
+                    return None
+                wkbs.append(value)
+            dtype = np.dtype([
+                ('endian', 'u1'), ('type', '<u4'), ('x', '<f8'), ('y', '<f8')
+            ])
+            decoded = np.frombuffer(b''.join(wkbs), dtype=dtype)
+            # Branchless validation: two reductions over the whole batch
+            if (decoded['endian'] != 1).any() or (decoded['type'] != 1).any():
+                return None
+            return decoded['x'].tolist(), decoded['y'].tolist()
+        except Exception:
+            return None
+
+    def _shapely_masks(self, rows, expected_wkb):
+        """Vectorized geometry prefilter for one batch.
+
+        With shapely 2.x available, parse the whole batch's WKB in C and
+        return (valid_mask, type_ok_mask): per-row bools for "parses, is
+        valid and non-empty" and "matches the layer's geometry type". Rows
+        failing either mask never reach QgsGeometry construction or the
+        per-feature isGeosValid()/wkbType() calls. type_ok_mask is None when
+        the expected type has no shapely type-id mapping (the per-feature
+        compatibility check then applies); returns None entirely when
+        shapely or its vectorized API is unavailable.
+        """
+        shapely = _get_shapely()
+        if shapely is None or not hasattr(shapely, 'from_wkb'):
+            return None
+        try:
+            wkbs = []
+            for row in rows:
+                value = row[-1]
+                if isinstance(value, str):
+                    value = bytes.fromhex(value.strip()) if value.strip() else None
+                elif isinstance(value, (bytearray, memoryview)):
+                    value = bytes(value)
+                wkbs.append(value if isinstance(value, bytes) else None)
+            geoms = shapely.from_wkb(wkbs, on_invalid='ignore')
+            valid_mask = [
+                bool(valid) and not bool(empty)
+                for valid, empty in zip(shapely.is_valid(geoms), shapely.is_empty(geoms))
+            ]
+            allowed_ids = _SHAPELY_TYPE_IDS_BY_WKB.get(expected_wkb)
+            type_ok_mask = None
+            if allowed_ids is not None:
+                type_ok_mask = [
+                    int(type_id) in allowed_ids
+                    for type_id in shapely.get_type_id(geoms)
+                ]
+            return valid_mask, type_ok_mask
+        except Exception:
+            return None
+
+    def _build_features(self, rows, start_index, layer_fields, memory_layer, stats):
+        """Build QgsFeatures for one batch of rows.
+
+        Updates the ``stats`` dict in place (valid/invalid/skipped/empty
+        counters and collected error strings) and returns the features that
+        passed validation.
+        """
+        # Preallocate the output list (trimmed below) and build rows by
+        # copying a template feature instead of re-resolving the fields
+        # metadata on every QgsFeature construction
+        features_to_add = [None] * len(rows)
+        feature_idx = 0
+        template = QgsFeature(layer_fields)
+        errors = stats['errors']
+
+        # Hoist everything loop-invariant out of the per-row path
+        field_count = len(layer_fields)
+        layer_wkb = memory_layer.wkbType()
+        target_geom_type = self.table_info.get('target_geometry_type')
+        mixed_geometries = self.table_info.get('mixed_geometries', False)
+        if target_geom_type:
+            # Specific geometry type layer (LineString or Polygon)
+            expected_wkb = 2 if target_geom_type == 'ST_LINESTRING' else 3
+        elif mixed_geometries:
+            # Mixed-geometry tables route Points/MultiPoints to this layer
+            expected_wkb = 1
+        else:
+            expected_wkb = layer_wkb
+
+        # Fast path for all-point batches: decode every 21-byte WKB blob in
+        # one numpy pass and skip the per-row parser and masks entirely
+        if expected_wkb == 1 and not QgsWkbTypes.hasZ(layer_wkb):
+            coords = self._vectorized_point_xy(rows)
+            if coords is not None:
+                xs, ys = coords
+                for i, row in enumerate(rows, start=start_index):
+                    feature = QgsFeature(template)
+                    feature.setId(i + 1)
+                    feature.setAttributes(list(row[:field_count]))
+                    offset = i - start_index
+                    feature.setGeometry(
+                        QgsGeometry.fromPointXY(QgsPointXY(xs[offset], ys[offset]))
+                    )
+                    features_to_add[feature_idx] = feature
+                    feature_idx += 1
+                stats['valid'] += len(rows)
+                del features_to_add[feature_idx:]
+                return features_to_add
+
+        masks = self._shapely_masks(rows, expected_wkb)
+        valid_mask, type_ok_mask = masks if masks is not None else (None, None)
+
+        for i, row in enumerate(rows, start=start_index):
+            try:
+                # Create feature with incremental ID
+                feature = QgsFeature(template)
+                feature.setId(i + 1)
+
+                # Set attributes - should now match fields list exactly (no geometry column)
+                attrs = list(row[:-1])  # All except last (geometry WKB)
+
+                if self.debug:
+                    attr_types = [type(attr).__name__ for attr in attrs]
+                    QgsMessageLog.logMessage(
+                        f"Feature {i} raw attributes: {attrs} (types: {attr_types})",
+                        "Databricks Connector",
+                        Qgis.Info
+                    )
+
+                # Type conversion already happened column-wise in
+                # _fetch_arrow_batch; just trim to the layer's field count
+                processed_attrs = attrs[:field_count]
+
+                # Verify attribute count matches field count
+                if len(processed_attrs) != field_count:
+                    errors.append(
+                        f"Feature {i}: attribute count mismatch - "
+                        f"expected {field_count}, got {len(processed_attrs)}"
+                    )
+
+                if self.debug:
+                    processed_attr_types = [type(attr).__name__ for attr in processed_attrs]
+                    QgsMessageLog.logMessage(
+                        f"Feature {i} processed attributes: {processed_attrs} "
+                        f"(types: {processed_attr_types})",
+                        "Databricks Connector",
+                        Qgis.Info
+                    )
+
+                feature.setAttributes(processed_attrs)
+
+                # CRITICAL FIX: Set geometry separately from WKB
+                geom_wkb = row[-1]  # Last column is geometry WKB
+                if geom_wkb:
+                    try:
+                        # Rows the vectorized prefilter rejected are skipped
+                        # without ever constructing a QgsGeometry
+                        if valid_mask is not None and not valid_mask[i - start_index]:
+                            stats['invalid_geometries'] += 1
+                            continue
+                        if type_ok_mask is not None and not type_ok_mask[i - start_index]:
+                            stats['skipped_types'] += 1
+                            continue
+
+                        # Parse geometry from WKB (fast binary path)
+                        geometry = self._parse_wkb(geom_wkb)
+
+                        if geometry is None or (
+                            valid_mask is None and not geometry.isGeosValid()
+                        ):
+                            stats['invalid_geometries'] += 1
+                            continue
+
+                        # Per-feature compatibility check only when the
+                        # vectorized type mask could not be built
+                        if type_ok_mask is None and not _is_compatible_geom_type(
+                            geometry.wkbType(), expected_wkb
+                        ):
+                            stats['skipped_types'] += 1
+                            continue
+
+                        # The geometry already passed the null/validity guards
+                        # above, so the feature needs no second validation pass
+                        feature.setGeometry(geometry)
+                        features_to_add[feature_idx] = feature
+                        feature_idx += 1
+                        stats['valid'] += 1
+
+                    except Exception as geom_e:
+                        errors.append(f"Feature {i}: error parsing geometry: {str(geom_e)}")
+                        continue
+                else:
+                    stats['empty_geometries'] += 1
+
+            except Exception as feat_e:
+                errors.append(f"Feature {i}: error processing: {str(feat_e)}")
+                continue
+
+        del features_to_add[feature_idx:]
+        return features_to_add
+
+    def _declared_geometry_family(self, full_name, geometry_column):
+        """Return the geometry family declared in the column's type, if any.
+
+        Looks up the cached schema for a parameterized type like
+        ``GEOMETRY(POINT, 4326)`` and maps the subtype to its family
+        ('POINT', 'LINESTRING' or 'POLYGON'). Returns None when the column
+        is generic GEOMETRY/GEOGRAPHY or the schema is not cached.
+        """
+        schema_info = _SCHEMA_CACHE.get(full_name)
+        if not schema_info:
+            return None
+        for col_name, col_type in schema_info:
+            if col_name != geometry_column:
+                continue
+            open_paren = col_type.find('(')
+            if open_paren < 0:
+                return None
+            subtype = col_type[open_paren + 1:].split(',', 1)[0].strip(' )').upper()
+            if 'POINT' in subtype:
+                return 'POINT'
+            if 'LINESTRING' in subtype or 'LINE' in subtype:
+                return 'LINESTRING'
+            if 'POLYGON' in subtype:
+                return 'POLYGON'
+            return None
+        return None
+
+    def _detect_mixed_geometry_types(self, cursor):
+        """Detect if table contains mixed geometry types and handle accordingly.
+
+        Runs on the caller's cursor and caches the outcome per table, so
+        repeated loads of the same table skip the detection query entirely.
+        """
+        full_name = self.table_info.get('full_name', '')
+        cached = _GEOM_DETECTION_CACHE.get(full_name)
+        if cached is not None:
+            self.table_info.update(cached)
+            return
+
+        try:
+            # Use escaped table reference and column name
+            table_ref = self._get_escaped_table_ref()
+            geometry_column = self.table_info['geometry_column']
+            escaped_geom_col = self._escape_identifier(geometry_column)
+
+            # If the column declares a concrete subtype (e.g.
+            # GEOMETRY(POINT,4326) from full_data_type) there is nothing to
+            # detect - skip the warehouse query entirely. Only generic
+            # GEOMETRY columns need the sampled DISTINCT below.
+            declared_family = self._declared_geometry_family(full_name, geometry_column)
+            if declared_family is not None:
+                self.table_info['geometry_type'] = f'ST_{declared_family}'
+                self.table_info['mixed_geometries'] = False
+                _GEOM_DETECTION_CACHE[full_name] = {
+                    'geometry_type': self.table_info['geometry_type'],
+                    'mixed_geometries': False,
+                }
+                QgsMessageLog.logMessage(
+                    f"Geometry type declared in schema: {declared_family} - skipping detection query",
+                    "Databricks Connector",
+                    Qgis.Info
+                )
+                return
+
+            # Sample first, then DISTINCT: a bare DISTINCT forces the
+            # warehouse to aggregate over every matching row before LIMIT
+            # applies, which scans the whole table. Pushing the LIMIT into a
+            # subquery bounds the scan to 10k rows - plenty to see every
+            # geometry family in practice.
+            # Note: Table/column identifiers cannot be parameterized in SQL.
+            # Security is ensured via _escape_identifier() which wraps identifiers in backticks.
+            query = f"""
+            SELECT DISTINCT geom_type FROM (
+                SELECT ST_GEOMETRYTYPE({escaped_geom_col}) as geom_type
+                FROM {table_ref}
                 WHERE {escaped_geom_col} IS NOT NULL
-                """
-                
+                LIMIT 10000
+            ) sample
+            """
+            
+            QgsMessageLog.logMessage(
+                f"Detecting geometry types with query: {query}",
+                "Databricks Connector",
+                Qgis.Info
+            )
+            
+            cursor.execute(query)
+            results = cursor.fetchall()
+            
+            if results:
+                geometry_types = [row[0].upper() for row in results]
                 QgsMessageLog.logMessage(
-                    f"Detecting geometry types with query: {query}",
+                    f"Found geometry types: {geometry_types}",
                     "Databricks Connector",
                     Qgis.Info
                 )
                 
-                cursor.execute(query)
-                results = cursor.fetchall()
+                # Group geometry types by family - Point/MultiPoint, LineString/MultiLineString, Polygon/MultiPolygon
+                # are all compatible within their family
+                def get_geom_family(geom_type):
+                    geom_type = geom_type.upper()
+                    if 'POINT' in geom_type:
+                        return 'POINT'
+                    elif 'LINESTRING' in geom_type or 'LINE' in geom_type:
+                        return 'LINESTRING'
+                    elif 'POLYGON' in geom_type:
+                        return 'POLYGON'
+                    return geom_type
+                
+                geometry_families = set(get_geom_family(gt) for gt in geometry_types)
+                
+                QgsMessageLog.logMessage(
+                    f"Geometry families: {geometry_families}",
+                    "Databricks Connector",
+                    Qgis.Info
+                )
                 
-                if results:
-                    geometry_types = [row[0].upper() for row in results]
+                # Check if we have mixed geometry FAMILIES (truly incompatible types)
+                if len(geometry_families) > 1:
+                    # Mixed geometry families - store all types for separate layer creation
+                    self.table_info['geometry_type'] = 'MIXED'
+                    self.table_info['mixed_geometries'] = True
+                    self.table_info['geometry_types_list'] = list(geometry_families)
                     QgsMessageLog.logMessage(
-                        f"Found geometry types: {geometry_types}",
+                        f"Mixed geometry families detected: {geometry_families}. Will create separate layers for each type.",
                         "Databricks Connector",
                         Qgis.Info
                     )
-                    
-                    # Group geometry types by family - Point/MultiPoint, LineString/MultiLineString, Polygon/MultiPolygon
-                    # are all compatible within their family
-                    def get_geom_family(geom_type):
-                        geom_type = geom_type.upper()
-                        if 'POINT' in geom_type:
-                            return 'POINT'
-                        elif 'LINESTRING' in geom_type or 'LINE' in geom_type:
-                            return 'LINESTRING'
-                        elif 'POLYGON' in geom_type:
-                            return 'POLYGON'
-                        return geom_type
-                    
-                    geometry_families = set(get_geom_family(gt) for gt in geometry_types)
-                    
+                else:
+                    # Single geometry family (e.g., both Polygon and MultiPolygon are POLYGON family)
+                    detected_family = list(geometry_families)[0]
+                    # Map family back to a standard type for layer creation
+                    family_to_type = {
+                        'POINT': 'ST_POINT',
+                        'LINESTRING': 'ST_LINESTRING',
+                        'POLYGON': 'ST_POLYGON'
+                    }
+                    detected_type = family_to_type.get(detected_family, geometry_types[0])
+                    self.table_info['geometry_type'] = detected_type
+                    self.table_info['mixed_geometries'] = False
                     QgsMessageLog.logMessage(
-                        f"Geometry families: {geometry_families}",
+                        f"Single geometry family detected: {detected_family} -> {detected_type}",
                         "Databricks Connector",
                         Qgis.Info
                     )
-                    
-                    # Check if we have mixed geometry FAMILIES (truly incompatible types)
-                    if len(geometry_families) > 1:
-                        # Mixed geometry families - store all types for separate layer creation
-                        self.table_info['geometry_type'] = 'MIXED'
-                        self.table_info['mixed_geometries'] = True
-                        self.table_info['geometry_types_list'] = list(geometry_families)
-                        QgsMessageLog.logMessage(
-                            f"Mixed geometry families detected: {geometry_families}. Will create separate layers for each type.",
-                            "Databricks Connector",
-                            Qgis.Info
-                        )
-                    else:
-                        # Single geometry family (e.g., both Polygon and MultiPolygon are POLYGON family)
-                        detected_family = list(geometry_families)[0]
-                        # Map family back to a standard type for layer creation
-                        family_to_type = {
-                            'POINT': 'ST_POINT',
-                            'LINESTRING': 'ST_LINESTRING',
-                            'POLYGON': 'ST_POLYGON'
-                        }
-                        detected_type = family_to_type.get(detected_family, geometry_types[0])
-                        self.table_info['geometry_type'] = detected_type
-                        self.table_info['mixed_geometries'] = False
-                        QgsMessageLog.logMessage(
-                            f"Single geometry family detected: {detected_family} -> {detected_type}",
-                            "Databricks Connector",
-                            Qgis.Info
-                        )
-                else:
-                    # No geometries found, default to Point
-                    self.table_info['geometry_type'] = 'POINT'
-                    self.table_info['mixed_geometries'] = False
-                
+            else:
+                # No geometries found, default to Point
+                self.table_info['geometry_type'] = 'POINT'
+                self.table_info['mixed_geometries'] = False
+            
+
+            _GEOM_DETECTION_CACHE[full_name] = {
+                key: self.table_info[key]
+                for key in ('geometry_type', 'mixed_geometries', 'geometry_types_list')
+                if key in self.table_info
+            }
+
         except Exception as e:
             QgsMessageLog.logMessage(
                 f"Error detecting geometry types: {str(e)}. Using Point as default.",
@@ -746,45 +1445,199 @@ class LayerLoadingThread(QThread):
             self.table_info['geometry_type'] = 'POINT'
             self.table_info['mixed_geometries'] = False
     
+    def _resolve_geometry_types(self):
+        """Compute the QGIS geometry string and flat WKB type in one dispatch.
+
+        Both values are stable for the life of a load, so they are cached on
+        table_info and the two getters below become plain reads.
+        """
+        cache_key = (
+            self.table_info['geometry_type'],
+            self.table_info.get('mixed_geometries', False),
+        )
+        if self.table_info.get('_geom_type_cache_key') == cache_key:
+            return
+        geom_type = cache_key[0].upper()
+
+        if (self.table_info.get('mixed_geometries', False)
+                or geom_type.startswith('GEOMETRY') or geom_type == 'MIXED'):
+            # Mixed/generic tables start with the Point layer; additional
+            # per-type layers are created afterwards
+            name, wkb = 'Point', 1
+        else:
+            normalized = geom_type[3:] if geom_type.startswith('ST_') else geom_type
+            name, wkb = _GEOM_TYPE_MAP.get(normalized, ('Point', 1))
+
+        self.table_info['_qgs_geom_type_str'] = name
+        self.table_info['_wkb_geom_type_int'] = wkb
+        self.table_info['_geom_type_cache_key'] = cache_key
+
     def _get_qgs_geometry_type(self):
         """Get QGIS geometry type string for memory layer"""
-        geom_type = self.table_info['geometry_type'].upper()
-        
-        # For mixed geometries, default to Point for now (we'll create separate layers later)
-        if self.table_info.get('mixed_geometries', False):
-            return "Point"  # Start with Point layer for mixed geometries
-        
-        # Handle specific geometry types
-        if geom_type.startswith('GEOMETRY') or geom_type == 'MIXED':
-            return "Point"  # Default to Point for generic types
-        elif 'POINT' in geom_type:
-            return "Point"
-        elif 'LINESTRING' in geom_type:
-            return "LineString"
-        elif 'POLYGON' in geom_type:
-            return "Polygon"
-        else:
-            return "Point"  # Default to Point for unknown types
+        self._resolve_geometry_types()
+        return self.table_info['_qgs_geom_type_str']
 
     def _get_wkb_geometry_type(self):
         """Get WKB geometry type constant for comparison"""
-        geom_type = self.table_info['geometry_type'].upper()
-        
-        # For mixed geometries, use Point WKB type for now
-        if self.table_info.get('mixed_geometries', False):
-            return 1  # Point WKB type
-        
-        # Handle specific geometry types
-        if geom_type.startswith('GEOMETRY') or geom_type == 'MIXED':
-            return 1  # Point for generic types
-        elif 'POINT' in geom_type:
-            return 1  # Point
-        elif 'LINESTRING' in geom_type:
-            return 2  # LineString
-        elif 'POLYGON' in geom_type:
-            return 3  # Polygon
-        else:
-            return 1  # Point for unknown types
+        self._resolve_geometry_types()
+        return self.table_info['_wkb_geom_type_int']
+
+
+class MultiGeometryLoaderThread(LayerLoadingThread):
+    """Load all non-point geometry families of a mixed table in one scan.
+
+    A mixed-geometry table used to issue one filtered query per additional
+    family, re-scanning the same table for LineStrings and again for
+    Polygons. This thread fetches every requested family in a single query
+    and splits the rows client-side into one memory layer per family.
+    """
+
+    layers_ready = pyqtSignal(list)  # [(layer_name, QgsVectorLayer), ...]
+
+    # Databricks geometry type names per family, including multi variants
+    _FAMILY_TYPE_NAMES = {
+        'LineString': ('ST_LINESTRING', 'ST_MULTILINESTRING'),
+        'Polygon': ('ST_POLYGON', 'ST_MULTIPOLYGON'),
+    }
+    # Flat WKB type -> family name
+    _WKB_FAMILY = {2: 'LineString', 5: 'LineString', 3: 'Polygon', 6: 'Polygon'}
+
+    def __init__(self, hostname, http_path, access_token, table_info,
+                 layer_names_by_family, max_features=1000, debug=False):
+        super().__init__(hostname, http_path, access_token, table_info, '',
+                         max_features=max_features, debug=debug)
+        # {'LineString': layer name, 'Polygon': layer name}
+        self.layer_names_by_family = layer_names_by_family
+
+    def run(self):
+        if not _databricks_available():
+            self.finished.emit(False, "databricks-sql-connector not installed", None)
+            return
+
+        connection = None
+        try:
+            connection = _get_pooled_connection(
+                self.hostname, self.http_path, self.access_token,
+                slot=self.pool_slot
+            )
+
+            with connection.cursor() as cursor:
+                table_ref = self._get_escaped_table_ref()
+                full_name = self.table_info.get('full_name', '')
+                geometry_column = self.table_info['geometry_column']
+                escaped_geom_col = self._escape_identifier(geometry_column)
+
+                schema_info = _SCHEMA_CACHE.get(full_name)
+                if schema_info is None:
+                    schema_info = self._fetch_schema(cursor, table_ref)
+                    _SCHEMA_CACHE[full_name] = schema_info
+
+                fields = QgsFields()
+                for col_name, col_type in schema_info:
+                    col_type = col_type.upper()
+                    base_type = col_type.split('(', 1)[0].strip()
+                    if col_name.lower() == geometry_column.lower() or base_type in _NON_ATTRIBUTE_TYPES:
+                        continue
+                    fields.append(QgsField(col_name, _DATABRICKS_TO_QVARIANT.get(base_type, QVariant.String)))
+
+                converters = [_TYPE_CONVERTERS.get(f.type()) for f in fields]
+
+                select_sql = _SELECT_CLAUSE_CACHE.get(full_name)
+                if select_sql is None:
+                    select_clause = [self._escape_identifier(f.name()) for f in fields]
+                    select_clause.append(f"ST_ASBINARY({escaped_geom_col}) as geom_wkb")
+                    select_sql = ', '.join(select_clause)
+                    _SELECT_CLAUSE_CACHE[full_name] = select_sql
+
+                type_names = tuple(
+                    name
+                    for family in self.layer_names_by_family
+                    for name in self._FAMILY_TYPE_NAMES.get(family, ())
+                )
+                type_list = ', '.join(f"'{name}'" for name in type_names)
+                query = (
+                    f"SELECT {select_sql} FROM {table_ref} "
+                    f"WHERE ST_GEOMETRYTYPE({escaped_geom_col}) IN ({type_list})"
+                )
+                query_params = None
+                if self.max_features > 0:
+                    # One scan serves every family, so scale the cap; each
+                    # family is trimmed back to max_features after splitting
+                    query += " LIMIT :max_features"
+                    query_params = {
+                        "max_features": self.max_features * len(self.layer_names_by_family)
+                    }
+
+                self.progress.emit("Loading additional geometry layers...")
+                cursor.execute(query, query_params)
+                cursor.arraysize = _ARROW_BATCH_SIZE
+
+                field_count = len(fields)
+                feature_buckets = {family: [] for family in self.layer_names_by_family}
+                has_z = False
+
+                rows = self._fetch_arrow_batch(cursor, converters)
+                while rows:
+                    for row in rows:
+                        geometry = self._parse_wkb(row[-1]) if row else None
+                        if geometry is None:
+                            continue
+                        family = self._WKB_FAMILY.get(QgsWkbTypes.flatType(geometry.wkbType()))
+                        bucket = feature_buckets.get(family)
+                        if bucket is None:
+                            continue
+                        has_z = has_z or QgsWkbTypes.hasZ(geometry.wkbType())
+                        feature = QgsFeature(fields)
+                        feature.setAttributes(list(row[:field_count]))
+                        feature.setGeometry(geometry)
+                        bucket.append(feature)
+
+                    loaded = sum(len(b) for b in feature_buckets.values())
+                    self.progress.emit(f"Loaded {loaded} additional features...")
+                    rows = self._fetch_arrow_batch(cursor, converters)
+
+            created_layers = []
+            for family, layer_name in self.layer_names_by_family.items():
+                features = feature_buckets.get(family) or []
+                if self.max_features > 0:
+                    features = features[:self.max_features]
+                if not features:
+                    continue
+
+                geom_str = f"{family}Z" if has_z else family
+                memory_layer = QgsVectorLayer(f"{geom_str}?crs=EPSG:4326", layer_name, "memory")
+                if not memory_layer.isValid():
+                    QgsMessageLog.logMessage(
+                        f"Failed to create memory layer for {family}",
+                        "Databricks Connector",
+                        Qgis.Warning
+                    )
+                    continue
+
+                provider = memory_layer.dataProvider()
+                provider.addAttributes(fields.toList())
+                memory_layer.updateFields()
+                provider.addFeatures(features, QgsFeatureSink.FastInsert)
+                memory_layer.updateExtents()
+                created_layers.append((layer_name, memory_layer))
+
+            self.layers_ready.emit(created_layers)
+            total_features = sum(layer.featureCount() for _, layer in created_layers)
+            self.finished.emit(
+                True,
+                f"Loaded {len(created_layers)} additional layer(s) with {total_features} features",
+                None
+            )
+
+        except Exception as e:
+            if connection is not None:
+                _discard_pooled_connection(connection)
+            QgsMessageLog.logMessage(
+                f"Error loading additional geometry layers: {str(e)}",
+                "Databricks Connector",
+                Qgis.Critical
+            )
+            self.finished.emit(False, f"Error loading additional layers: {str(e)}", None)
 
 
 class DatabricksDialog(QDialog):
@@ -957,32 +1810,74 @@ class DatabricksDialog(QDialog):
         
         layout.addLayout(button_layout)
     
+    def _load_connections_map(self):
+        """Read all saved connections with a single settings access.
+
+        Connections are stored as one JSON blob so dialog startup does one
+        backend read instead of one per group per field. Legacy per-group
+        entries are walked exactly once and migrated to the blob.
+        """
+        raw = self.settings.value("DatabricksConnector/ConnectionsJSON", "")
+        if raw:
+            try:
+                return json.loads(raw)
+            except (TypeError, ValueError):
+                pass
+
+        # Legacy layout: one walk over the groups, then migrate
+        connections = {}
+        self.settings.beginGroup("DatabricksConnector/Connections")
+        for conn_name in self.settings.childGroups():
+            self.settings.beginGroup(conn_name)
+            connections[conn_name] = {
+                'hostname': self.settings.value("hostname", ""),
+                'http_path': self.settings.value("http_path", ""),
+                'access_token': self.settings.value("access_token", ""),
+            }
+            self.settings.endGroup()
+        self.settings.endGroup()
+
+        if connections:
+            self.settings.setValue(
+                "DatabricksConnector/ConnectionsJSON", json.dumps(connections)
+            )
+        return connections
+
     def load_saved_connections(self):
         """Load saved connection settings from QSettings"""
         try:
-            # Clear existing items except "New Connection..."
-            self.saved_connections_combo.clear()
-            self.saved_connections_combo.addItem("New Connection...")
-            
-            # Load saved connections
-            self.settings.beginGroup("DatabricksConnector/Connections")
-            connection_names = self.settings.childGroups()
-            
-            for conn_name in connection_names:
-                self.saved_connections_combo.addItem(conn_name)
-            
-            self.settings.endGroup()
-            
+            # Rebuild the combo without firing currentTextChanged per item -
+            # each emission would re-run load_selected_connection
+            signals_were_blocked = self.saved_connections_combo.blockSignals(True)
+            try:
+                # Clear existing items except "New Connection..."
+                self.saved_connections_combo.clear()
+                self.saved_connections_combo.addItem("New Connection...")
+
+                # Load saved connections in one read
+                self._connections_cache = self._load_connections_map()
+                connection_names = list(self._connections_cache)
+
+                for conn_name in connection_names:
+                    self.saved_connections_combo.addItem(conn_name)
+            finally:
+                self.saved_connections_combo.blockSignals(signals_were_blocked)
+
             # Load global layer prefix setting (not connection-specific)
             layer_prefix = self.settings.value("DatabricksConnector/LayerPrefix", "databricks_")
             self.layer_prefix_edit.setText(layer_prefix)
-            
+
             # Load last used connection if available
             last_connection = self.settings.value("DatabricksConnector/LastConnection", "")
             if last_connection and last_connection in connection_names:
                 index = self.saved_connections_combo.findText(last_connection)
                 if index >= 0:
-                    self.saved_connections_combo.setCurrentIndex(index)
+                    # Select silently; load_selected_connection is called once below
+                    signals_were_blocked = self.saved_connections_combo.blockSignals(True)
+                    try:
+                        self.saved_connections_combo.setCurrentIndex(index)
+                    finally:
+                        self.saved_connections_combo.blockSignals(signals_were_blocked)
                     self.load_selected_connection(last_connection)
                     
         except Exception as e:
@@ -1012,15 +1907,13 @@ class DatabricksDialog(QDialog):
             return
         
         try:
-            self.settings.beginGroup(f"DatabricksConnector/Connections/{connection_name}")
-            
+            details = getattr(self, '_connections_cache', {}).get(connection_name, {})
+
             self.connection_name_edit.setText(connection_name)
-            self.hostname_edit.setText(self.settings.value("hostname", ""))
-            self.http_path_edit.setText(self.settings.value("http_path", ""))
-            self.access_token_edit.setText(self.settings.value("access_token", ""))
-            
-            self.settings.endGroup()
-            
+            self.hostname_edit.setText(details.get('hostname', ''))
+            self.http_path_edit.setText(details.get('http_path', ''))
+            self.access_token_edit.setText(details.get('access_token', ''))
+
         except Exception as e:
             QgsMessageLog.logMessage(
                 f"Error loading connection {connection_name}: {str(e)}",
@@ -1054,13 +1947,26 @@ class DatabricksDialog(QDialog):
             return
         
         try:
-            # Save connection
+            # Save connection to the JSON blob (single-read startup) and
+            # mirror it into the legacy per-group layout that the browser
+            # and Genie modules still read
+            if not hasattr(self, '_connections_cache'):
+                self._connections_cache = {}
+            self._connections_cache[connection_name] = {
+                'hostname': hostname,
+                'http_path': http_path,
+                'access_token': access_token,
+            }
+            self.settings.setValue(
+                "DatabricksConnector/ConnectionsJSON",
+                json.dumps(self._connections_cache)
+            )
             self.settings.beginGroup(f"DatabricksConnector/Connections/{connection_name}")
             self.settings.setValue("hostname", hostname)
             self.settings.setValue("http_path", http_path)
             self.settings.setValue("access_token", access_token)
             self.settings.endGroup()
-            
+
             # Save as last used connection
             self.settings.setValue("DatabricksConnector/LastConnection", connection_name)
             
@@ -1097,9 +2003,14 @@ class DatabricksDialog(QDialog):
         
         if reply == QMessageBox.Yes:
             try:
-                # Remove from settings
+                # Remove from the JSON blob and the legacy group layout
+                if getattr(self, '_connections_cache', {}).pop(current_connection, None) is not None:
+                    self.settings.setValue(
+                        "DatabricksConnector/ConnectionsJSON",
+                        json.dumps(self._connections_cache)
+                    )
                 self.settings.remove(f"DatabricksConnector/Connections/{current_connection}")
-                
+
                 # Remove from dropdown
                 index = self.saved_connections_combo.findText(current_connection)
                 if index >= 0:
@@ -1119,10 +2030,10 @@ class DatabricksDialog(QDialog):
         """Check if required dependencies are available"""
         missing_deps = []
         
-        if not DATABRICKS_AVAILABLE:
+        if not _databricks_available():
             missing_deps.append("databricks-sql-connector")
         
-        if not SHAPELY_AVAILABLE:
+        if not _shapely_available():
             missing_deps.append("shapely")
         
         if missing_deps:
@@ -1166,7 +2077,7 @@ import sys
     
     def test_connection(self):
         """Test the database connection"""
-        if not DATABRICKS_AVAILABLE:
+        if not _databricks_available():
             QMessageBox.critical(self, "Missing Dependencies", 
                                "databricks-sql-connector is not installed. Please install it first.")
             return
@@ -1202,7 +2113,7 @@ import sys
     
     def discover_tables(self):
         """Discover spatial tables in the database"""
-        if not DATABRICKS_AVAILABLE:
+        if not _databricks_available():
             QMessageBox.critical(self, "Missing Dependencies", 
                                "databricks-sql-connector is not installed. Please install it first.")
             return
@@ -1231,21 +2142,28 @@ import sys
         self.progress_dialog.close()
         self.tables = tables
         
-        # Populate table widget
-        self.tables_widget.setRowCount(len(tables))
-        
-        for i, table in enumerate(tables):
-            # Checkbox for selection
-            checkbox = QCheckBox()
-            self.tables_widget.setCellWidget(i, 0, checkbox)
-            
-            # Table information
-            self.tables_widget.setItem(i, 1, QTableWidgetItem(table['catalog']))
-            self.tables_widget.setItem(i, 2, QTableWidgetItem(table['schema']))
-            self.tables_widget.setItem(i, 3, QTableWidgetItem(table['table']))
-            self.tables_widget.setItem(i, 4, QTableWidgetItem(table['geometry_column']))
-            self.tables_widget.setItem(i, 5, QTableWidgetItem(table['geometry_type']))
-        
+        # Populate table widget with painting and signals suspended, so the
+        # view relayouts once at the end instead of once per cell
+        self.tables_widget.setUpdatesEnabled(False)
+        signals_were_blocked = self.tables_widget.blockSignals(True)
+        try:
+            self.tables_widget.setRowCount(len(tables))
+
+            for i, table in enumerate(tables):
+                # Checkbox for selection
+                checkbox = QCheckBox()
+                self.tables_widget.setCellWidget(i, 0, checkbox)
+
+                # Table information
+                self.tables_widget.setItem(i, 1, QTableWidgetItem(table['catalog']))
+                self.tables_widget.setItem(i, 2, QTableWidgetItem(table['schema']))
+                self.tables_widget.setItem(i, 3, QTableWidgetItem(table['table']))
+                self.tables_widget.setItem(i, 4, QTableWidgetItem(table['geometry_column']))
+                self.tables_widget.setItem(i, 5, QTableWidgetItem(table['geometry_type']))
+        finally:
+            self.tables_widget.blockSignals(signals_were_blocked)
+            self.tables_widget.setUpdatesEnabled(True)
+
         if tables:
             self.add_layers_btn.setEnabled(True)
             QMessageBox.information(self, "Discovery Complete", 
@@ -1256,7 +2174,7 @@ import sys
     
     def add_selected_layers(self):
         """Add selected layers to QGIS using FIXED memory provider approach"""
-        if not DATABRICKS_AVAILABLE:
+        if not _databricks_available():
             QMessageBox.critical(self, "Missing Dependencies", 
                                "databricks-sql-connector is not installed.")
             return
@@ -1313,45 +2231,83 @@ import sys
                 except ValueError:
                     max_features = 0  # Default to unlimited on invalid input
         
-        # Load layers one by one
-        self.layers_to_load = selected_tables.copy()
-        self.current_layer_index = 0
+        # Load layers concurrently (bounded) - each table's query is
+        # independent, so total latency approaches the slowest table rather
+        # than the sum of every round-trip
+        self._load_queue = [
+            (table, f"{layer_prefix}{table['table']}", max_features, self.on_layer_loaded)
+            for table in selected_tables
+        ]
+        self._load_params = (hostname, http_path, access_token)
+        self._active_load_threads = []
+        self._finished_load_threads = []
+        # Connection slots not currently held by a running thread - a slot
+        # is taken on dispatch and returned when its thread is retired, so
+        # no two live threads ever share a pooled connection
+        self._free_pool_slots = set(range(_MAX_PARALLEL_LAYER_LOADS))
         self.loaded_layers = 0
-        
-        self.load_next_layer(hostname, http_path, access_token, layer_prefix, max_features)
-    
-    def load_next_layer(self, hostname, http_path, access_token, layer_prefix, max_features):
-        """Load the next layer in the queue"""
-        if self.current_layer_index >= len(self.layers_to_load):
-            # All layers processed
-            if self.loaded_layers > 0:
-                QMessageBox.information(self, "Layers Added", 
-                                      f"Successfully added {self.loaded_layers} layer(s) to QGIS.")
-                
-                # Save connection details for next time
-                if self.connection_name_edit.text().strip():
-                    self.save_current_connection()
-                    
-            else:
-                QMessageBox.warning(self, "No Layers Added", 
-                                  "No layers were successfully added. Check the message log for details.")
-            return
-        
-        table = self.layers_to_load[self.current_layer_index]
-        layer_name = f"{layer_prefix}{table['table']}"
-        
-        # Show progress dialog
-        self.progress_dialog = QProgressDialog(f"Loading layer: {layer_name}", "Cancel", 0, 0, self)
+
+        # One progress dialog for the whole batch
+        self.progress_dialog = QProgressDialog(
+            f"Loading {len(selected_tables)} layer(s)...", "Cancel", 0, 0, self
+        )
         self.progress_dialog.setWindowModality(Qt.WindowModal)
         self.progress_dialog.show()
-        
-        # Start loading thread
-        self.loading_thread = LayerLoadingThread(
-            hostname, http_path, access_token, table, layer_name, max_features
-        )
-        self.loading_thread.progress.connect(self.on_loading_progress)
-        self.loading_thread.finished.connect(self.on_layer_loaded)
-        self.loading_thread.start()
+
+        self._dispatch_layer_loads()
+
+    def _dispatch_layer_loads(self):
+        """Start queued layer loads, up to the concurrency bound.
+
+        Queue entries are (table_info, layer_name, max_features,
+        finished_slot) tuples - or pre-built, pre-connected QThread
+        instances - so primary and additional geometry layers share the
+        same bounded pool of worker threads.
+        """
+        hostname, http_path, access_token = self._load_params
+
+        while self._load_queue and self._free_pool_slots:
+            entry = self._load_queue.pop(0)
+
+            if isinstance(entry, QThread):
+                loading_thread = entry
+            else:
+                table_info, layer_name, max_features, finished_slot = entry
+                loading_thread = LayerLoadingThread(
+                    hostname, http_path, access_token, table_info, layer_name, max_features
+                )
+                loading_thread.progress.connect(self.on_loading_progress)
+                loading_thread.finished.connect(finished_slot)
+
+            # Give each worker its own pooled connection - cursors on a
+            # shared connection are not safe across threads, so the slot
+            # must come from the free set, not a rotating counter that can
+            # lap a still-running thread
+            loading_thread.pool_slot = self._free_pool_slots.pop()
+            self._active_load_threads.append(loading_thread)
+            # Most-recent thread, used by live mode for its metadata
+            self.loading_thread = loading_thread
+            loading_thread.start()
+
+        if not self._load_queue and not self._active_load_threads:
+            self._finish_layer_loads()
+
+    def _finish_layer_loads(self):
+        """Close the progress UI and report once every queued load completed"""
+        if hasattr(self, 'progress_dialog'):
+            self.progress_dialog.close()
+
+        if self.loaded_layers > 0:
+            QMessageBox.information(self, "Layers Added",
+                                  f"Successfully added {self.loaded_layers} layer(s) to QGIS.")
+
+            # Save connection details for next time
+            if self.connection_name_edit.text().strip():
+                self.save_current_connection()
+
+        else:
+            QMessageBox.warning(self, "No Layers Added",
+                              "No layers were successfully added. Check the message log for details.")
     
     def on_loading_progress(self, message):
         """Update progress dialog"""
@@ -1360,27 +2316,20 @@ import sys
     
     def on_layer_loaded(self, success, message, layer):
         """Handle layer loading results"""
-        self.progress_dialog.close()
-        
+        loading_thread = self.sender() or getattr(self, 'loading_thread', None)
+
         if success and layer:
             # CRITICAL: Check layer validity before adding
             if layer.isValid():
                 # Store Databricks metadata on the layer for refresh functionality
                 self._store_layer_metadata(layer)
                 
-                # Add layer to QGIS project
+                # Add layer to QGIS project. Features were written straight to
+                # the data provider (never via an edit buffer), so the layer
+                # arrives with editing off - no commitChanges/rollBack needed.
                 QgsProject.instance().addMapLayer(layer)
                 self.loaded_layers += 1
-                
-                # CRITICAL: Stop editing mode AFTER adding to project
-                # Memory layers may still be in edit mode after commitChanges()
-                if layer.isEditable():
-                    # Use commitChanges first to save any pending changes
-                    layer.commitChanges()
-                    # If still editable, force stop with rollBack (no changes should be pending)
-                    if layer.isEditable():
-                        layer.rollBack()
-                
+
                 # Check if live mode is enabled - create live layer manager
                 if getattr(self, '_live_mode_enabled', False):
                     try:
@@ -1395,11 +2344,11 @@ import sys
                         
                         # Get table info from loading thread
                         table_info = {}
-                        if hasattr(self.loading_thread, 'table_info'):
+                        if hasattr(loading_thread, 'table_info'):
                             table_info = {
-                                'full_name': self.loading_thread.table_info.get('full_name', ''),
-                                'geometry_column': self.loading_thread.table_info.get('geometry_column', ''),
-                                'geometry_type': self.loading_thread.table_info.get('geometry_type', '')
+                                'full_name': loading_thread.table_info.get('full_name', ''),
+                                'geometry_column': loading_thread.table_info.get('geometry_column', ''),
+                                'geometry_type': loading_thread.table_info.get('geometry_type', '')
                             }
                         
                         # Create live layer manager
@@ -1410,7 +2359,7 @@ import sys
                             table_info,
                             refresh_delay_ms=getattr(self, '_live_refresh_delay', 500),
                             buffer_percent=getattr(self, '_live_buffer_percent', 0.1),
-                            max_features=self.loading_thread.max_features if hasattr(self.loading_thread, 'max_features') else 10000
+                            max_features=loading_thread.max_features if hasattr(loading_thread, 'max_features') else 10000
                         )
                         
                         # Mark layer as live layer
@@ -1445,8 +2394,8 @@ import sys
                 
                 # Check if we need to create additional layers for mixed geometries
                 # We need to check the table_info from the loading thread, not the original table
-                if hasattr(self.loading_thread, 'table_info'):
-                    thread_table_info = self.loading_thread.table_info
+                if hasattr(loading_thread, 'table_info'):
+                    thread_table_info = loading_thread.table_info
                     if (thread_table_info.get('mixed_geometries', False) and 
                         'geometry_types_list' in thread_table_info):
                         
@@ -1466,49 +2415,28 @@ import sys
                 Qgis.Critical
             )
         
-        # Move to next layer
-        self.current_layer_index += 1
-        
-        # Get connection details for next layer
-        hostname = self.hostname_edit.text().strip()
-        http_path = self.http_path_edit.text().strip()
-        access_token = self.access_token_edit.text().strip()
-        layer_prefix = self.layer_prefix_edit.text().strip()
-        
-        # Use live mode settings if enabled
-        if getattr(self, '_live_mode_enabled', False):
-            try:
-                max_features = int(self.live_max_features_edit.text().strip())
-            except ValueError:
-                max_features = 10000
-            # Add "_live" suffix if not already present
-            if not layer_prefix.endswith("_live"):
-                layer_prefix = layer_prefix + "_live"
-        else:
-            # Parse max_features: empty = 0 (unlimited), otherwise parse as int
-            max_features_text = self.max_features_edit.text().strip()
-            if not max_features_text:
-                max_features = 0  # 0 means no limit
-            else:
-                try:
-                    max_features = int(max_features_text)
-                except ValueError:
-                    max_features = 0  # Default to unlimited on invalid input
-        
-        # Load next layer
-        self.load_next_layer(hostname, http_path, access_token, layer_prefix, max_features)
-    
+        # Retire this thread, return its connection slot and start any
+        # queued loads
+        if loading_thread in getattr(self, '_active_load_threads', []):
+            self._active_load_threads.remove(loading_thread)
+            self._finished_load_threads.append(loading_thread)
+            self._free_pool_slots.add(loading_thread.pool_slot)
+        self._dispatch_layer_loads()
+
     def create_additional_geometry_layers(self, table_info):
-        """Create additional layers for LineStrings and Polygons in mixed geometry tables"""
+        """Queue additional layers for LineStrings and Polygons in mixed geometry tables.
+
+        All extra geometry families are fetched by a single
+        MultiGeometryLoaderThread on one shared cursor, and that thread goes
+        through the same bounded dispatcher as the primary layers, so a
+        batch of mixed-geometry tables never spawns more than
+        _MAX_PARALLEL_LAYER_LOADS worker threads at once.
+        """
         try:
             geometry_types = table_info.get('geometry_types_list', [])
-            
-            # Get connection details
-            hostname = self.hostname_edit.text().strip()
-            http_path = self.http_path_edit.text().strip()
-            access_token = self.access_token_edit.text().strip()
+
             layer_prefix = self.layer_prefix_edit.text().strip()
-            
+
             # Parse max_features: empty = 0 (unlimited), otherwise parse as int
             max_features_text = self.max_features_edit.text().strip()
             if not max_features_text:
@@ -1518,73 +2446,92 @@ import sys
                     max_features = int(max_features_text)
                 except ValueError:
                     max_features = 0  # Default to unlimited on invalid input
-            
-            # Create layers for LineStrings and Polygons
-            for geom_type in geometry_types:
-                if geom_type in ['ST_LINESTRING', 'ST_POLYGON']:
-                    # Create a modified table_info for this specific geometry type
-                    specific_table_info = table_info.copy()
-                    specific_table_info['geometry_type'] = geom_type
-                    specific_table_info['mixed_geometries'] = False
-                    specific_table_info['target_geometry_type'] = geom_type  # Filter for this type only
-                    
-                    # Create layer name with geometry type suffix
-                    geom_suffix = "lines" if geom_type == 'ST_LINESTRING' else "polygons"
-                    layer_name = f"{layer_prefix}{table_info['table']}_{geom_suffix}"
-                    
-                    QgsMessageLog.logMessage(
-                        f"Creating additional layer for {geom_type}: {layer_name}",
-                        "Databricks Connector",
-                        Qgis.Info
-                    )
-                    
-                    # Start loading thread for this geometry type
-                    loading_thread = LayerLoadingThread(
-                        hostname, http_path, access_token, specific_table_info, layer_name, max_features
-                    )
-                    loading_thread.progress.connect(self.on_loading_progress)
-                    loading_thread.finished.connect(self.on_additional_layer_loaded)
-                    loading_thread.start()
-                    
-                    # Store reference to prevent garbage collection
-                    if not hasattr(self, 'additional_threads'):
-                        self.additional_threads = []
-                    self.additional_threads.append(loading_thread)
-        
+
+            # One layer per extra geometry family, all served by one scan
+            layer_names_by_family = {}
+            if 'ST_LINESTRING' in geometry_types:
+                layer_names_by_family['LineString'] = f"{layer_prefix}{table_info['table']}_lines"
+            if 'ST_POLYGON' in geometry_types:
+                layer_names_by_family['Polygon'] = f"{layer_prefix}{table_info['table']}_polygons"
+
+            if not layer_names_by_family:
+                return
+
+            QgsMessageLog.logMessage(
+                f"Queueing additional layers on a shared scan: "
+                f"{', '.join(layer_names_by_family.values())}",
+                "Databricks Connector",
+                Qgis.Info
+            )
+
+            hostname, http_path, access_token = self._load_params
+            multi_thread = MultiGeometryLoaderThread(
+                hostname, http_path, access_token, table_info.copy(),
+                layer_names_by_family, max_features
+            )
+            multi_thread.progress.connect(self.on_loading_progress)
+            multi_thread.layers_ready.connect(self.on_additional_layers_ready)
+            multi_thread.finished.connect(self.on_additional_layer_loaded)
+
+            self._load_queue.append(multi_thread)
+            self._dispatch_layer_loads()
+
         except Exception as e:
             QgsMessageLog.logMessage(
                 f"Error creating additional geometry layers: {str(e)}",
                 "Databricks Connector",
                 Qgis.Critical
             )
-    
+
     def on_additional_layer_loaded(self, success, message, layer):
         """Handle additional layer loading results"""
         if success and layer and layer.isValid():
-            # Ensure editing is off before adding to project
-            if layer.isEditable():
-                layer.commitChanges()
-            
-            # Add layer to QGIS project
+            # Features were added via the data provider, so the layer is not
+            # in edit mode - add it to the project directly
             QgsProject.instance().addMapLayer(layer)
             self.loaded_layers += 1
-            
-            # Double-check editing is off after adding
-            if layer.isEditable():
-                layer.rollBack()
-            
+
             QgsMessageLog.logMessage(
                 f"Successfully added additional layer: {layer.name()} with {layer.featureCount()} features",
                 "Databricks Connector",
                 Qgis.Info
             )
-        else:
+        elif not success:
+            # MultiGeometryLoaderThread delivers its layers via layers_ready
+            # and finishes with layer=None, so only report real failures
             QgsMessageLog.logMessage(
                 f"Failed to load additional layer: {message}",
                 "Databricks Connector",
                 Qgis.Warning
             )
-    
+
+        # Retire this thread, return its connection slot and start any
+        # queued loads
+        loading_thread = self.sender()
+        if loading_thread in getattr(self, '_active_load_threads', []):
+            self._active_load_threads.remove(loading_thread)
+            self._finished_load_threads.append(loading_thread)
+            self._free_pool_slots.add(loading_thread.pool_slot)
+        self._dispatch_layer_loads()
+
+    def on_additional_layers_ready(self, layer_list):
+        """Add the layers produced by a shared multi-geometry scan to the project"""
+        for layer_name, layer in layer_list:
+            if layer and layer.isValid():
+                QgsProject.instance().addMapLayer(layer)
+                self.loaded_layers += 1
+                QgsMessageLog.logMessage(
+                    f"Successfully added additional layer: {layer_name} with {layer.featureCount()} features",
+                    "Databricks Connector",
+                    Qgis.Info
+                )
+            else:
+                QgsMessageLog.logMessage(
+                    f"Additional layer {layer_name} was not valid",
+                    "Databricks Connector",
+                    Qgis.Warning
+                )
+
     def _store_layer_metadata(self, layer):
         """Store Databricks connection and table metadata on the layer for refresh functionality"""
         try:
@@ -1682,25 +2629,13 @@ import sys
     
     def _create_provider_uri(self, table_info, connection_config):
         """Create URI for the Databricks provider"""
-        # Properly encode the URI
-        import urllib.parse
-        
-        hostname = connection_config['hostname']
-        http_path = connection_config['http_path']
-        access_token = connection_config['access_token']
-        
-        base_uri = f"databricks://{hostname}:443{http_path}"
-        
-        params = {
-            'access_token': access_token,
-            'table': table_info['full_name']
-        }
-        
-        if table_info.get('geometry_column'):
-            params['geom_column'] = table_info['geometry_column']
-        
-        query_string = urllib.parse.urlencode(params)
-        return f"{base_uri}?{query_string}"
+        return _build_provider_uri(
+            connection_config['hostname'],
+            connection_config['http_path'],
+            connection_config['access_token'],
+            table_info['full_name'],
+            table_info.get('geometry_column') or None,
+        )
 
 
 # ===== QUERY DIALOG CLASSES =====
@@ -1711,52 +2646,96 @@ class DatabaseStructureThread(QThread):
     progress = pyqtSignal(str)  # progress message
     finished = pyqtSignal(dict)  # database structure dict
     
-    def __init__(self, connection_config):
+    def __init__(self, connection_config, catalog_filter=None, schema_filter=None,
+                 force_refresh=False):
         super().__init__()
         self.connection_config = connection_config
-    
+        # Optional pushdown filters - a workspace-wide information_schema
+        # scan grows with every catalog the user can see
+        self.catalog_filter = catalog_filter
+        self.schema_filter = schema_filter
+        # When True, skip the on-disk snapshot and re-query the warehouse
+        self.force_refresh = force_refresh
+
     def run(self):
-        if not DATABRICKS_AVAILABLE:
+        if not _databricks_available():
             self.finished.emit({})
             return
-        
+
+        cache_path = _structure_cache_path(
+            self.connection_config['hostname'],
+            self.connection_config['http_path'],
+            self.connection_config['access_token'],
+            self.catalog_filter,
+            self.schema_filter,
+        )
+
+        # Serve a recent snapshot from disk - the structure query can scan
+        # thousands of metadata rows and rarely changes within a day
+        if not self.force_refresh:
+            try:
+                if (os.path.exists(cache_path)
+                        and _time.time() - os.path.getmtime(cache_path) < _STRUCTURE_CACHE_TTL_SECONDS):
+                    with open(cache_path, 'r', encoding='utf-8') as cache_file:
+                        cached = _json.load(cache_file)
+                    if cached:
+                        self.progress.emit("Database structure loaded from cache")
+                        self.finished.emit(cached)
+                        return
+            except Exception:
+                pass  # unreadable snapshot - fall through to a live query
+
         structure = {}
-        
+        connection = None
+
         try:
             self.progress.emit("Loading database structure...")
-            
-            connection = sql.connect(
-                server_hostname=self.connection_config['hostname'],
-                http_path=self.connection_config['http_path'],
-                access_token=self.connection_config['access_token']
+
+            connection = _get_pooled_connection(
+                self.connection_config['hostname'],
+                self.connection_config['http_path'],
+                self.connection_config['access_token']
             )
             
             with connection.cursor() as cursor:
                 # Use information_schema to get only accessible tables and columns
                 self.progress.emit("Loading accessible database structure...")
                 
-                # Query information_schema to get all accessible tables and columns
+                # Query information_schema to get accessible tables and
+                # columns. Filters are pushed down when set, and there is no
+                # ORDER BY - the grouping below is dict-based and column order
+                # is restored per table from ordinal_position.
                 info_query = """
-                    SELECT 
+                    SELECT
                         table_catalog,
-                        table_schema, 
+                        table_schema,
                         table_name,
                         column_name,
-                        data_type
-                    FROM system.information_schema.columns 
-                    WHERE table_catalog IS NOT NULL 
+                        data_type,
+                        ordinal_position
+                    FROM system.information_schema.columns
+                    WHERE table_catalog IS NOT NULL
                         AND table_schema IS NOT NULL
                         AND table_name IS NOT NULL
-                    ORDER BY table_catalog, table_schema, table_name, ordinal_position
                 """
-                
+                query_params = {}
+                if self.catalog_filter:
+                    info_query += " AND table_catalog = :catalog"
+                    query_params['catalog'] = self.catalog_filter
+                else:
+                    # Skip the metadata catalogs nobody loads layers from
+                    info_query += " AND table_catalog NOT IN ('system', 'information_schema')"
+                if self.schema_filter:
+                    info_query += " AND table_schema = :schema"
+                    query_params['schema'] = self.schema_filter
+
                 QgsMessageLog.logMessage(
                     f"Querying accessible database structure with: {info_query}",
                     "Query Dialog",
                     Qgis.Info
                 )
-                
-                cursor.execute(info_query)
+
+                cursor.execute(info_query, query_params or None)
                 results = cursor.fetchall()
                 
                 QgsMessageLog.logMessage(
@@ -1765,14 +2744,16 @@ class DatabaseStructureThread(QThread):
                     Qgis.Info
                 )
                 
-                # Group results by catalog/schema/table
+                # Group results by catalog/schema/table - order-independent,
+                # so the server never sorts the whole metadata scan
                 for row in results:
                     catalog = row[0]
-                    schema = row[1] 
+                    schema = row[1]
                     table = row[2]
                     column_name = row[3]
                     data_type = row[4]
-                    
+                    ordinal = row[5]
+
                     # Initialize nested structure
                     if catalog not in structure:
                         structure[catalog] = {}
@@ -1781,15 +2762,27 @@ class DatabaseStructureThread(QThread):
                     if table not in structure[catalog][schema]:
                         structure[catalog][schema][table] = {
                             'columns': [],
-                            'full_name': f"{catalog}.{schema}.{table}"
+                            'full_name': f"{catalog}.{schema}.{table}",
+                            'has_geometry': False,
                         }
-                    
-                    # Add column info
+
+                    # Add column info, folding the per-table geometry flag in
+                    # here so the tree build never re-scans column lists
+                    is_geometry = data_type.upper() in ['GEOMETRY', 'GEOGRAPHY']
+                    if is_geometry:
+                        structure[catalog][schema][table]['has_geometry'] = True
                     structure[catalog][schema][table]['columns'].append({
                         'name': column_name,
                         'type': data_type,
-                        'is_geometry': data_type.upper() in ['GEOMETRY', 'GEOGRAPHY']
+                        'is_geometry': is_geometry,
+                        'ordinal': ordinal,
                     })
+
+                # Restore declaration order within each table locally
+                for catalog_schemas in structure.values():
+                    for schema_tables in catalog_schemas.values():
+                        for table_entry in schema_tables.values():
+                            table_entry['columns'].sort(key=lambda c: c['ordinal'] or 0)
                 
                 total_catalogs = len(structure)
                 total_schemas = sum(len(schemas) for schemas in structure.values())
@@ -1800,13 +2793,31 @@ class DatabaseStructureThread(QThread):
                     "Query Dialog",
                     Qgis.Info
                 )
-            
-            connection.close()
-            
+
+            # Pooled connection stays open for reuse by later queries
+
+            # Persist the snapshot atomically for the next dialog open
+            try:
+                cache_dir = os.path.dirname(cache_path)
+                os.makedirs(cache_dir, exist_ok=True)
+                with _tempfile.NamedTemporaryFile(
+                        'w', dir=cache_dir, suffix='.tmp',
+                        delete=False, encoding='utf-8') as tmp_file:
+                    _json.dump(structure, tmp_file)
+                os.replace(tmp_file.name, cache_path)
+            except Exception as cache_e:
+                QgsMessageLog.logMessage(
+                    f"Could not cache database structure: {str(cache_e)}",
+                    "Query Dialog",
+                    Qgis.Warning
+                )
+
             self.progress.emit("Database structure loaded!")
             self.finished.emit(structure)
-            
+
         except Exception as e:
+            if connection is not None:
+                _discard_pooled_connection(connection)
             QgsMessageLog.logMessage(
                 f"Error loading database structure: {str(e)}",
                 "Query Dialog",
@@ -1827,37 +2838,42 @@ class QueryExecutionThread(QThread):
         self.query = query
     
     def run(self):
-        if not DATABRICKS_AVAILABLE:
+        if not _databricks_available():
             self.finished.emit(False, "databricks-sql-connector not installed", [], [])
             return
         
+        connection = None
         try:
             self.progress.emit("Connecting to Databricks...")
-            
-            connection = sql.connect(
-                server_hostname=self.connection_config['hostname'],
-                http_path=self.connection_config['http_path'],
-                access_token=self.connection_config['access_token']
+
+            connection = _get_pooled_connection(
+                self.connection_config['hostname'],
+                self.connection_config['http_path'],
+                self.connection_config['access_token']
             )
-            
+
             self.progress.emit("Executing query...")
-            
+
             with connection.cursor() as cursor:
+                # Size the driver's internal fetch buffer to our batch size
+                # so blocks arrive in bulk rather than per-row round-trips
+                cursor.arraysize = _ARROW_BATCH_SIZE
                 cursor.execute(self.query)
-                
+
                 # Get column information
                 columns = []
                 if cursor.description:
                     columns = [desc[0] for desc in cursor.description]
-                
-                # Fetch results
-                rows = cursor.fetchall()
-            
-            connection.close()
-            
+
+                # Stream results in batches so progress stays responsive on
+                # large result sets, preferring the connector's Arrow path
+                rows = _stream_result_rows(cursor, self.progress.emit)
+
             self.finished.emit(True, f"Query executed successfully. {len(rows)} rows returned.", columns, rows)
-            
+
         except Exception as e:
+            if connection is not None:
+                _discard_pooled_connection(connection)
             self.finished.emit(False, f"Query failed: {str(e)}", [], [])
 
 
@@ -1867,47 +2883,73 @@ class QueryLayerCreationThread(QThread):
     progress = pyqtSignal(str)  # progress message
     finished = pyqtSignal(bool, str, object)  # success, message, layer
     
-    def __init__(self, connection_config, query, layer_name, geometry_column=None):
+    def __init__(self, connection_config, query, layer_name, geometry_column=None,
+                 strict_validity=False, cached_columns=None, cached_rows=None):
         super().__init__()
         self.connection_config = connection_config
         self.query = query
         self.layer_name = layer_name
         self.geometry_column = geometry_column
+        # Result set already fetched by the query dialog - reused instead of
+        # re-executing, but only when no geometry-conversion rewrite is needed
+        self.cached_columns = cached_columns
+        self.cached_rows = cached_rows
+        # GEOS validity checking walks every vertex of every geometry; for
+        # display purposes a successful parse is enough, so it is opt-in
+        self.strict_validity = strict_validity
+        # Per-feature diagnostics marshal to the GUI thread per call - only
+        # worth it when explicitly debugging (same switch as the layer loader)
+        self._debug = os.environ.get("DATABRICKS_CONNECTOR_DEBUG") == "1"
     
     def run(self):
-        if not DATABRICKS_AVAILABLE:
+        if not _databricks_available():
             self.finished.emit(False, "databricks-sql-connector not installed", None)
             return
         
+        connection = None
         try:
             self.progress.emit("Connecting to Databricks...")
-            
-            connection = sql.connect(
-                server_hostname=self.connection_config['hostname'],
-                http_path=self.connection_config['http_path'],
-                access_token=self.connection_config['access_token']
+
+            connection = _get_pooled_connection(
+                self.connection_config['hostname'],
+                self.connection_config['http_path'],
+                self.connection_config['access_token']
             )
-            
+
             self.progress.emit("Analyzing query for geometry columns...")
             
             # First, check if we need to modify the query for geometry conversion
             modified_query = self._add_geometry_conversion(connection, self.query)
-            
-            self.progress.emit("Executing query...")
-            
-            with connection.cursor() as cursor:
-                cursor.execute(modified_query)
-                
-                # Get column information
-                columns = []
-                if cursor.description:
-                    columns = [desc[0] for desc in cursor.description]
-                
-                # Fetch results
-                rows = cursor.fetchall()
-            
-            connection.close()
-            
+
+            if self.cached_rows is not None and modified_query == self.query:
+                # No ST_ASWKT rewrite was needed, so the rows the dialog
+                # already fetched are exactly what this query would return -
+                # skip the round-trip. Type codes fall back to value scanning.
+                self.progress.emit("Reusing fetched query results...")
+                columns = list(self.cached_columns or [])
+                type_codes = []
+                rows = self.cached_rows
+            else:
+                self.progress.emit("Executing query...")
+
+                with connection.cursor() as cursor:
+                    # Size the driver's internal fetch buffer to our batch size
+                    # so blocks arrive in bulk rather than per-row round-trips
+                    cursor.arraysize = _ARROW_BATCH_SIZE
+                    cursor.execute(modified_query)
+
+                    # Get column names and driver type codes - the cursor already
+                    # knows each column's type, so no row scanning is needed below
+                    columns = []
+                    type_codes = []
+                    if cursor.description:
+                        columns = [desc[0] for desc in cursor.description]
+                        type_codes = [desc[1] for desc in cursor.description]
+
+                    # Stream results in batches so progress stays responsive on
+                    # large result sets, preferring the connector's Arrow path
+                    rows = _stream_result_rows(cursor, self.progress.emit)
+
             if not rows:
                 self.finished.emit(False, "Query returned no results", None)
                 return
@@ -1931,10 +2973,14 @@ class QueryLayerCreationThread(QThread):
                         Qgis.Info
                     )
             
+            # Case-fold every column name once - reused for candidate matching
+            # and for locating the geometry column index below
+            lowered = [c.lower() for c in columns]
+
             if not self.geometry_column:
                 # First, check if any column contains WKT data by examining sample values
                 sample_row = rows[0] if rows else None
-                
+
                 if sample_row:
                     for i, col in enumerate(columns):
                         if i < len(sample_row):
@@ -1952,9 +2998,8 @@ class QueryLayerCreationThread(QThread):
                 
                 # If still not found, look for common geometry column names
                 if not self.geometry_column:
-                    geom_candidates = ['geometry', 'geom', 'location', 'point', 'polygon', 'linestring', 'shape', 'spatial']
-                    for col in columns:
-                        if col.lower() in geom_candidates:
+                    for col, lc in zip(columns, lowered):
+                        if lc in _GEOM_CANDIDATES:
                             self.geometry_column = col
                             QgsMessageLog.logMessage(
                                 f"Auto-detected geometry column by name: {col}",
@@ -1974,8 +3019,9 @@ class QueryLayerCreationThread(QThread):
             fields = QgsFields()
             geom_col_index = None
             
+            geometry_column_lower = (self.geometry_column or '').lower()
             for i, col in enumerate(columns):
-                if col.lower() == (self.geometry_column or '').lower():
+                if lowered[i] == geometry_column_lower:
                     geom_col_index = i
                     QgsMessageLog.logMessage(
                         f"Found geometry column '{col}' at index {i}",
@@ -1983,55 +3029,66 @@ class QueryLayerCreationThread(QThread):
                         Qgis.Info
                     )
                 else:
-                    # Determine field type from first non-null value
-                    field_type = QVariant.String  # default
-                    for row in rows:
-                        if row[i] is not None:
-                            if isinstance(row[i], int):
-                                field_type = QVariant.LongLong
-                            elif isinstance(row[i], float):
-                                field_type = QVariant.Double
-                            elif isinstance(row[i], bool):
-                                field_type = QVariant.Bool
-                            break
-                    
+                    # Map the driver's type code for this column instead of
+                    # scanning rows for the first non-null value; when no
+                    # code is available (e.g. rows reused from the results
+                    # table), fall back to that value scan
+                    field_type = None
+                    if i < len(type_codes) and type_codes[i] is not None:
+                        code = str(type_codes[i]).split('(', 1)[0].strip().upper()
+                        field_type = _DATABRICKS_TO_QVARIANT.get(code, QVariant.String)
+                    if field_type is None:
+                        field_type = QVariant.String
+                        for row in rows:
+                            value = row[i]
+                            if value is not None:
+                                if isinstance(value, bool):
+                                    field_type = QVariant.Bool
+                                elif isinstance(value, int):
+                                    field_type = QVariant.LongLong
+                                elif isinstance(value, float):
+                                    field_type = QVariant.Double
+                                break
+
                     field = QgsField(col, field_type)
                     fields.append(field)
-                    QgsMessageLog.logMessage(
-                        f"Added attribute field: {col} ({field_type})",
-                        "Query Dialog",
-                        Qgis.Info
-                    )
+                    if self._debug:
+                        QgsMessageLog.logMessage(
+                            f"Added attribute field: {col} ({field_type})",
+                            "Query Dialog",
+                            Qgis.Info
+                        )
             
-            # Determine geometry types from all geometries and handle mixed types
-            geometry_types_in_data = set()
+            # Determine geometry types from all geometries and handle mixed
+            # types. One O(N) pass buckets row indices per type and caches the
+            # SRID-stripped WKT, so the layer-creation paths below never
+            # re-classify or re-strip a row.
             has_z = False
+            buckets = {}
+            clean_wkts = [None] * len(rows)
+            # All rows in a result set share one shape, so checking the
+            # first row's width once stands in for per-row bounds checks
+            # in the hot loops below
+            if rows and len(rows[0]) != len(columns):
+                self.finished.emit(
+                    False,
+                    f"Result rows have {len(rows[0])} fields but the query "
+                    f"returned {len(columns)} columns",
+                    None
+                )
+                return
             if geom_col_index is not None and rows:
-                for row in rows:
-                    if geom_col_index < len(row) and row[geom_col_index]:
+                for i, row in enumerate(rows):
+                    if row[geom_col_index]:
                         geom_wkt = str(row[geom_col_index])
-                        # Strip SRID prefix before checking geometry type
-                        clean_wkt = self._strip_srid_from_wkt(geom_wkt).strip().upper()
-
-                        if clean_wkt.startswith('POINT'):
-                            geometry_types_in_data.add('Point')
-                        elif clean_wkt.startswith('LINESTRING'):
-                            geometry_types_in_data.add('LineString')
-                        elif clean_wkt.startswith('POLYGON'):
-                            geometry_types_in_data.add('Polygon')
-                        elif clean_wkt.startswith('MULTIPOINT'):
-                            geometry_types_in_data.add('MultiPoint')
-                        elif clean_wkt.startswith('MULTILINESTRING'):
-                            geometry_types_in_data.add('MultiLineString')
-                        elif clean_wkt.startswith('MULTIPOLYGON'):
-                            geometry_types_in_data.add('MultiPolygon')
-
-                        # Detect Z dimension (e.g. "MULTIPOLYGON Z (((" or "POINTZ(")
-                        if not has_z:
-                            # Extract the type keyword (everything before the first '(')
-                            type_part = clean_wkt.split('(')[0].strip()
-                            if type_part.endswith(' Z') or type_part.endswith(' ZM') or 'Z(' in clean_wkt.split('(')[0]:
-                                has_z = True
+                        # One anchored regex pass classifies type and Z
+                        # dimension without uppercasing the whole string
+                        gtype, z = _classify_wkt(geom_wkt)
+                        if gtype:
+                            buckets.setdefault(gtype, []).append(i)
+                            clean_wkts[i] = self._strip_srid_from_wkt(geom_wkt)
+                            has_z = has_z or z
+            geometry_types_in_data = set(buckets)
             
             QgsMessageLog.logMessage(
                 f"Detected geometry types in query results: {list(geometry_types_in_data)}, has_z={has_z}",
@@ -2044,106 +3101,86 @@ class QueryLayerCreationThread(QThread):
                 QgsMessageLog.logMessage(
                     f"Mixed geometry types detected: {list(geometry_types_in_data)}. Creating separate layers for each type.",
                     "Query Dialog",
-                    Qgis.Info
-                )
-                # Create separate layers for each geometry type
-                self._create_mixed_geometry_layers(columns, rows, fields, geom_col_index, geometry_types_in_data, has_z)
-                return
-            
-            # Single geometry type or no geometry
-            geom_type = list(geometry_types_in_data)[0] if geometry_types_in_data else "Point"
-            
-            if geom_col_index is not None and rows:
-                first_geom = rows[0][geom_col_index]
-                if first_geom:
-                    try:
-                        if SHAPELY_AVAILABLE:
-                            shapely_geom = wkt.loads(str(first_geom))
-                            if shapely_geom.geom_type == 'LineString' or shapely_geom.geom_type == 'MultiLineString':
-                                geom_type = "LineString"
-                            elif shapely_geom.geom_type == 'Polygon' or shapely_geom.geom_type == 'MultiPolygon':
-                                geom_type = "Polygon"
-                        else:
-                            # Fallback to simple string matching
-                            geom_str = str(first_geom).upper()
-                            if 'LINESTRING' in geom_str or 'MULTILINESTRING' in geom_str:
-                                geom_type = "LineString"
-                            elif 'POLYGON' in geom_str or 'MULTIPOLYGON' in geom_str:
-                                geom_type = "Polygon"
-                    except:
-                        pass  # Keep default Point type
-            
-            # Create memory layer — append Z suffix so QGIS 3.x accepts Z geometries
+                    Qgis.Info
+                )
+                # Create separate layers for each geometry type
+                self._create_mixed_geometry_layers(rows, fields, geom_col_index, buckets, clean_wkts, has_z)
+                return
+
+            # Single geometry type or no geometry - the bucketing pass already
+            # classified every row exactly, so no re-sniffing of sample values
+            geom_type = next(iter(geometry_types_in_data)) if geometry_types_in_data else "Point"
+
+            # Create memory layer with CRS and fields declared in the URI -
+            # one-shot construction, no addAttributes/updateFields round-trip.
+            # Append Z suffix so QGIS 3.x accepts Z geometries.
             if geom_col_index is not None:
                 layer_geom_type = f"{geom_type}Z" if has_z else geom_type
-                layer_def = f"{layer_geom_type}?crs=EPSG:4326"
-                memory_layer = QgsVectorLayer(layer_def, self.layer_name, "memory")
             else:
                 # No geometry, create attribute-only layer
-                memory_layer = QgsVectorLayer("None", self.layer_name, "memory")
-            
+                layer_geom_type = "None"
+            layer_def = _memory_layer_def(layer_geom_type, fields)
+            memory_layer = QgsVectorLayer(layer_def, self.layer_name, "memory")
+
             if not memory_layer.isValid():
                 self.finished.emit(False, f"Failed to create memory layer", None)
                 return
-            
-            # Add fields directly to provider (no edit mode — avoids QGIS 3.x
-            # issue where commitChanges() discards provider-level additions)
+
             provider = memory_layer.dataProvider()
-            provider.addAttributes(fields.toList())
-            memory_layer.updateFields()
             
             self.progress.emit(f"Adding {len(rows)} features...")
             
+            # For large result sets, convert all WKT to WKB in one vectorized
+            # shapely pass (C loops, GIL released) - QgsGeometry.fromWkb then
+            # skips the per-feature float re-parse that fromWkt pays
+            geom_wkbs = None
+            if geom_col_index is not None and len(rows) > 5000:
+                geom_wkbs = self._bulk_wkt_to_wkb(clean_wkts)
+
             # Add features
             features_to_add = []
+            built_features = 0
             successful_geometries = 0
-            
+
+            # Hoisted out of the loop: the attribute gather (a C-level
+            # itemgetter) and the layer's field container are constant per layer
+            attr_indices = [j for j in range(len(columns)) if j != geom_col_index]
+            get_attrs = _make_attr_getter(attr_indices)
+            layer_fields = memory_layer.fields()
+            from_wkt = QgsGeometry.fromWkt
+
             QgsMessageLog.logMessage(
                 f"Processing {len(rows)} rows. Geometry column index: {geom_col_index}",
                 "Query Dialog",
                 Qgis.Info
             )
-            
+
             for i, row in enumerate(rows):
-                feature = QgsFeature(memory_layer.fields(), i + 1)
-                
+                feature = QgsFeature(layer_fields, i + 1)
+
                 # Set attributes (excluding geometry column), coercing types
                 # so the QGIS 3.x memory provider accepts them
-                attrs = [_coerce_attr(v) for j, v in enumerate(row) if j != geom_col_index]
+                attrs = [_coerce_attr(v) for v in get_attrs(row)]
                 feature.setAttributes(attrs)
                 
-                # Set geometry if present
-                if geom_col_index is not None and geom_col_index < len(row) and row[geom_col_index]:
+                # Set geometry if present - reuse the SRID-stripped WKT from
+                # the classification pass instead of re-stripping per feature
+                clean_wkt = clean_wkts[i] if i < len(clean_wkts) else None
+                if geom_col_index is not None and clean_wkt:
                     try:
-                        geom_wkt = str(row[geom_col_index])
-                        
-                        QgsMessageLog.logMessage(
-                            f"Feature {i}: Processing geometry WKT: {geom_wkt[:100]}...",
-                            "Query Dialog",
-                            Qgis.Info
-                        )
-                        
-                        # Strip SRID prefix before parsing
-                        clean_wkt = self._strip_srid_from_wkt(geom_wkt)
-                        
-                        if clean_wkt != geom_wkt:
-                            QgsMessageLog.logMessage(
-                                f"Feature {i}: Stripped SRID prefix: {clean_wkt[:100]}...",
-                                "Query Dialog",
-                                Qgis.Info
-                            )
-                        
-                        # Parse geometry using QGIS built-in WKT parser
-                        geometry = QgsGeometry.fromWkt(clean_wkt)
+                        if geom_wkbs is not None:
+                            # Bulk-converted WKB from the shapely pass
+                            geometry = QgsGeometry()
+                            if geom_wkbs[i]:
+                                geometry.fromWkb(geom_wkbs[i])
+                        else:
+                            # Parse geometry using QGIS built-in WKT parser
+                            geometry = from_wkt(clean_wkt)
                         
-                        if not geometry.isNull() and geometry.isGeosValid():
+                        if not geometry.isNull() and (not self.strict_validity
+                                                     or geometry.isGeosValid()):
                             feature.setGeometry(geometry)
                             successful_geometries += 1
-                            QgsMessageLog.logMessage(
-                                f"Feature {i}: Successfully set geometry",
-                                "Query Dialog",
-                                Qgis.Info
-                            )
                         else:
                             QgsMessageLog.logMessage(
                                 f"Feature {i}: Invalid geometry after SRID stripping: {clean_wkt[:100]}...",
@@ -2153,33 +3190,38 @@ class QueryLayerCreationThread(QThread):
                         
                     except Exception as e:
                         QgsMessageLog.logMessage(
-                            f"Feature {i}: Error parsing geometry: {str(e)}, WKT: {geom_wkt[:100]}...",
+                            f"Feature {i}: Error parsing geometry: {str(e)}, WKT: {clean_wkt[:100]}...",
                             "Query Dialog",
                             Qgis.Warning
                         )
                 else:
-                    if geom_col_index is not None:
+                    if geom_col_index is not None and self._debug:
                         QgsMessageLog.logMessage(
-                            f"Feature {i}: No geometry data (geom_col_index={geom_col_index}, row_len={len(row)}, value={row[geom_col_index] if geom_col_index < len(row) else 'N/A'})",
+                            f"Feature {i}: No geometry data (geom_col_index={geom_col_index}, value={row[geom_col_index]})",
                             "Query Dialog",
                             Qgis.Info
                         )
                 
                 features_to_add.append(feature)
-            
+
+                # Flush to the provider in batches (no edit mode) so inserts
+                # overlap construction instead of one giant add at the end
+                if len(features_to_add) >= _ARROW_BATCH_SIZE:
+                    provider.addFeatures(features_to_add, QgsFeatureSink.FastInsert)
+                    built_features += len(features_to_add)
+                    features_to_add = []
+                    self.progress.emit(f"Added {built_features} features...")
+
+            if features_to_add:
+                provider.addFeatures(features_to_add, QgsFeatureSink.FastInsert)
+                built_features += len(features_to_add)
+
             QgsMessageLog.logMessage(
-                f"Created {len(features_to_add)} features, {successful_geometries} with valid geometries",
+                f"Created {built_features} features, {successful_geometries} with valid geometries, "
+                f"layer_def={layer_def}, provider_error='{provider.lastError()}'",
                 "Query Dialog",
                 Qgis.Info
             )
-            
-            # Add features directly to provider (no edit mode)
-            success, added = provider.addFeatures(features_to_add)
-            QgsMessageLog.logMessage(
-                f"addFeatures result: success={success}, added={len(added) if added else 0}, "
-                f"layer_def={layer_def}, provider_error='{provider.lastError()}'",
-                "Query Dialog", Qgis.Info
-            )
             memory_layer.updateExtents()
 
             # Check if we had geometry issues and inform the user
@@ -2200,76 +3242,50 @@ class QueryLayerCreationThread(QThread):
                 message = f"Created layer with {successful_features} features"
             
             self.finished.emit(True, message, memory_layer)
-            
+
         except Exception as e:
+            if connection is not None:
+                _discard_pooled_connection(connection)
             self.finished.emit(False, f"Error creating layer: {str(e)}", None)
     
-    def _create_mixed_geometry_layers(self, columns, rows, fields, geom_col_index, geometry_types, has_z=False):
-        """Create separate layers for each geometry type in mixed geometry data"""
+    def _create_mixed_geometry_layers(self, rows, fields, geom_col_index, buckets, clean_wkts, has_z=False):
+        """Create separate layers for each geometry type in mixed geometry data.
+
+        ``buckets`` maps geometry type name to the row indices classified as
+        that type, and ``clean_wkts`` holds the SRID-stripped WKT per row -
+        both built in one pass by run(), so nothing is re-classified here.
+        """
         try:
             created_layers = []
-            
-            for geom_type in sorted(geometry_types):
-                QgsMessageLog.logMessage(
-                    f"Creating layer for geometry type: {geom_type}",
-                    "Query Dialog",
-                    Qgis.Info
-                )
-                
-                # Filter rows for this specific geometry type
-                filtered_rows = []
-                for row in rows:
-                    if geom_col_index < len(row) and row[geom_col_index]:
-                        geom_wkt = str(row[geom_col_index])
-                        # Strip SRID prefix before checking geometry type
-                        clean_wkt = self._strip_srid_from_wkt(geom_wkt).strip().upper()
-                        row_geom_type = None
-                        
-                        if clean_wkt.startswith('POINT'):
-                            row_geom_type = 'Point'
-                        elif clean_wkt.startswith('LINESTRING'):
-                            row_geom_type = 'LineString'
-                        elif clean_wkt.startswith('POLYGON'):
-                            row_geom_type = 'Polygon'
-                        elif clean_wkt.startswith('MULTIPOINT'):
-                            row_geom_type = 'MultiPoint'
-                        elif clean_wkt.startswith('MULTILINESTRING'):
-                            row_geom_type = 'MultiLineString'
-                        elif clean_wkt.startswith('MULTIPOLYGON'):
-                            row_geom_type = 'MultiPolygon'
-                        
-                        if row_geom_type == geom_type:
-                            filtered_rows.append(row)
-                
-                if not filtered_rows:
-                    QgsMessageLog.logMessage(
-                        f"No features found for geometry type: {geom_type}, skipping",
-                        "Query Dialog",
-                        Qgis.Info
-                    )
-                    continue
-                
+
+            for geom_type in sorted(buckets):
+                row_indices = buckets[geom_type]
+
                 QgsMessageLog.logMessage(
-                    f"Creating {geom_type} layer with {len(filtered_rows)} filtered rows",
+                    f"Creating {geom_type} layer with {len(row_indices)} rows",
                     "Query Dialog",
                     Qgis.Info
                 )
-                
+
                 # Create layer for this geometry type - SIMPLE VERSION
                 # Use the base layer_name with geometry type suffix
                 layer = self._create_simple_layer(
                     f"{self.layer_name}_{geom_type}",
                     geom_type,
-                    filtered_rows,
+                    rows,
+                    row_indices,
+                    clean_wkts,
                     fields,
                     geom_col_index,
                     has_z
                 )
                 
-                if layer and layer.featureCount() > 0:
-                    created_layers.append(layer)
+                # featureCount() walks the provider, so read it once per layer
+                count = layer.featureCount() if layer else 0
+                if count > 0:
+                    created_layers.append((layer, count))
                     QgsMessageLog.logMessage(
-                        f"Successfully created {geom_type} layer with {layer.featureCount()} features",
+                        f"Successfully created {geom_type} layer with {count} features",
                         "Query Dialog",
                         Qgis.Info
                     )
@@ -2281,15 +3297,15 @@ class QueryLayerCreationThread(QThread):
                     )
             
             if created_layers:
-                # Add all layers to QGIS
-                for layer in created_layers:
+                # Add all layers to QGIS, reusing the counts captured above
+                for layer, _count in created_layers:
                     QgsProject.instance().addMapLayer(layer)
-                
-                total_features = sum(layer.featureCount() for layer in created_layers)
+
+                total_features = sum(count for _layer, count in created_layers)
                 message = f"Created {len(created_layers)} layers with {total_features} total features: "
-                message += ", ".join([f"{layer.name()} ({layer.featureCount()})" for layer in created_layers])
-                
-                self.finished.emit(True, message, created_layers[0])
+                message += ", ".join(f"{layer.name()} ({count})" for layer, count in created_layers)
+
+                self.finished.emit(True, message, created_layers[0][0])
             else:
                 self.finished.emit(False, "No valid layers created from mixed geometry data", None)
                 
@@ -2301,42 +3317,49 @@ class QueryLayerCreationThread(QThread):
             )
             self.finished.emit(False, f"Error creating mixed geometry layers: {str(e)}", None)
     
-    def _create_simple_layer(self, layer_name, geom_type, filtered_rows, fields, geom_col_index, has_z=False):
-        """Create a memory layer for a specific geometry type using direct provider access."""
+    def _create_simple_layer(self, layer_name, geom_type, rows, row_indices, clean_wkts, fields, geom_col_index, has_z=False):
+        """Create a memory layer for one geometry type from its bucket of row indices."""
         try:
-            # Append Z so QGIS 3.x accepts Z-dimension geometries
+            # Append Z so QGIS 3.x accepts Z-dimension geometries; fields are
+            # declared inline so no addAttributes/updateFields pass is needed
             layer_geom_type = f"{geom_type}Z" if has_z else geom_type
-            layer_def = f"{layer_geom_type}?crs=EPSG:4326"
+            layer_def = _memory_layer_def(layer_geom_type, fields)
             memory_layer = QgsVectorLayer(layer_def, layer_name, "memory")
 
             if not memory_layer.isValid():
                 QgsMessageLog.logMessage(f"Failed to create memory layer: {layer_def}", "Query Dialog", Qgis.Critical)
                 return None
 
-            # Add fields directly to provider (no edit mode)
             provider = memory_layer.dataProvider()
-            provider.addAttributes(fields.toList())
-            memory_layer.updateFields()
 
-            # Build features
+            # Build features from the pre-classified rows
+            layer_fields = memory_layer.fields()
             features_to_add = []
-            for i, row in enumerate(filtered_rows):
-                feature = QgsFeature(memory_layer.fields())
+            get_attrs = None
+            from_wkt = QgsGeometry.fromWkt
+            for i in row_indices:
+                row = rows[i]
+                feature = QgsFeature(layer_fields)
 
-                attrs = [_coerce_attr(v) for j, v in enumerate(row) if j != geom_col_index]
+                if get_attrs is None:
+                    get_attrs = _make_attr_getter(
+                        [j for j in range(len(row)) if j != geom_col_index]
+                    )
+                attrs = [_coerce_attr(v) for v in get_attrs(row)]
                 feature.setAttributes(attrs)
 
-                if geom_col_index is not None and geom_col_index < len(row) and row[geom_col_index]:
-                    clean_wkt = self._strip_srid_from_wkt(str(row[geom_col_index]))
-                    geometry = QgsGeometry.fromWkt(clean_wkt)
-                    if not geometry.isNull() and geometry.isGeosValid():
+                clean_wkt = clean_wkts[i]
+                if clean_wkt:
+                    geometry = from_wkt(clean_wkt)
+                    if not geometry.isNull() and (not self.strict_validity
+                                                  or geometry.isGeosValid()):
                         feature.setGeometry(geometry)
 
                 features_to_add.append(feature)
 
             # Add features directly to provider
             if features_to_add:
-                provider.addFeatures(features_to_add)
+                provider.addFeatures(features_to_add, QgsFeatureSink.FastInsert)
             memory_layer.updateExtents()
 
             final_count = memory_layer.featureCount()
@@ -2351,75 +3374,104 @@ class QueryLayerCreationThread(QThread):
             return None
     
     def _is_wkt_format(self, value_str):
-        """Check if a string is already in WKT format (handles SRID prefixes)"""
+        """Check if a string is already in WKT format (handles SRID prefixes).
+
+        Only probes the first few characters, so the cost is bounded even
+        for multi-megabyte polygon strings.
+        """
         if not isinstance(value_str, str):
             return False
-        
-        value_str = value_str.strip().upper()
-        
-        # Handle SRID prefixes (e.g., "SRID=4326;POINT(...)")
-        if value_str.startswith('SRID='):
-            # Extract WKT part after the semicolon
-            srid_parts = value_str.split(';', 1)
-            if len(srid_parts) > 1:
-                value_str = srid_parts[1].strip()
-        
-        # Check for common WKT prefixes
-        wkt_prefixes = ['POINT', 'LINESTRING', 'POLYGON', 'MULTIPOINT', 'MULTILINESTRING', 'MULTIPOLYGON', 'GEOMETRYCOLLECTION']
-        
-        is_wkt = any(value_str.startswith(prefix) for prefix in wkt_prefixes)
-        
-        if is_wkt:
+
+        head = value_str[:32].lstrip().upper()
+        return head.startswith((
+            'POINT', 'LINESTRING', 'POLYGON', 'MULTIPOINT',
+            'MULTILINESTRING', 'MULTIPOLYGON', 'GEOMETRYCOLLECTION', 'SRID=',
+        ))
+    
+    def _bulk_wkt_to_wkb(self, clean_wkts):
+        """Convert a list of WKT strings to WKB in one vectorized pass.
+
+        Uses shapely 2.x from_wkt/to_wkb, whose C loops release the GIL, so
+        parsing large result sets does not serialize on the interpreter.
+        Unparseable or None entries come back as None. Returns None when
+        shapely is unavailable or too old - callers fall back to per-feature
+        QgsGeometry.fromWkt.
+        """
+        shapely_mod = _get_shapely()
+        if shapely_mod is None or not hasattr(shapely_mod, 'from_wkt'):
+            return None
+        try:
+            geoms = shapely_mod.from_wkt(clean_wkts, on_invalid='ignore')
+            return [bytes(wkb) if wkb is not None else None
+                    for wkb in shapely_mod.to_wkb(geoms)]
+        except Exception as e:
             QgsMessageLog.logMessage(
-                f"Detected WKT format: {value_str[:50]}...",
+                f"Bulk WKT conversion unavailable ({str(e)}), parsing per feature",
                 "Query Dialog",
-                Qgis.Info
+                Qgis.Warning
             )
-        
-        return is_wkt
-    
+            return None
+
     def _strip_srid_from_wkt(self, wkt_str):
         """Strip SRID prefix from WKT string (e.g., 'SRID=4326;POINT(...)' → 'POINT(...)')"""
         if not isinstance(wkt_str, str):
             return wkt_str
-        
-        wkt_str = wkt_str.strip()
-        
-        # Handle SRID prefixes (e.g., "SRID=4326;POINT(...)")
-        if wkt_str.upper().startswith('SRID='):
-            # Extract WKT part after the semicolon
-            srid_parts = wkt_str.split(';', 1)
-            if len(srid_parts) > 1:
-                return srid_parts[1].strip()
-        
-        return wkt_str
+        # Fast paths: in practice a result set either always or never carries
+        # the prefix, so the branch settles after the first row and no copy
+        # is made for prefix-free strings
+        if wkt_str[:5] == 'SRID=':
+            semi = wkt_str.find(';')
+            if semi >= 0:
+                return wkt_str[semi + 1:].lstrip()
+            return wkt_str
+        if 'SRID' not in wkt_str[:12].upper():
+            return wkt_str
+        # Cold path: leading whitespace or unusual casing
+        return _SRID_RE.sub('', wkt_str, count=1).strip()
     
     def _looks_like_geometry_column(self, column_name, sample_value):
         """Check if a column looks like it contains geometry data"""
         # Check column name
-        geom_names = ['geometry', 'geom', 'location', 'point', 'polygon', 'linestring', 'shape', 'spatial']
-        if any(name in column_name.lower() for name in geom_names):
+        if any(name in column_name.lower() for name in _GEOM_CANDIDATES):
             return True
         
         # Check if sample value looks like geometry (either WKT or Databricks format)
         if sample_value is None:
             return False
-        
-        value_str = str(sample_value).strip()
-        
-        # Check for WKT format
+
+        value_str = str(sample_value)
+
+        # Check for WKT format (probe is bounded to the string head)
         if self._is_wkt_format(value_str):
             return True
-        
-        # Check for Databricks binary geometry format (typically starts with specific bytes)
-        # This is a heuristic - Databricks geometry might be in binary format
-        if len(value_str) > 10 and any(c in value_str.lower() for c in ['point', 'line', 'polygon']):
-            return True
-        
-        return False
+
+        # Heuristic for other textual geometry representations - lower-case
+        # only a bounded head instead of copying the whole value
+        head = value_str[:64].lower()
+        return len(value_str) > 10 and any(t in head for t in ('point', 'line', 'polygon'))
     
     def _add_geometry_conversion(self, connection, query):
-        """Automatically add ST_ASWKT conversion for GEOMETRY/GEOGRAPHY columns"""
+        """Automatically add ST_ASWKT conversion for GEOMETRY/GEOGRAPHY columns.
+
+        Results are cached per (connection, query) so re-running the same
+        query skips both the SQL analysis and the information_schema
+        round-trip.
+        """
+        cache_key = (
+            self.connection_config.get('hostname', ''),
+            self.connection_config.get('http_path', ''),
+            query,
+        )
+        cached = _GEOM_CONV_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        converted = self._add_geometry_conversion_uncached(connection, query)
+        _GEOM_CONV_CACHE[cache_key] = converted
+        return converted
+
+    def _add_geometry_conversion_uncached(self, connection, query):
+        """Analyze *query* and wrap geometry columns in ST_ASWKT."""
         try:
             # Simple check: if query already contains ST_ASWKT or ST_ASTEXT, don't modify
             query_upper = query.upper()
@@ -2485,67 +3537,79 @@ class QueryLayerCreationThread(QThread):
             return query
     
     def _get_geometry_columns_for_tables(self, connection, table_names):
-        """Get geometry columns for the specified tables"""
+        """Get geometry columns for the specified tables.
+
+        All tables are resolved with a single information_schema query
+        (one OR-group per table) instead of one network round-trip each.
+        """
         geometry_columns = {}
-        
+
+        if not table_names:
+            return geometry_columns
+
         try:
+            # Parse the (possibly qualified) names and build one parameterized
+            # condition group per table
+            parsed_tables = []
+            conditions = []
+            params = {}
+            for idx, table_name in enumerate(table_names):
+                parts = table_name.split('.')
+                if len(parts) == 3:
+                    catalog, schema, table = parts
+                elif len(parts) == 2:
+                    catalog, schema, table = None, parts[0], parts[1]
+                else:
+                    catalog, schema, table = None, None, parts[0]
+
+                group = [f"table_name = :tbl{idx}"]
+                params[f"tbl{idx}"] = table
+                if schema:
+                    group.append(f"table_schema = :schema{idx}")
+                    params[f"schema{idx}"] = schema
+                if catalog:
+                    group.append(f"table_catalog = :catalog{idx}")
+                    params[f"catalog{idx}"] = catalog
+
+                conditions.append("(" + " AND ".join(group) + ")")
+                parsed_tables.append((table_name, table))
+
+            info_query = f"""
+                SELECT table_name, column_name, data_type
+                FROM system.information_schema.columns
+                WHERE ({' OR '.join(conditions)})
+                AND data_type IN ('GEOGRAPHY', 'GEOMETRY')
+            """
+
+            QgsMessageLog.logMessage(
+                f"Checking for geometry columns in {len(table_names)} table(s)",
+                "Query Dialog",
+                Qgis.Info
+            )
+
             with connection.cursor() as cursor:
-                for table_name in table_names:
-                    # Handle fully qualified names (catalog.schema.table)
-                    parts = table_name.split('.')
-                    if len(parts) == 3:
-                        catalog, schema, table = parts
-                    elif len(parts) == 2:
-                        catalog, schema, table = None, parts[0], parts[1]
-                    else:
-                        catalog, schema, table = None, None, parts[0]
-                    
-                    # Query information_schema for geometry columns
-                    # Using parameterized query to prevent SQL injection
-                    where_conditions = ["table_name = :tbl"]
-                    params = {"tbl": table}
-                    
-                    if schema:
-                        where_conditions.append("table_schema = :schema")
-                        params["schema"] = schema
-                    if catalog:
-                        where_conditions.append("table_catalog = :catalog")
-                        params["catalog"] = catalog
-                    
-                    where_clause = " AND ".join(where_conditions)
-                    
-                    info_query = f"""
-                        SELECT column_name, data_type
-                        FROM system.information_schema.columns 
-                        WHERE {where_clause}
-                        AND data_type IN ('GEOGRAPHY', 'GEOMETRY')
-                    """
-                    
-                    QgsMessageLog.logMessage(
-                        f"Checking for geometry columns in {table_name}",
-                        "Query Dialog",
-                        Qgis.Info
-                    )
-                    
-                    cursor.execute(info_query, params)
-                    results = cursor.fetchall()
-                    
-                    for row in results:
-                        column_name = row[0]
-                        data_type = row[1]
-                        
-                        # Store both simple column name and qualified names
-                        geometry_columns[column_name] = data_type
+                cursor.execute(info_query, params)
+                results = cursor.fetchall()
+
+            for row in results:
+                result_table = row[0]
+                column_name = row[1]
+                data_type = row[2]
+
+                # Store both simple column name and qualified names for
+                # every requested table this result belongs to
+                geometry_columns[column_name] = data_type
+                for table_name, table in parsed_tables:
+                    if table.lower() == result_table.lower():
                         geometry_columns[f"{table_name}.{column_name}"] = data_type
-                        if table:
-                            geometry_columns[f"{table}.{column_name}"] = data_type
-                        
-                        QgsMessageLog.logMessage(
-                            f"Found geometry column: {column_name} ({data_type}) in table {table_name}",
-                            "Query Dialog",
-                            Qgis.Info
-                        )
-        
+                        geometry_columns[f"{table}.{column_name}"] = data_type
+
+                QgsMessageLog.logMessage(
+                    f"Found geometry column: {column_name} ({data_type}) in table {result_table}",
+                    "Query Dialog",
+                    Qgis.Info
+                )
+
         except Exception as e:
             QgsMessageLog.logMessage(
                 f"Error getting geometry columns: {str(e)}",
@@ -2558,10 +3622,8 @@ class QueryLayerCreationThread(QThread):
     def _modify_select_clause(self, query, geometry_columns):
         """Modify the SELECT clause to add ST_ASWKT for geometry columns"""
         try:
-            import re
-            
             # Find the SELECT clause
-            select_match = re.search(r'SELECT\s+(.*?)\s+FROM', query, re.IGNORECASE | re.DOTALL)
+            select_match = _SELECT_FROM_RE.search(query)
             if not select_match:
                 return query
             
@@ -2578,24 +3640,27 @@ class QueryLayerCreationThread(QThread):
                 )
                 return query
             
-            # Split select items and process each one
+            # Split on top-level commas. Only the structural characters are
+            # scanned (by the C regex engine) instead of walking every
+            # character in Python; paren depth still handles nesting.
             select_items = []
-            current_item = ""
             paren_level = 0
-            
-            for char in select_clause:
+            item_start = 0
+            for struct in _SELECT_SPLIT_RE.finditer(select_clause):
+                char = struct.group()
                 if char == '(':
                     paren_level += 1
                 elif char == ')':
                     paren_level -= 1
-                elif char == ',' and paren_level == 0:
-                    select_items.append(current_item.strip())
-                    current_item = ""
-                    continue
-                current_item += char
-            
-            if current_item.strip():
-                select_items.append(current_item.strip())
+                elif paren_level == 0:  # top-level ','
+                    item = select_clause[item_start:struct.start()].strip()
+                    if item:
+                        select_items.append(item)
+                    item_start = struct.end()
+
+            tail = select_clause[item_start:].strip()
+            if tail:
+                select_items.append(tail)
             
             # Process each select item
             modified_items = []
@@ -2619,25 +3684,25 @@ class QueryLayerCreationThread(QThread):
     
     def _process_select_item(self, item, geometry_columns):
         """Process a single SELECT item to add ST_ASWKT if it's a geometry column"""
-        import re
-        
         item = item.strip()
-        
+
         # Check if this item is a geometry column (handle aliases)
         base_column = item
         alias = None
-        
+
         # Check for AS alias
-        as_match = re.search(r'^(.+?)\s+AS\s+(.+)$', item, re.IGNORECASE)
+        as_match = _AS_ALIAS_RE.match(item)
         if as_match:
             base_column = as_match.group(1).strip()
             alias = as_match.group(2).strip()
         else:
-            # Check for space alias (without AS)
-            space_match = re.search(r'^(.+?)\s+([^\s]+)$', item)
-            if space_match and not any(op in item.upper() for op in ['(', ')', '+', '-', '*', '/', 'CASE', 'WHEN']):
-                base_column = space_match.group(1).strip()
-                alias = space_match.group(2).strip()
+            # Check for space alias (without AS) - but not for expressions
+            space_match = _SPACE_ALIAS_RE.match(item)
+            if space_match and _EXPR_CHARS.isdisjoint(item):
+                upper_item = item.upper()
+                if 'CASE' not in upper_item and 'WHEN' not in upper_item:
+                    base_column = space_match.group(1).strip()
+                    alias = space_match.group(2).strip()
         
         # Remove quotes if present
         clean_column = base_column.strip('"').strip("'").strip('`')
@@ -2662,6 +3727,76 @@ class QueryLayerCreationThread(QThread):
         return item
 
 
+class ResultsModel(QAbstractTableModel):
+    """Read-only table model over query result rows.
+
+    The view only requests cells that are currently visible, so showing a
+    large result set no longer allocates a QTableWidgetItem per cell. Rows
+    are additionally revealed to the view in windows via canFetchMore /
+    fetchMore, so the scrollbar and layout never have to account for
+    millions of rows up front.
+    """
+
+    # Rows revealed to the view per fetchMore step
+    _FETCH_CHUNK = 1000
+
+    def __init__(self, columns, rows, parent=None):
+        super().__init__(parent)
+        self._columns = columns
+        self._rows = rows
+        self._loaded = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        to_fetch = min(self._FETCH_CHUNK, len(self._rows) - self._loaded)
+        if to_fetch <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + to_fetch - 1)
+        self._loaded += to_fetch
+        self.endInsertRows()
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            if orientation == Qt.Horizontal:
+                return self._columns[section]
+            return section + 1
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            value = self._rows[index.row()][index.column()]
+            if value is None:
+                return ""
+            text = str(value)
+            # Truncate very long values (like geometry WKT)
+            if len(text) > 200:
+                return text[:200] + "..."
+            return text
+        if role == Qt.ToolTipRole:
+            value = self._rows[index.row()][index.column()]
+            if value is None:
+                return ""
+            # Computed only for the hovered cell; bound the size - a
+            # multi-megabyte WKT tooltip is unreadable anyway
+            text = str(value)
+            if len(text) > 4096:
+                return text[:4096] + "..."
+            return text
+        return None
+
+
 class DatabricksQueryDialog(QDialog):
     """Dialog for executing custom SQL queries against Databricks"""
     
@@ -2671,7 +3806,15 @@ class DatabricksQueryDialog(QDialog):
         self.setWindowTitle("Databricks Custom Query")
         self.setModal(True)
         self.resize(1000, 700)
-        
+
+        # Worker threads can emit progress far faster than the GUI can
+        # repaint; latch only the latest message and flush on a timer so
+        # the event loop is not saturated with label updates
+        self._pending_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(50)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
         self.setup_ui()
         
         if initial_query:
@@ -2708,7 +3851,10 @@ class DatabricksQueryDialog(QDialog):
         # Refresh button
         refresh_layout = QHBoxLayout()
         self.refresh_db_btn = QPushButton("Refresh")
-        self.refresh_db_btn.clicked.connect(self.refresh_database_structure)
+        # Explicit refresh bypasses the on-disk snapshot
+        self.refresh_db_btn.clicked.connect(
+            lambda checked=False: self.refresh_database_structure(force=True)
+        )
         refresh_layout.addWidget(self.refresh_db_btn)
         refresh_layout.addStretch()
         db_layout.addLayout(refresh_layout)
@@ -2785,6 +3931,13 @@ class DatabricksQueryDialog(QDialog):
         self.geometry_column_edit.setPlaceholderText("Geometry column (auto-detect)")
         query_controls.addWidget(QLabel("Geometry column:"))
         query_controls.addWidget(self.geometry_column_edit)
+
+        # Off by default: GEOS validation scans every vertex per feature
+        self.validate_geometries_checkbox = QCheckBox("Validate geometries")
+        self.validate_geometries_checkbox.setToolTip(
+            "Run a full GEOS validity check on every geometry (slower)."
+        )
+        query_controls.addWidget(self.validate_geometries_checkbox)
         
         self.add_layer_btn = QPushButton("Add as Layer")
         self.add_layer_btn.clicked.connect(self.add_as_layer)
@@ -2799,10 +3952,12 @@ class DatabricksQueryDialog(QDialog):
         results_group = QGroupBox("Query Results")
         results_layout = QVBoxLayout(results_group)
         
-        # Results table
-        self.results_table = QTableWidget()
+        # Results table - a view over ResultsModel, so only visible cells
+        # are ever materialized
+        self.results_table = QTableView()
         self.results_table.setAlternatingRowColors(True)
         self.results_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.results_model = None
         results_layout.addWidget(self.results_table)
         
         # Results info
@@ -2833,6 +3988,7 @@ class DatabricksQueryDialog(QDialog):
         self.last_query = ""
         self.last_columns = []
         self.last_rows = []
+        self._executed_query = ""
         
         return container
     
@@ -2842,7 +3998,7 @@ class DatabricksQueryDialog(QDialog):
     
     def execute_query(self):
         """Execute the SQL query"""
-        if not DATABRICKS_AVAILABLE:
+        if not _databricks_available():
             QMessageBox.critical(self, "Missing Dependencies", 
                                "databricks-sql-connector is not installed.")
             return
@@ -2851,12 +4007,33 @@ class DatabricksQueryDialog(QDialog):
         if not query:
             QMessageBox.warning(self, "No Query", "Please enter a SQL query.")
             return
-        
+
+        # Offer to bound unlimited SELECTs before they hit the warehouse -
+        # fetching millions of rows into the dialog freezes QGIS for minutes
+        head = query.lstrip('(').lstrip()[:6].upper()
+        if head.startswith(('SELECT', 'WITH')):
+            if not _LIMIT_RE.search(query):
+                reply = QMessageBox.question(
+                    self, "No LIMIT Clause",
+                    f"This query has no LIMIT clause and may return a very "
+                    f"large result set.\n\nAppend LIMIT {_UNBOUNDED_QUERY_LIMIT}?",
+                    QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel,
+                    QMessageBox.Yes
+                )
+                if reply == QMessageBox.Cancel:
+                    return
+                if reply == QMessageBox.Yes:
+                    query = f"{query.rstrip(';')} LIMIT {_UNBOUNDED_QUERY_LIMIT}"
+
         # Show progress dialog
         self.progress_dialog = QProgressDialog("Executing query...", "Cancel", 0, 0, self)
         self.progress_dialog.setWindowModality(Qt.WindowModal)
         self.progress_dialog.show()
         
+        # Remember the text actually executed (it may carry the appended
+        # LIMIT) - layer creation must re-run this, not the editor contents
+        self._executed_query = query
+
         # Start query thread
         self.query_thread = QueryExecutionThread(self.connection_config, query)
         self.query_thread.progress.connect(self.on_query_progress)
@@ -2864,20 +4041,30 @@ class DatabricksQueryDialog(QDialog):
         self.query_thread.start()
     
     def on_query_progress(self, message):
-        """Update progress dialog"""
-        if hasattr(self, 'progress_dialog'):
-            self.progress_dialog.setLabelText(message)
-    
+        """Latch the latest progress message for the coalescing timer"""
+        self._pending_progress = message
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_progress(self):
+        """Apply the most recent progress message to the dialog, if any"""
+        if self._pending_progress is not None and hasattr(self, 'progress_dialog'):
+            self.progress_dialog.setLabelText(self._pending_progress)
+            self._pending_progress = None
+
     def on_query_finished(self, success, message, columns, rows):
         """Handle query execution results"""
+        self._progress_timer.stop()
+        self._pending_progress = None
         self.progress_dialog.close()
         
         if success:
             self.display_results(columns, rows)
             self.results_info.setText(f"Query executed successfully. {len(rows)} rows returned.")
             
-            # Store results for layer creation
-            self.last_query = self.query_edit.toPlainText().strip()
+            # Store results for layer creation - the executed text, not the
+            # editor's, which lacks any LIMIT accepted at the prompt
+            self.last_query = self._executed_query
             self.last_columns = columns
             self.last_rows = rows
             
@@ -2885,46 +4072,41 @@ class DatabricksQueryDialog(QDialog):
             self.add_layer_btn.setEnabled(len(rows) > 0)
             
         else:
-            self.results_table.clear()
-            self.results_table.setRowCount(0)
-            self.results_table.setColumnCount(0)
+            self.results_table.setModel(None)
+            self.results_model = None
             self.results_info.setText(f"Query failed: {message}")
             self.add_layer_btn.setEnabled(False)
             
             QMessageBox.critical(self, "Query Error", message)
     
     def display_results(self, columns, rows):
-        """Display query results in the table"""
+        """Display query results in the table view"""
         if not columns or not rows:
-            self.results_table.clear()
-            self.results_table.setRowCount(0)
-            self.results_table.setColumnCount(0)
+            self.results_table.setModel(None)
+            self.results_model = None
             return
-        
-        # Setup table
-        self.results_table.setColumnCount(len(columns))
-        self.results_table.setRowCount(len(rows))
-        self.results_table.setHorizontalHeaderLabels(columns)
-        
-        # Populate table
-        for i, row in enumerate(rows):
-            for j, value in enumerate(row):
-                # Convert value to string for display
-                display_value = str(value) if value is not None else ""
-                
-                # Truncate very long values (like geometry WKT)
-                if len(display_value) > 200:
-                    display_value = display_value[:200] + "..."
-                
-                item = QTableWidgetItem(display_value)
-                item.setToolTip(str(value) if value is not None else "")
-                self.results_table.setItem(i, j, item)
-        
-        # Auto-resize columns but limit maximum width
-        self.results_table.resizeColumnsToContents()
-        for i in range(len(columns)):
-            if self.results_table.columnWidth(i) > 300:
-                self.results_table.setColumnWidth(i, 300)
+
+        # One model swap instead of a per-cell population loop - the view
+        # asks the model only for the cells it actually paints
+        self.results_model = ResultsModel(columns, rows)
+        self.results_table.setModel(self.results_model)
+
+        # Sample-based column widths: measure the header plus the first few
+        # rows instead of letting Qt stringify every cell to find the widest.
+        # 60 characters is already beyond the 300px clamp.
+        fm = self.results_table.fontMetrics()
+        for j, col_name in enumerate(columns):
+            width = fm.horizontalAdvance(str(col_name))
+            for row in rows[:50]:
+                value = row[j]
+                if value is None:
+                    continue
+                advance = fm.horizontalAdvance(str(value)[:60])
+                if advance > width:
+                    width = advance
+                if width >= 300:
+                    break
+            self.results_table.setColumnWidth(j, min(300, width + 16))
     
     def add_as_layer(self):
         """Add query results as a QGIS layer"""
@@ -2949,24 +4131,31 @@ class DatabricksQueryDialog(QDialog):
         self.progress_dialog.setWindowModality(Qt.WindowModal)
         self.progress_dialog.show()
         
-        # Start layer creation thread
+        # Start layer creation thread, handing over the rows already shown in
+        # the results table so an unchanged query is not executed twice
         self.layer_thread = QueryLayerCreationThread(
-            self.connection_config, 
-            self.last_query, 
-            layer_name, 
-            geometry_column
+            self.connection_config,
+            self.last_query,
+            layer_name,
+            geometry_column,
+            strict_validity=self.validate_geometries_checkbox.isChecked(),
+            cached_columns=self.last_columns,
+            cached_rows=self.last_rows
         )
         self.layer_thread.progress.connect(self.on_layer_progress)
         self.layer_thread.finished.connect(self.on_layer_finished)
         self.layer_thread.start()
     
     def on_layer_progress(self, message):
-        """Update progress dialog"""
-        if hasattr(self, 'progress_dialog'):
-            self.progress_dialog.setLabelText(message)
-    
+        """Latch the latest progress message for the coalescing timer"""
+        self._pending_progress = message
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
     def on_layer_finished(self, success, message, layer):
         """Handle layer creation results"""
+        self._progress_timer.stop()
+        self._pending_progress = None
         self.progress_dialog.close()
         
         if success and layer:
@@ -2984,23 +4173,27 @@ class DatabricksQueryDialog(QDialog):
         else:
             QMessageBox.critical(self, "Layer Creation Failed", message)
     
-    def refresh_database_structure(self):
-        """Refresh the database structure tree"""
-        if not DATABRICKS_AVAILABLE:
-            QMessageBox.critical(self, "Missing Dependencies", 
+    def refresh_database_structure(self, force=False):
+        """Refresh the database structure tree.
+
+        ``force`` skips the on-disk snapshot and re-queries the warehouse;
+        the automatic load on dialog open leaves it False.
+        """
+        if not _databricks_available():
+            QMessageBox.critical(self, "Missing Dependencies",
                                "databricks-sql-connector is not installed.")
             return
-        
+
         # Clear existing tree
         self.db_tree.clear()
         self.database_structure = {}
-        
+
         # Show loading state
         self.db_loading_label.setText("Loading accessible database structure (faster than SHOW commands)...")
         self.refresh_db_btn.setEnabled(False)
-        
+
         # Start database structure loading thread
-        self.db_thread = DatabaseStructureThread(self.connection_config)
+        self.db_thread = DatabaseStructureThread(self.connection_config, force_refresh=force)
         self.db_thread.progress.connect(self.on_db_loading_progress)
         self.db_thread.finished.connect(self.on_db_structure_loaded)
         self.db_thread.start()
@@ -3024,78 +4217,78 @@ class DatabricksQueryDialog(QDialog):
         self.db_loading_label.setText(f"Loaded {len(structure)} catalogs, {total_tables} accessible tables. Double-click items to insert into query.")
     
     def populate_database_tree(self, structure):
-        """Populate the database tree widget"""
-        self.db_tree.clear()
-        
-        for catalog_name, schemas in structure.items():
-            catalog_item = QTreeWidgetItem(self.db_tree)
-            catalog_item.setText(0, f"📁 {catalog_name}")
-            catalog_item.setData(0, Qt.UserRole, {'type': 'catalog', 'name': catalog_name})
-            
-            for schema_name, tables in schemas.items():
-                schema_item = QTreeWidgetItem(catalog_item)
-                schema_item.setText(0, f"📂 {schema_name}")
-                schema_item.setData(0, Qt.UserRole, {'type': 'schema', 'catalog': catalog_name, 'name': schema_name})
-                
-                for table_name, table_info in tables.items():
-                    table_item = QTreeWidgetItem(schema_item)
-                    
-                    # Check if table has geometry columns
-                    has_geometry = any(col.get('is_geometry', False) for col in table_info.get('columns', []))
-                    table_icon = "🗺️" if has_geometry else "📋"
-                    
-                    table_item.setText(0, f"{table_icon} {table_name}")
-                    table_item.setData(0, Qt.UserRole, {
-                        'type': 'table', 
-                        'catalog': catalog_name,
-                        'schema': schema_name,
-                        'name': table_name,
-                        'full_name': table_info.get('full_name', f"{catalog_name}.{schema_name}.{table_name}"),
-                        'columns': table_info.get('columns', [])
-                    })
-                    
-                    # Add columns as children
-                    for col_info in table_info.get('columns', []):
-                        col_item = QTreeWidgetItem(table_item)
-                        
-                        col_icon = "🌍" if col_info.get('is_geometry', False) else "📝"
-                        col_type = col_info.get('type', 'unknown')
-                        
-                        col_item.setText(0, f"{col_icon} {col_info['name']} ({col_type})")
-                        col_item.setData(0, Qt.UserRole, {
-                            'type': 'column',
-                            'catalog': catalog_name,
-                            'schema': schema_name,
-                            'table': table_name,
-                            'name': col_info['name'],
-                            'data_type': col_type,
-                            'is_geometry': col_info.get('is_geometry', False)
-                        })
-        
-        # Expand first level (catalogs)
+        """Populate the database tree widget.
+
+        Items are built detached and attached with one addTopLevelItems
+        call while updates and signals are suspended, so Qt performs a
+        single layout pass instead of one per inserted item. Each item
+        carries just the text to insert on double-click, computed here
+        once instead of reassembled from a per-item dict on every click.
+        """
+        self.db_tree.setUpdatesEnabled(False)
+        self.db_tree.blockSignals(True)
+        try:
+            self.db_tree.clear()
+            top_items = []
+            # Hoisted for the inner loops - this runs once per tree node
+            # across every catalog/schema/table/column
+            tree_item = QTreeWidgetItem
+            user_role = Qt.UserRole
+
+            for catalog_name, schemas in structure.items():
+                catalog_item = tree_item()
+                catalog_item.setText(0, f"📁 {catalog_name}")
+                catalog_item.setData(0, user_role, catalog_name)
+                top_items.append(catalog_item)
+
+                for schema_name, tables in schemas.items():
+                    schema_item = tree_item(catalog_item)
+                    schema_item.setText(0, f"📂 {schema_name}")
+                    schema_item.setData(0, user_role, f"{catalog_name}.{schema_name}")
+
+                    for table_name, table_info in tables.items():
+                        table_item = tree_item(schema_item)
+
+                        # Geometry flag is precomputed at structure-load
+                        # time; older cached snapshots fall back to the scan
+                        has_geometry = table_info.get('has_geometry')
+                        if has_geometry is None:
+                            has_geometry = any(col.get('is_geometry', False) for col in table_info.get('columns', []))
+                        table_icon = "🗺️" if has_geometry else "📋"
+
+                        table_item.setText(0, f"{table_icon} {table_name}")
+                        table_item.setData(
+                            0, user_role,
+                            table_info.get('full_name', f"{catalog_name}.{schema_name}.{table_name}")
+                        )
+
+                        # Add columns as children
+                        for col_info in table_info.get('columns', []):
+                            col_item = tree_item(table_item)
+
+                            col_icon = "🌍" if col_info.get('is_geometry', False) else "📝"
+                            col_type = col_info.get('type', 'unknown')
+
+                            col_item.setText(0, f"{col_icon} {col_info['name']} ({col_type})")
+                            col_item.setData(0, user_role, col_info['name'])
+
+            self.db_tree.addTopLevelItems(top_items)
+        finally:
+            self.db_tree.blockSignals(False)
+            self.db_tree.setUpdatesEnabled(True)
+
+        # Expand first level (catalogs) - after updates are re-enabled so it
+        # costs one repaint
         self.db_tree.expandToDepth(0)
     
     def on_tree_item_double_clicked(self, item, column):
         """Handle double-click on tree item to insert into query"""
-        data = item.data(0, Qt.UserRole)
-        if not data:
-            return
-        
-        cursor = self.query_edit.textCursor()
-        
-        if data['type'] == 'catalog':
-            text_to_insert = data['name']
-        elif data['type'] == 'schema':
-            text_to_insert = f"{data['catalog']}.{data['name']}"
-        elif data['type'] == 'table':
-            text_to_insert = data['full_name']
-        elif data['type'] == 'column':
-            text_to_insert = data['name']
-        else:
+        text_to_insert = item.data(0, Qt.UserRole)
+        if not text_to_insert:
             return
-        
-        # Insert the text at cursor position
-        cursor.insertText(text_to_insert)
+
+        # Insert the precomputed text at cursor position
+        self.query_edit.textCursor().insertText(text_to_insert)
         
         # Focus back to query editor
         self.query_edit.setFocus()
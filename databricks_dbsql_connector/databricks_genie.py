@@ -72,16 +72,26 @@ def _is_wkt_format(value_str):
     return any(s.startswith(p) for p in prefixes)
 
 
+_SRID_PREFIX_RE = re.compile(r'^\s*SRID=\d+;\s*', re.IGNORECASE)
+
+
 def _strip_srid_from_wkt(wkt_str):
-    """Strip ``SRID=…;`` prefix from a WKT string."""
+    """Strip ``SRID=…;`` prefix from a WKT string.
+
+    Fast paths avoid upper-casing or splitting the whole string - for
+    large polygons that is several redundant full-size allocations.
+    """
     if not isinstance(wkt_str, str):
         return wkt_str
-    wkt_str = wkt_str.strip()
-    if wkt_str.upper().startswith('SRID='):
-        parts = wkt_str.split(';', 1)
-        if len(parts) > 1:
-            return parts[1].strip()
-    return wkt_str
+    if wkt_str[:5] == 'SRID=':
+        semi = wkt_str.find(';')
+        if semi >= 0:
+            return wkt_str[semi + 1:].lstrip()
+        return wkt_str
+    if 'SRID' not in wkt_str[:12].upper():
+        return wkt_str
+    # Cold path: leading whitespace or unusual casing
+    return _SRID_PREFIX_RE.sub('', wkt_str, count=1).strip()
 
 
 # Column names that commonly hold geometry data.
@@ -2,6 +2,9 @@
 Databricks Vector Data Provider implementation
 """
 import json
+import queue
+import threading
+import urllib.parse
 from typing import List, Dict, Any, Optional, Tuple, Set
 from qgis.PyQt.QtCore import QVariant
 from qgis.core import (
@@ -20,60 +23,142 @@ from qgis.core import (
     QgsDataProvider,
     QgsMessageLog,
     Qgis,
-    NULL
+    NULL,
+    QgsExpressionNodeBinaryOperator,
+    QgsExpressionNodeColumnRef,
+    QgsExpressionNodeLiteral,
+    QgsExpressionNodeUnaryOperator
 )
 import logging
-from shapely import wkt, wkb
-from shapely.geometry import Point, LineString, Polygon
 from databricks import sql
 
+# Rows fetched from the warehouse per round trip - memory stays O(batch)
+# while the network still moves data in bulk
+_FETCH_BATCH_SIZE = 10_000
+
+# Sibling connections per provider for concurrent feature streams - a
+# canvas refresh and an open attribute table otherwise serialize on one
+# connection's result stream
+_MAX_POOL_CONNECTIONS = 4
+
+# Integer columns with these names (or an _id suffix) are treated as a
+# stable feature-id source, so ids survive pan/zoom instead of being
+# positions in the current result set
+_KEY_COLUMN_NAMES = frozenset({'id', 'fid', 'rowid', 'row_id', 'objectid', 'gid'})
+
+# QgsExpression binary operators with a direct Databricks SQL spelling -
+# anything outside this table makes the expression non-pushable
+_SQL_BINARY_OPS = {
+    QgsExpressionNodeBinaryOperator.boOr: 'OR',
+    QgsExpressionNodeBinaryOperator.boAnd: 'AND',
+    QgsExpressionNodeBinaryOperator.boEQ: '=',
+    QgsExpressionNodeBinaryOperator.boNE: '<>',
+    QgsExpressionNodeBinaryOperator.boLE: '<=',
+    QgsExpressionNodeBinaryOperator.boGE: '>=',
+    QgsExpressionNodeBinaryOperator.boLT: '<',
+    QgsExpressionNodeBinaryOperator.boGT: '>',
+    QgsExpressionNodeBinaryOperator.boLike: 'LIKE',
+    QgsExpressionNodeBinaryOperator.boNotLike: 'NOT LIKE',
+}
+
+
+def _iter_row_batches(cursor):
+    """Yield batches of row tuples from *cursor*, preferring Arrow.
+
+    fetchmany_arrow returns a columnar pyarrow.Table per batch (Cloud
+    Fetch for large sets); converting each column to Python once per
+    batch and zipping is far cheaper than the driver boxing every row
+    into a tuple. Falls back to plain fetchmany on older connectors or
+    Arrow errors.
+    """
+    fetchmany_arrow = getattr(cursor, 'fetchmany_arrow', None)
+    while True:
+        if fetchmany_arrow is not None:
+            try:
+                batch = fetchmany_arrow(_FETCH_BATCH_SIZE)
+            except Exception as arrow_e:
+                QgsMessageLog.logMessage(
+                    f"Arrow fetch failed, falling back to row fetch: {str(arrow_e)}",
+                    "Databricks Provider",
+                    Qgis.Warning
+                )
+                fetchmany_arrow = None
+                continue
+            if batch.num_rows == 0:
+                break
+            yield list(zip(*[col.to_pylist() for col in batch.columns]))
+        else:
+            rows = cursor.fetchmany(_FETCH_BATCH_SIZE)
+            if not rows:
+                break
+            yield rows
+
 
 class DatabricksFeatureIterator(QgsAbstractFeatureIterator):
-    """Feature iterator for Databricks provider"""
-    
+    """Feature iterator for Databricks provider.
+
+    Streams features lazily from the provider's generator instead of
+    materializing the whole result set, so memory is bounded by one fetch
+    batch and the first feature arrives after one round trip rather than
+    after the full scan.
+    """
+
     def __init__(self, source, request: QgsFeatureRequest):
         super().__init__(request)
         self.source = source
-        self.features = []
-        self.index = 0
-        
-        # Execute query and fetch features
-        self._fetch_features()
-    
-    def _fetch_features(self):
-        """Fetch features from Databricks based on the request"""
+        self._generator = None
+        self._open()
+
+    def _open(self):
+        """Start (or restart) the streaming generator for this request"""
         try:
-            features = self.source.get_features(self.mRequest)
-            self.features = list(features)
+            self._generator = self.source.get_features(self.mRequest)
         except Exception as e:
             QgsMessageLog.logMessage(
                 f"Error fetching features: {str(e)}",
                 "Databricks Provider",
                 Qgis.Critical
             )
-            self.features = []
-    
+            self._generator = None
+
     def fetchFeature(self, f: QgsFeature) -> bool:
         """Fetch next feature"""
-        if self.index >= len(self.features):
+        if self._generator is None:
             return False
-        
-        feature = self.features[self.index]
+
+        try:
+            feature = next(self._generator)
+        except StopIteration:
+            self._generator = None
+            return False
+        except Exception as e:
+            QgsMessageLog.logMessage(
+                f"Error fetching features: {str(e)}",
+                "Databricks Provider",
+                Qgis.Critical
+            )
+            self._generator = None
+            return False
+
+        # Fields first without re-initializing attributes, so the attribute
+        # vector is assigned once rather than set and then cleared
+        f.setFields(feature.fields(), False)
         f.setId(feature.id())
         f.setAttributes(feature.attributes())
         f.setGeometry(feature.geometry())
-        f.setFields(feature.fields())
-        
-        self.index += 1
         return True
-    
+
     def rewind(self) -> bool:
-        """Rewind iterator to start"""
-        self.index = 0
+        """Rewind iterator to start by re-running the request"""
+        self.close()
+        self._open()
         return True
-    
+
     def close(self) -> bool:
-        """Close iterator"""
+        """Close iterator, releasing the underlying cursor"""
+        if self._generator is not None:
+            self._generator.close()
+            self._generator = None
         return True
 
 
@@ -115,6 +200,25 @@ class DatabricksProvider(QgsVectorDataProvider):
         self.extent_cache = QgsRectangle()
         self.geometry_column = None
         self.geometry_type = QgsWkbTypes.Unknown
+        # Feature-query SQL text keyed by request shape - the text stays
+        # byte-identical across pan/zoom (coordinates travel as bind
+        # parameters), so the warehouse can reuse its plan
+        self._query_cache = {}
+        # Escaped table reference is fixed for the provider's lifetime
+        self._table_ref = self._get_escaped_table_ref() if self.table_name else ''
+        # Index of an integer key column usable as a stable feature id;
+        # None falls back to result-set enumeration
+        self._fid_field_index = None
+        # Derived once from the schema at layer open: the escaped SELECT
+        # column list and one converter per field (None = pass-through)
+        self._select_cols = ''
+        self._converters = ()
+        self._needs_conversion = False
+        # Idle sibling connections for feature streams; self.connection
+        # stays dedicated to metadata queries
+        self._conn_pool = queue.LifoQueue()
+        self._conn_count = 0
+        self._conn_lock = threading.Lock()
         
         # Initialize connection
         if self.is_valid_config():
@@ -139,8 +243,6 @@ class DatabricksProvider(QgsVectorDataProvider):
             return
         
         try:
-            import urllib.parse
-            
             # Parse the URI properly
             parsed = urllib.parse.urlparse(uri)
             
@@ -201,6 +303,43 @@ class DatabricksProvider(QgsVectorDataProvider):
             )
             self.connection = None
     
+    def _acquire_connection(self):
+        """Take an idle pooled connection, creating one if under the cap.
+
+        Each concurrent feature stream needs its own connection - cursors
+        on one connection serialize on the session - so up to
+        _MAX_POOL_CONNECTIONS siblings are opened with the same
+        credentials and recycled LIFO (most recently used stays warm).
+        Blocks for a free one once the cap is reached.
+        """
+        try:
+            return self._conn_pool.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._conn_lock:
+            create = self._conn_count < _MAX_POOL_CONNECTIONS
+            if create:
+                self._conn_count += 1
+
+        if create:
+            try:
+                return sql.connect(
+                    server_hostname=self.hostname,
+                    http_path=self.http_path,
+                    access_token=self.access_token
+                )
+            except Exception:
+                with self._conn_lock:
+                    self._conn_count -= 1
+                raise
+
+        return self._conn_pool.get()
+
+    def _release_connection(self, connection):
+        """Return a pooled connection for reuse by the next stream"""
+        self._conn_pool.put(connection)
+
     def _escape_identifier(self, identifier):
         """Escape identifier with backticks for Databricks SQL.
         
@@ -208,8 +347,10 @@ class DatabricksProvider(QgsVectorDataProvider):
         """
         if not identifier:
             return identifier
-        # Remove existing backticks to avoid double-escaping
-        identifier = identifier.strip('`')
+        # Remove existing outer backticks to avoid double-escaping, then
+        # double any embedded ones - a stray backtick inside the name must
+        # not be able to terminate the quoting
+        identifier = identifier.strip('`').replace('`', '``')
         return f"`{identifier}`"
     
     def _get_escaped_table_ref(self):
@@ -221,6 +362,55 @@ class DatabricksProvider(QgsVectorDataProvider):
             table_parts.append(self._escape_identifier(self.schema_name))
         table_parts.append(self._escape_identifier(self.table_name))
         return '.'.join(table_parts)
+
+    def _expression_to_sql(self, node):
+        """Translate a simple QgsExpression node tree to a SQL predicate.
+
+        Handles column references, literals, NOT, and the common binary
+        comparisons/conjunctions. Returns None for anything it cannot
+        translate - the caller then skips the pushdown and the filter is
+        applied client-side as before, so pushdown only ever removes rows
+        that the expression would reject anyway.
+        """
+        if isinstance(node, QgsExpressionNodeColumnRef):
+            name = node.name()
+            if self.fields_cache.indexOf(name) < 0:
+                return None
+            return self._escape_identifier(name)
+
+        if isinstance(node, QgsExpressionNodeLiteral):
+            value = node.value()
+            if value is None or value == NULL:
+                return 'NULL'
+            if isinstance(value, bool):
+                return 'TRUE' if value else 'FALSE'
+            if isinstance(value, (int, float)):
+                return repr(value)
+            if isinstance(value, str):
+                # Databricks treats backslash as an escape inside string
+                # literals, so it must be doubled along with the quotes or
+                # the pushed predicate compares against a mangled string
+                escaped = value.replace("\\", "\\\\").replace("'", "''")
+                return f"'{escaped}'"
+            return None
+
+        if isinstance(node, QgsExpressionNodeUnaryOperator):
+            if node.op() != QgsExpressionNodeUnaryOperator.uoNot:
+                return None
+            operand = self._expression_to_sql(node.operand())
+            return None if operand is None else f"NOT ({operand})"
+
+        if isinstance(node, QgsExpressionNodeBinaryOperator):
+            sql_op = _SQL_BINARY_OPS.get(node.op())
+            if sql_op is None:
+                return None
+            left = self._expression_to_sql(node.opLeft())
+            right = self._expression_to_sql(node.opRight())
+            if left is None or right is None:
+                return None
+            return f"({left} {sql_op} {right})"
+
+        return None
     
     def _initialize_layer(self):
         """Initialize layer by querying table schema and detecting geometry"""
@@ -229,9 +419,9 @@ class DatabricksProvider(QgsVectorDataProvider):
             
         try:
             with self.connection.cursor() as cursor:
-                # Get table schema - construct full table reference with proper escaping
-                table_ref = self._get_escaped_table_ref()
-                
+                # Full table reference, escaped once at construction
+                table_ref = self._table_ref
+
                 cursor.execute(f"DESCRIBE {table_ref}")
                 schema_info = cursor.fetchall()
                 
@@ -241,65 +431,155 @@ class DatabricksProvider(QgsVectorDataProvider):
                 for row in schema_info:
                     col_name = row[0]
                     col_type = row[1].upper()
-                    
+
                     if col_type in ['GEOGRAPHY', 'GEOMETRY']:
                         if not self.geometry_column:
                             self.geometry_column = col_name
-                            self._detect_geometry_type(table_ref, col_name)
                     else:
                         # Add as attribute field
                         qgs_type = self._map_databricks_type_to_qgs(col_type)
                         field = QgsField(col_name, qgs_type)
+                        # Remember the first integer key-like column as the
+                        # stable feature-id source
+                        if (self._fid_field_index is None
+                                and col_type in ('INT', 'BIGINT')
+                                and (col_name.lower() in _KEY_COLUMN_NAMES
+                                     or col_name.lower().endswith('_id'))):
+                            self._fid_field_index = len(self.fields_cache)
                         self.fields_cache.append(field)
-                
-                # Get feature count
-                # Note: table_ref is escaped via _get_escaped_table_ref() using backticks
-                # Table identifiers cannot be parameterized in SQL
-                cursor.execute(f"SELECT COUNT(*) FROM {table_ref}")
-                result = cursor.fetchone()
-                self.feature_count_cache = result[0] if result else 0
-                
-                # Get spatial extent
+
+                # The schema is fixed for the provider's lifetime, so the
+                # escaped SELECT list and the per-field value converters
+                # are derived here once instead of per feature request
+                self._select_cols = ', '.join(
+                    self._escape_identifier(f.name()) for f in self.fields_cache
+                )
+                self._converters = tuple(
+                    self._converter_for(f.type()) for f in self.fields_cache
+                )
+                self._needs_conversion = any(c is not None for c in self._converters)
+
+                # Count, extent and geometry type come from one combined
+                # aggregate scan - each extra round trip to a warehouse is
+                # 50-200ms, and the three scans read the same data anyway.
+                # Note: table_ref is escaped via _get_escaped_table_ref()
+                # using backticks; table identifiers cannot be parameterized
                 if self.geometry_column:
-                    self._calculate_extent(table_ref)
-                    
+                    self._load_layer_statistics(table_ref)
+                else:
+                    cursor.execute(f"SELECT COUNT(*) FROM {table_ref}")
+                    result = cursor.fetchone()
+                    self.feature_count_cache = result[0] if result else 0
+
         except Exception as e:
             QgsMessageLog.logMessage(
                 f"Error initializing layer: {str(e)}",
                 "Databricks Provider",
                 Qgis.Critical
             )
-    
-    def _detect_geometry_type(self, table_ref: str, geom_col: str):
-        """Detect the geometry type of the layer"""
+
+    def _load_layer_statistics(self, table_ref: str):
+        """Fetch count, extent and geometry type in one aggregate scan.
+
+        The scalar aggregates all ignore NULL geometries, so no WHERE
+        clause is needed and COUNT(*) still covers every row. Falls back
+        to the separate probe queries if the combined form fails (e.g. a
+        missing ST_ function on older runtimes).
+        """
+        escaped_geom_col = self._escape_identifier(self.geometry_column)
         try:
-            escaped_geom_col = self._escape_identifier(geom_col)
             with self.connection.cursor() as cursor:
                 cursor.execute(f"""
-                    SELECT ST_GEOMETRYTYPE({escaped_geom_col}) as geom_type 
-                    FROM {table_ref} 
-                    WHERE {escaped_geom_col} IS NOT NULL 
-                    LIMIT 1
+                    SELECT
+                        COUNT(*),
+                        MIN(ST_XMIN({escaped_geom_col})),
+                        MIN(ST_YMIN({escaped_geom_col})),
+                        MAX(ST_XMAX({escaped_geom_col})),
+                        MAX(ST_YMAX({escaped_geom_col})),
+                        MAX(ST_GEOMETRYTYPE({escaped_geom_col}))
+                    FROM {table_ref}
                 """)
                 result = cursor.fetchone()
-                
+
+            if result:
+                self.feature_count_cache = result[0] or 0
+                if all(x is not None for x in result[1:5]):
+                    self.extent_cache = QgsRectangle(result[1], result[2], result[3], result[4])
+                if result[5]:
+                    self.geometry_type = self._wkb_type_from_name(result[5])
+        except Exception as e:
+            QgsMessageLog.logMessage(
+                f"Combined statistics query failed, probing separately: {str(e)}",
+                "Databricks Provider",
+                Qgis.Warning
+            )
+            try:
+                with self.connection.cursor() as cursor:
+                    cursor.execute(f"SELECT COUNT(*) FROM {table_ref}")
+                    result = cursor.fetchone()
+                    self.feature_count_cache = result[0] if result else 0
+            except Exception as count_e:
+                QgsMessageLog.logMessage(
+                    f"Error counting features: {str(count_e)}",
+                    "Databricks Provider",
+                    Qgis.Warning
+                )
+            self._detect_geometry_type(table_ref, self.geometry_column)
+            self._calculate_extent(table_ref)
+
+    def _wkb_type_from_name(self, geom_type_name: str) -> QgsWkbTypes.Type:
+        """Map an ST_GEOMETRYTYPE result to a QgsWkbTypes value"""
+        geom_type = geom_type_name.upper()
+        if 'MULTIPOINT' in geom_type:
+            return QgsWkbTypes.MultiPoint
+        elif 'MULTILINESTRING' in geom_type:
+            return QgsWkbTypes.MultiLineString
+        elif 'MULTIPOLYGON' in geom_type:
+            return QgsWkbTypes.MultiPolygon
+        elif 'POINT' in geom_type:
+            return QgsWkbTypes.Point
+        elif 'LINESTRING' in geom_type:
+            return QgsWkbTypes.LineString
+        elif 'POLYGON' in geom_type:
+            return QgsWkbTypes.Polygon
+        return QgsWkbTypes.Unknown
+
+    def _detect_geometry_type(self, table_ref: str, geom_col: str):
+        """Detect the geometry type of the layer.
+
+        Probes a small TABLESAMPLE first so the warehouse reads a bounded
+        slice rather than scanning for the first non-null row, which on a
+        large unindexed table can mean reading a whole file prefix for
+        one discarded row. Falls back to the unbounded probe when the
+        sample misses (all-NULL sample or no TABLESAMPLE support).
+        """
+        try:
+            escaped_geom_col = self._escape_identifier(geom_col)
+            with self.connection.cursor() as cursor:
+                result = None
+                try:
+                    cursor.execute(f"""
+                        SELECT ST_GEOMETRYTYPE({escaped_geom_col}) as geom_type
+                        FROM {table_ref} TABLESAMPLE (100 ROWS)
+                        WHERE {escaped_geom_col} IS NOT NULL
+                        LIMIT 1
+                    """)
+                    result = cursor.fetchone()
+                except Exception:
+                    result = None
+
+                if not (result and result[0]):
+                    cursor.execute(f"""
+                        SELECT ST_GEOMETRYTYPE({escaped_geom_col}) as geom_type
+                        FROM {table_ref}
+                        WHERE {escaped_geom_col} IS NOT NULL
+                        LIMIT 1
+                    """)
+                    result = cursor.fetchone()
+
                 if result and result[0]:
-                    geom_type = result[0].upper()
-                    if 'POINT' in geom_type:
-                        self.geometry_type = QgsWkbTypes.Point
-                    elif 'LINESTRING' in geom_type:
-                        self.geometry_type = QgsWkbTypes.LineString
-                    elif 'POLYGON' in geom_type:
-                        self.geometry_type = QgsWkbTypes.Polygon
-                    elif 'MULTIPOINT' in geom_type:
-                        self.geometry_type = QgsWkbTypes.MultiPoint
-                    elif 'MULTILINESTRING' in geom_type:
-                        self.geometry_type = QgsWkbTypes.MultiLineString
-                    elif 'MULTIPOLYGON' in geom_type:
-                        self.geometry_type = QgsWkbTypes.MultiPolygon
-                    else:
-                        self.geometry_type = QgsWkbTypes.Unknown
-                        
+                    self.geometry_type = self._wkb_type_from_name(result[0])
+
         except Exception as e:
             QgsMessageLog.logMessage(
                 f"Error detecting geometry type: {str(e)}",
@@ -313,12 +593,15 @@ class DatabricksProvider(QgsVectorDataProvider):
         try:
             escaped_geom_col = self._escape_identifier(self.geometry_column)
             with self.connection.cursor() as cursor:
+                # Scalar MIN/MAX over per-geometry envelopes - ST_UNION
+                # materialized the union of every geometry (O(N*V) work and
+                # huge intermediate state) just to read off its bounding box
                 cursor.execute(f"""
-                    SELECT 
-                        ST_XMIN(ST_ENVELOPE(ST_UNION({escaped_geom_col}))) as min_x,
-                        ST_YMIN(ST_ENVELOPE(ST_UNION({escaped_geom_col}))) as min_y,
-                        ST_XMAX(ST_ENVELOPE(ST_UNION({escaped_geom_col}))) as max_x,
-                        ST_YMAX(ST_ENVELOPE(ST_UNION({escaped_geom_col}))) as max_y
+                    SELECT
+                        MIN(ST_XMIN({escaped_geom_col})) as min_x,
+                        MIN(ST_YMIN({escaped_geom_col})) as min_y,
+                        MAX(ST_XMAX({escaped_geom_col})) as max_x,
+                        MAX(ST_YMAX({escaped_geom_col})) as max_y
                     FROM {table_ref}
                     WHERE {escaped_geom_col} IS NOT NULL
                 """)
@@ -334,6 +617,19 @@ class DatabricksProvider(QgsVectorDataProvider):
                 Qgis.Warning
             )
     
+    def _converter_for(self, qgs_type) -> Optional[Any]:
+        """Return a callable normalizing driver values for this field type.
+
+        None means values pass through unchanged. Only numeric types need
+        help: DECIMAL arrives as decimal.Decimal and some integer columns
+        surface as strings on older connectors.
+        """
+        if qgs_type == QVariant.Double:
+            return float
+        if qgs_type in (QVariant.Int, QVariant.LongLong):
+            return int
+        return None
+
     def _map_databricks_type_to_qgs(self, databricks_type: str) -> QVariant.Type:
         """Map Databricks data types to QVariant types"""
         type_mapping = {
@@ -399,86 +695,263 @@ class DatabricksProvider(QgsVectorDataProvider):
         """Implementation of feature retrieval"""
         if not self.connection or not self.geometry_column:
             return
-        
+
         try:
-            with self.connection.cursor() as cursor:
+            connection = self._acquire_connection()
+        except Exception as e:
+            QgsMessageLog.logMessage(
+                f"Error acquiring connection: {str(e)}",
+                "Databricks Provider",
+                Qgis.Critical
+            )
+            return
+
+        try:
+            with connection.cursor() as cursor:
                 # Build query based on request - use escaped table reference
-                table_ref = self._get_escaped_table_ref()
-                
+                table_ref = self._table_ref
+
                 # Escape geometry column name
                 escaped_geom_col = self._escape_identifier(self.geometry_column)
                 
-                # Select fields - escape all field names
-                field_names = [self._escape_identifier(field.name()) for field in self.fields_cache]
-                if self.geometry_column:
-                    field_names.append(f"ST_ASWKT({escaped_geom_col}) as geom_wkt")
-                
-                query = f"SELECT {', '.join(field_names)} FROM {table_ref}"
-                
+                # Select only the requested attribute columns when the
+                # request asks for a subset - attribute-table opens with a
+                # couple of visible columns then move a fraction of the bytes
+                attr_indices = None
+                if request.flags() & QgsFeatureRequest.SubsetOfAttributes:
+                    wanted = set(request.subsetOfAttributes())
+                    # The key column rides along even when not requested -
+                    # feature ids must stay stable across requests
+                    if self._fid_field_index is not None:
+                        wanted.add(self._fid_field_index)
+                    attr_indices = sorted(
+                        idx for idx in wanted
+                        if 0 <= idx < len(self.fields_cache)
+                    )
+
+                # Where the stable id sits in each fetched row, if anywhere
+                fid_pos = None
+                if self._fid_field_index is not None:
+                    if attr_indices is None:
+                        fid_pos = self._fid_field_index
+                    else:
+                        fid_pos = attr_indices.index(self._fid_field_index)
+
+                if attr_indices is None:
+                    # Full column list is precomputed at schema load
+                    select_cols = self._select_cols
+                    n_attr_cols = len(self.fields_cache)
+                else:
+                    select_cols = ', '.join(
+                        self._escape_identifier(self.fields_cache[idx].name())
+                        for idx in attr_indices
+                    )
+                    n_attr_cols = len(attr_indices)
+                # Geometry bytes usually dominate the row payload - when the
+                # request doesn't want geometries (attribute table views),
+                # skip both the server-side ST_ASBINARY and the client parse
+                want_geometry = not (request.flags() & QgsFeatureRequest.NoGeometry)
+                fetch_geometry = bool(self.geometry_column) and want_geometry
+                if fetch_geometry:
+                    # WKB is roughly half the bytes of WKT on the wire and
+                    # QgsGeometry.fromWkb skips the float text parse that
+                    # makes fromWkt the per-feature bottleneck
+                    geom_expr = f"ST_ASBINARY({escaped_geom_col}) as geom_wkb"
+                    select_cols = f"{select_cols}, {geom_expr}" if select_cols else geom_expr
+                elif not select_cols:
+                    # Empty attribute subset and no geometry wanted (e.g. a
+                    # pure count/selection pass) - keep the SQL valid with a
+                    # constant column; the loop below never reads it
+                    select_cols = '1'
+
+                # Values that vary per request travel as bind parameters, so
+                # the SQL text below is stable for a given request shape
+                params = {}
+
                 # Add WHERE clause for spatial filter
                 where_conditions = []
-                if request.filterRect() and not request.filterRect().isEmpty():
+                has_rect = bool(request.filterRect() and not request.filterRect().isEmpty())
+                if has_rect:
+                    # The viewport is semantically a bbox - ST_MAKEENVELOPE
+                    # builds it from four doubles, sparing the server a WKT
+                    # polygon parse on every refresh
                     rect = request.filterRect()
-                    spatial_filter = f"""
-                        ST_INTERSECTS({escaped_geom_col}, 
-                            ST_GEOMFROMTEXT('POLYGON(({rect.xMinimum()} {rect.yMinimum()}, {rect.xMaximum()} {rect.yMinimum()}, {rect.xMaximum()} {rect.yMaximum()}, {rect.xMinimum()} {rect.yMaximum()}, {rect.xMinimum()} {rect.yMinimum()}))', 4326))
-                    """
-                    where_conditions.append(spatial_filter)
-                
-                if where_conditions:
-                    query += " WHERE " + " AND ".join(where_conditions)
-                
-                # Add LIMIT
+                    where_conditions.append(
+                        f"ST_INTERSECTS({escaped_geom_col}, "
+                        f"ST_MAKEENVELOPE(:xmin, :ymin, :xmax, :ymax, 4326))"
+                    )
+                    params['xmin'] = rect.xMinimum()
+                    params['ymin'] = rect.yMinimum()
+                    params['xmax'] = rect.xMaximum()
+                    params['ymax'] = rect.yMaximum()
+
+                # Push translatable attribute filters into the WHERE clause;
+                # untranslatable expressions fall back to client-side
+                # filtering upstream, unchanged
+                expr_sql = None
+                if request.filterType() == QgsFeatureRequest.FilterExpression:
+                    filter_expr = request.filterExpression()
+                    if filter_expr is not None and filter_expr.rootNode() is not None:
+                        expr_sql = self._expression_to_sql(filter_expr.rootNode())
+                        if expr_sql is not None:
+                            where_conditions.append(expr_sql)
+
+                filter_fids = None
+                if request.filterType() == QgsFeatureRequest.FilterFid:
+                    filter_fids = {request.filterFid()}
+                elif request.filterType() == QgsFeatureRequest.FilterFids:
+                    filter_fids = set(request.filterFids())
+
+                n_pushed_fids = 0
+                if filter_fids and fid_pos is not None and len(filter_fids) <= 1000:
+                    # Stable ids come from a real column, so fid filters can
+                    # be pushed as an IN list (bound, to keep the text sane)
+                    n_pushed_fids = len(filter_fids)
+                    fid_col = self._escape_identifier(
+                        self.fields_cache[self._fid_field_index].name()
+                    )
+                    placeholders = []
+                    for n, fid_value in enumerate(sorted(filter_fids)):
+                        placeholders.append(f":fid{n}")
+                        params[f"fid{n}"] = fid_value
+                    where_conditions.append(f"{fid_col} IN ({', '.join(placeholders)})")
+
                 if request.limit() > 0:
-                    query += f" LIMIT {request.limit()}"
-                
-                cursor.execute(query)
-                rows = cursor.fetchall()
+                    params['limit'] = request.limit()
+                elif filter_fids and fid_pos is None:
+                    # Enumeration ids are positions in this result set, so
+                    # the filter stays client-side but the scan can stop at
+                    # the highest requested fid
+                    params['limit'] = max(filter_fids) + 1
+
+                # Assemble (or reuse) the SQL text for this request shape
+                cache_key = (
+                    tuple(attr_indices) if attr_indices is not None else None,
+                    want_geometry,
+                    has_rect,
+                    expr_sql,
+                    'limit' in params,
+                    n_pushed_fids,
+                )
+                query = self._query_cache.get(cache_key)
+                if query is None:
+                    query = f"SELECT {select_cols} FROM {table_ref}"
+                    if where_conditions:
+                        query += " WHERE " + " AND ".join(where_conditions)
+                    if 'limit' in params:
+                        query += " LIMIT :limit"
+                    self._query_cache[cache_key] = query
                 
-                # Convert to QgsFeature objects
-                for i, row in enumerate(rows):
-                    feature = QgsFeature(self.fields_cache)
-                    feature.setId(i)
-                    
-                    # Set attributes (excluding geometry column)
-                    attrs = []
-                    geom_wkt = None
-                    
-                    for j, value in enumerate(row):
-                        if j < len(self.fields_cache):
-                            attrs.append(value)
+                # Stream in batches: the cursor stays open for the life of
+                # this generator (closing the iterator closes it via the
+                # with-block), and only one batch is resident at a time
+                cursor.arraysize = _FETCH_BATCH_SIZE
+                cursor.execute(query, params or None)
+
+                # Shared across every feature - setFields stores a reference
+                # to the implicitly-shared container, so no per-row copy or
+                # attribute-vector initialization is paid on the full path.
+                # The class lookups are hoisted too: global and attribute
+                # probes otherwise repeat once per row
+                fields = self.fields_cache
+                make_feature = QgsFeature
+                make_geometry = QgsGeometry
+                use_subset = attr_indices is not None
+
+                # Per-column value converters, aligned with the fetched
+                # columns; None when every column passes through unchanged
+                converters = self._converters if self._needs_conversion else None
+                if converters is not None and use_subset:
+                    converters = tuple(converters[idx] for idx in attr_indices)
+                    if all(c is None for c in converters):
+                        converters = None
+
+                # The LIMIT is already in the SQL, but enforcing it here too
+                # stops consumption mid-batch and releases the cursor as
+                # soon as the N requested features are out
+                limit = request.limit()
+                yielded = 0
+
+                i = 0
+                for rows in _iter_row_batches(cursor):
+                    # Convert to QgsFeature objects
+                    for row in rows:
+                        if fid_pos is not None:
+                            # NULL keys fall back to the row position so the
+                            # feature still gets a usable (if unstable) id
+                            key = row[fid_pos]
+                            fid = int(key) if key is not None else i
                         else:
-                            # This should be the geometry column (WKT)
-                            geom_wkt = value
-                    
-                    feature.setAttributes(attrs)
-                    
-                    # Set geometry
-                    if geom_wkt:
-                        try:
-                            shapely_geom = wkt.loads(geom_wkt)
-                            qgs_geom = self._shapely_to_qgs_geometry(shapely_geom)
-                            feature.setGeometry(qgs_geom)
-                        except Exception as e:
-                            QgsMessageLog.logMessage(
-                                f"Error converting geometry: {str(e)}",
-                                "Databricks Provider",
-                                Qgis.Warning
-                            )
-                    
-                    yield feature
-                    
+                            fid = i
+                        i += 1
+                        if filter_fids is not None and fid not in filter_fids:
+                            continue
+
+                        # Set attributes (excluding the geometry column,
+                        # which always trails the attribute columns)
+                        geom_wkb = row[n_attr_cols] if fetch_geometry else None
+                        if use_subset:
+                            # Subset path assigns by index, which needs the
+                            # attribute vector initialized
+                            feature = make_feature(fields)
+                            if converters is None:
+                                for idx, value in zip(attr_indices, row):
+                                    feature.setAttribute(idx, value)
+                            else:
+                                for idx, value, conv in zip(attr_indices, row, converters):
+                                    if conv is not None and value is not None:
+                                        value = conv(value)
+                                    feature.setAttribute(idx, value)
+                        else:
+                            feature = make_feature()
+                            feature.setFields(fields, False)
+                            if converters is None:
+                                attrs = list(row[:n_attr_cols])
+                            else:
+                                attrs = [
+                                    v if conv is None or v is None else conv(v)
+                                    for conv, v in zip(converters, row)
+                                ]
+                            feature.setAttributes(attrs)
+                        feature.setId(fid)
+
+                        # Set geometry - decode WKB straight into QgsGeometry,
+                        # no text parse and no shapely round-trip
+                        if geom_wkb:
+                            try:
+                                # Some driver versions return hex text for BINARY
+                                if isinstance(geom_wkb, str):
+                                    geom_wkb = bytes.fromhex(geom_wkb)
+                                qgs_geom = make_geometry()
+                                qgs_geom.fromWkb(geom_wkb)
+                                feature.setGeometry(qgs_geom)
+                            except Exception as e:
+                                QgsMessageLog.logMessage(
+                                    f"Error converting geometry: {str(e)}",
+                                    "Databricks Provider",
+                                    Qgis.Warning
+                                )
+
+                        yield feature
+
+                        yielded += 1
+                        if limit > 0 and yielded >= limit:
+                            return
+
+                        if filter_fids is not None:
+                            filter_fids.discard(fid)
+                            if not filter_fids:
+                                return
+
         except Exception as e:
             QgsMessageLog.logMessage(
                 f"Error executing query: {str(e)}",
                 "Databricks Provider",
                 Qgis.Critical
             )
-    
-    def _shapely_to_qgs_geometry(self, shapely_geom):
-        """Convert Shapely geometry to QgsGeometry"""
-        wkt_str = shapely_geom.wkt
-        return QgsGeometry.fromWkt(wkt_str)
+        finally:
+            # Runs when the stream is drained or the iterator is closed
+            self._release_connection(connection)
 
 
 class DatabricksProviderMetadata(QgsProviderMetadata):